@@ -0,0 +1,398 @@
+"""Traceability audit over ``rubric/requirements.yml``.
+
+Builds one index of REQ -> rubric -> design -> TC -> artifacts and checks
+every link against the repository:
+
+- ``R-X.Y`` and ``DD-X.Y`` resolve to numbered headings of the rubric and the
+  design decisions (falling back to the parent section ``X`` with a warning)
+- ``TC-...`` resolves to a test case heading in ``docs/test-cases.md``
+- ``file::name`` resolves through an AST index of the Python file
+- ``doc#anchor`` resolves through a heading index of the Markdown file
+- plain paths must exist (globs of generated outputs only warn while nothing matches)
+
+Orphans are reported too: documented test cases and ``TC-`` tests that no
+requirement references, and requirements without tests or artifacts.
+
+Each file's index is cached by content hash in ``.audit-cache.json``, so a
+re-run only re-parses what changed.
+
+Usage:
+    python -m movie_db_qa.audit [--strict] [--no-cache]
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import re
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Documents the requirement tags point into
+RUBRIC_DOC = "rubric/eval-rubric.md"
+DESIGN_DOC = "docs/design-decisions.md"
+TEST_CASES_DOC = "docs/test-cases.md"
+
+# Test case ids such as TC-FLT-CAT-001 or TC-NEG-002
+TC_ID = re.compile(r"\bTC-[A-Z]+(?:-[A-Z]+)*-\d{3}\b")
+
+# Markdown ATX heading (fenced code blocks are skipped separately)
+HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# Leading section number of a heading ("9.2 Manual ..." -> "9.2", "4. Code" -> "4")
+SECTION_NUMBER = re.compile(r"^(\d+(?:\.\d+)*)\.?\s")
+
+# Version of the index format; bump to invalidate existing caches
+CACHE_VERSION = 1
+
+
+def github_slug(text: str) -> str:
+    """Build the GitHub anchor of a heading.
+
+    Args:
+        text: Heading text
+
+    Returns:
+        Lowercase anchor with punctuation removed and spaces as hyphens
+    """
+    slug = re.sub(r"[^\w\- ]", "", text.strip().lower())
+    return slug.replace(" ", "-")
+
+
+def index_markdown(text: str) -> dict[str, Any]:
+    """Index the headings of a Markdown document.
+
+    Args:
+        text: Document source
+
+    Returns:
+        {"anchors": lookup keys, "sections": section numbers, "test_cases": TC ids in headings}
+    """
+    anchors: set[str] = set()
+    sections: set[str] = set()
+    test_cases: list[str] = []
+    in_fence = False
+    for line in text.splitlines():
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        match = None if in_fence else HEADING.match(line)
+        if match is None:
+            continue
+        heading = match.group(2)
+        # Headings are linked by full text (with or without a leading emoji),
+        # by the part before ":" (ids) or by slug
+        plain = re.sub(r"^\W+", "", heading)
+        anchors.update({heading.lower(), plain.lower(), plain.split(":", 1)[0].strip().lower(), github_slug(heading)})
+        number = SECTION_NUMBER.match(heading)
+        if number:
+            sections.add(number.group(1))
+        test_cases.extend(TC_ID.findall(heading.split(":", 1)[0]))
+    return {"anchors": sorted(anchors), "sections": sorted(sections), "test_cases": test_cases}
+
+
+def index_python(source: str) -> dict[str, Any]:
+    """Index the functions and classes of a Python module.
+
+    Args:
+        source: Module source
+
+    Returns:
+        {"symbols": names (bare and ``Class::method``), "test_cases": test name -> TC ids in its docstring}
+    """
+    tree = ast.parse(source)
+    symbols: set[str] = set()
+    test_cases: dict[str, list[str]] = {}
+
+    def visit(nodes: list[ast.stmt], owner: str | None) -> None:
+        for node in nodes:
+            if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+                continue
+            symbols.add(node.name)
+            if owner is not None:
+                symbols.add(f"{owner}::{node.name}")
+            if isinstance(node, ast.ClassDef):
+                visit(node.body, node.name)
+            elif node.name.startswith("test_"):
+                docstring = ast.get_docstring(node) or ""
+                ids = TC_ID.findall(docstring.split("\n", 1)[0])
+                if ids:
+                    test_cases[node.name] = ids
+
+    visit(tree.body, None)
+    return {"symbols": sorted(symbols), "test_cases": test_cases}
+
+
+class IndexCache:
+    """Per-file indexes keyed by path, reused while the content hash matches."""
+
+    def __init__(self, path: Path | None) -> None:
+        """Load the cache file.
+
+        Args:
+            path: Cache file (None disables caching)
+        """
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("files", {})
+        self._dirty = False
+
+    def get(self, key: str, content: bytes, build: Callable[[str], Any]) -> Any:
+        """Return the cached index of a file, rebuilding it if the content changed.
+
+        Args:
+            key: Cache key (relative path plus index kind)
+            content: Current file content
+            build: Builds the index from the decoded content
+
+        Returns:
+            File index
+        """
+        digest = hashlib.sha1(content).hexdigest()
+        entry = self.entries.get(key)
+        if entry is not None and entry["hash"] == digest:
+            self.hits += 1
+            return entry["index"]
+        self.misses += 1
+        index = build(content.decode("utf-8"))
+        self.entries[key] = {"hash": digest, "index": index}
+        self._dirty = True
+        return index
+
+    def save(self) -> None:
+        """Write the cache back if any entry changed."""
+        if self.path is None or not self._dirty:
+            return
+        payload = {"version": CACHE_VERSION, "files": self.entries}
+        self.path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+@dataclass
+class Finding:
+    """One audit result.
+
+    Attributes:
+        severity: "error" (dangling link) or "warning" (orphan, weak link)
+        subject: Requirement id, test case id or file the finding is about
+        message: Human readable description
+    """
+
+    severity: str
+    subject: str
+    message: str
+
+    def describe(self) -> str:
+        """Format the finding as one report line.
+
+        Returns:
+            Report line
+        """
+        marker = "❌" if self.severity == "error" else "⚠️ "
+        return f"{marker} {self.subject}: {self.message}"
+
+
+@dataclass
+class AuditReport:
+    """Outcome of an audit run.
+
+    Attributes:
+        requirements: Number of requirements checked
+        links: Number of links resolved
+        findings: Dangling links, weak links and orphans
+        elapsed_ms: Wall time of the run
+        cache_hits: File indexes reused from the cache
+        cache_misses: File indexes rebuilt
+    """
+
+    requirements: int = 0
+    links: int = 0
+    findings: list[Finding] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def errors(self) -> list[Finding]:
+        """Findings that fail the audit."""
+        return [finding for finding in self.findings if finding.severity == "error"]
+
+    @property
+    def warnings(self) -> list[Finding]:
+        """Findings reported without failing the audit."""
+        return [finding for finding in self.findings if finding.severity == "warning"]
+
+
+class TraceabilityAudit:
+    """Resolve every requirement link against indexes of the repository."""
+
+    def __init__(self, root: Path, requirements: str = "rubric/requirements.yml", cache: Path | None = None) -> None:
+        """Initialize audit.
+
+        Args:
+            root: Repository root
+            requirements: Requirements file relative to the root
+            cache: Index cache file (None disables caching)
+        """
+        self.root = root
+        self.requirements_path = root / requirements
+        self.cache = IndexCache(cache)
+        self.report = AuditReport()
+        # Indexes already loaded in this run (each file is read and hashed once)
+        self._indexes: dict[str, dict[str, Any] | None] = {}
+
+    def _index(self, relative: str, kind: str) -> dict[str, Any] | None:
+        key = f"{kind}:{relative}"
+        if key not in self._indexes:
+            path = self.root / relative
+            build = index_python if kind == "python" else index_markdown
+            self._indexes[key] = self.cache.get(key, path.read_bytes(), build) if path.is_file() else None
+        return self._indexes[key]
+
+    def _requirements(self) -> dict[str, dict[str, Any]]:
+        # YAML is the slowest parser involved, so its result is cached as well
+        def parse(text: str) -> Any:
+            return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+        parsed = self.cache.get("yaml:requirements", self.requirements_path.read_bytes(), parse)
+        return parsed or {}
+
+    def _error(self, subject: str, message: str) -> None:
+        self.report.findings.append(Finding("error", subject, message))
+
+    def _warning(self, subject: str, message: str) -> None:
+        self.report.findings.append(Finding("warning", subject, message))
+
+    def _check_section(self, req_id: str, tag: str, prefix: str, doc: str) -> None:
+        index = self._index(doc, "markdown")
+        number = tag.removeprefix(prefix)
+        if index is None:
+            self._error(req_id, f"{tag}: {doc} does not exist")
+        elif number in index["sections"]:
+            return
+        elif number.split(".", 1)[0] in index["sections"]:
+            self._warning(req_id, f"{tag}: no section {number} in {doc}, resolved to section {number.split('.')[0]}")
+        else:
+            self._error(req_id, f"{tag}: no section {number} in {doc}")
+
+    def _check_artifact(self, req_id: str, reference: str) -> None:
+        if "::" in reference:
+            relative, symbol = reference.split("::", 1)
+            index = self._index(relative, "python")
+            if index is None:
+                self._error(req_id, f"{reference}: {relative} does not exist")
+            elif symbol not in index["symbols"]:
+                self._error(req_id, f"{reference}: no function or class '{symbol}' in {relative}")
+        elif "#" in reference:
+            relative, anchor = reference.split("#", 1)
+            index = self._index(relative, "markdown")
+            if index is None:
+                self._error(req_id, f"{reference}: {relative} does not exist")
+            elif anchor.lower() not in index["anchors"] and github_slug(anchor) not in index["anchors"]:
+                self._error(req_id, f"{reference}: no heading '{anchor}' in {relative}")
+        elif any(char in reference for char in "*?["):
+            # Globs describe generated outputs, which a fresh checkout may not have yet
+            if next(self.root.glob(reference), None) is None:
+                self._warning(req_id, f"{reference}: no generated files match yet")
+        elif not (self.root / reference).exists():
+            self._error(req_id, f"{reference}: does not exist")
+
+    def run(self) -> AuditReport:
+        """Run the audit.
+
+        Returns:
+            Audit report
+        """
+        started = time.perf_counter()
+        self.report = AuditReport()
+        self._indexes.clear()
+        requirements = self._requirements()
+        test_case_index = self._index(TEST_CASES_DOC, "markdown")
+        documented_tcs = set(test_case_index["test_cases"]) if test_case_index else set()
+        referenced_tcs: set[str] = set()
+        referenced_tests: set[tuple[str, str]] = set()
+
+        for req_id, requirement in requirements.items():
+            self.report.requirements += 1
+            tags = [
+                *[(tag, "R-", RUBRIC_DOC) for tag in requirement.get("rubric") or []],
+                *[(tag, "DD-", DESIGN_DOC) for tag in requirement.get("design") or []],
+            ]
+            for tag, prefix, doc in tags:
+                self.report.links += 1
+                self._check_section(req_id, tag, prefix, doc)
+            for tc_id in requirement.get("tests") or []:
+                self.report.links += 1
+                referenced_tcs.add(tc_id)
+                if tc_id not in documented_tcs:
+                    self._error(req_id, f"{tc_id}: no test case heading in {TEST_CASES_DOC}")
+            artifacts = requirement.get("artifacts") or []
+            for reference in artifacts:
+                self.report.links += 1
+                self._check_artifact(req_id, reference)
+                if "::" in reference:
+                    relative, symbol = reference.split("::", 1)
+                    referenced_tests.add((relative, symbol.rsplit("::", 1)[-1]))
+            if not requirement.get("tests") and not artifacts:
+                self._warning(req_id, "orphan requirement: no tests and no artifacts")
+
+        for tc_id in sorted(documented_tcs - referenced_tcs):
+            self._warning(tc_id, f"orphan test case: documented in {TEST_CASES_DOC} but no requirement references it")
+        for relative in sorted({relative for relative, _ in referenced_tests}):
+            index = self._index(relative, "python")
+            for test_name, tc_ids in (index or {}).get("test_cases", {}).items():
+                if (relative, test_name) not in referenced_tests and not set(tc_ids) & referenced_tcs:
+                    self._warning(f"{relative}::{test_name}", f"orphan test: {', '.join(tc_ids)} not traced")
+
+        self.cache.save()
+        self.report.cache_hits, self.report.cache_misses = self.cache.hits, self.cache.misses
+        self.report.elapsed_ms = (time.perf_counter() - started) * 1000
+        return self.report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point.
+
+    Returns:
+        Exit status (1 on dangling links, or on any finding with --strict)
+    """
+    parser = argparse.ArgumentParser(description="Validate requirement traceability links")
+    parser.add_argument("--root", default=".", help="Repository root")
+    parser.add_argument("--requirements", default="rubric/requirements.yml", help="Requirements file")
+    parser.add_argument("--cache", default=".audit-cache.json", help="Index cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild every index")
+    parser.add_argument("--strict", action="store_true", help="Fail on warnings (orphans, weak links) too")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    cache = None if args.no_cache else root / args.cache
+    report = TraceabilityAudit(root, args.requirements, cache).run()
+
+    print("🔍 Checking requirement traceability...")
+    for finding in report.findings:
+        print(finding.describe())
+    print(
+        f"{report.requirements} requirements, {report.links} links, {len(report.errors)} errors, "
+        f"{len(report.warnings)} warnings in {report.elapsed_ms:.0f} ms "
+        f"(index cache: {report.cache_hits} hits, {report.cache_misses} misses)"
+    )
+    failed = bool(report.errors) or (args.strict and bool(report.warnings))
+    print("❌ Traceability audit FAILED" if failed else "✅ Traceability audit PASSED")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+"""Pagination crawler that discovers category boundaries.
+
+The last valid page of a category moves daily, so it is searched for rather
+than hard-coded: exponential (galloping) probes find a page that breaks, then
+a binary search narrows the gap. That costs O(log n) page loads per category
+instead of a linear walk. Pages are opened through the SPA router, so every
+probe reuses one loaded tab and avoids the direct-URL failure (DEF-001).
+
+A full crawl of every page fans out over a bounded number of async tabs;
+``--check`` also compares every rendered grid with the TMDB payload that
+served it (``movie_db_qa.utils.consistency``). The configured resource policy applies to the crawl contexts; ``--lean``
+stubs posters and blocks media and fonts, none of which a probe looks at.
+
+Usage:
+    python -m movie_db_qa.crawler                 # boundaries of all categories
+    python -m movie_db_qa.crawler popular --full  # crawl every page of popular
+    python -m movie_db_qa.crawler --lean --full   # skip poster/font downloads
+    python -m movie_db_qa.crawler --full --check  # also check grids against the API
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from movie_db_qa.pages.async_discover_page import AsyncDiscoverPage
+from movie_db_qa.pages.discover_page import CATEGORIES, DiscoverPage
+from movie_db_qa.pages.waits import ApiResponse
+from movie_db_qa.utils.config import config
+from movie_db_qa.utils.consistency import ConsistencyReport, check_consistency
+from movie_db_qa.utils.logger import setup_logger
+from movie_db_qa.utils.resource_policy import (
+    ResourcePolicy,
+    ResourceStats,
+    install_resource_policy,
+    install_resource_policy_async,
+)
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the galloping search (TMDB serves at most 500 pages)
+DEFAULT_PAGE_LIMIT = 1000
+
+# Resource policy of ``--lean`` crawls
+LEAN_POLICY = ResourcePolicy(block=frozenset({"media", "font"}), stub=frozenset({"image"}))
+
+
+@dataclass(frozen=True)
+class PageProbe:
+    """Outcome of opening one category page.
+
+    Attributes:
+        category: Category slug
+        page: Page number
+        status: TMDB response status (None if no response arrived)
+        results: Number of movie cards rendered
+        error_visible: True if the app showed its error screen
+        consistency: Grid vs API payload comparison (None if not checked)
+    """
+
+    category: str
+    page: int
+    status: int | None
+    results: int
+    error_visible: bool
+    consistency: ConsistencyReport | None = field(default=None, compare=False)
+
+    @property
+    def valid(self) -> bool:
+        """True if the page loaded and rendered results."""
+        return self.status == 200 and self.results > 0 and not self.error_visible
+
+
+@dataclass
+class Boundary:
+    """Result of a boundary search.
+
+    Attributes:
+        last_valid: Highest valid page (0 if even the first page is broken)
+        first_invalid: Lowest broken page (None if no broken page within the limit)
+        probes: Pages probed, in probe order
+    """
+
+    last_valid: int
+    first_invalid: int | None
+    probes: list[int] = field(default_factory=list)
+
+
+def find_boundary(
+    is_valid: Callable[[int], bool],
+    start: int = 1,
+    limit: int = DEFAULT_PAGE_LIMIT,
+) -> Boundary:
+    """Find the last valid page with galloping plus binary search.
+
+    Assumes validity is monotonic: every page up to the boundary is valid and
+    every page after it is broken.
+
+    Args:
+        is_valid: Probe returning True if a page is valid
+        start: First page of the range
+        limit: Highest page to consider
+
+    Returns:
+        Boundary with the last valid and first invalid page
+    """
+    probes: list[int] = []
+
+    def probe(page: int) -> bool:
+        probes.append(page)
+        return is_valid(page)
+
+    if not probe(start):
+        return Boundary(start - 1, start, probes)
+
+    # Gallop: double the step until a page breaks or the limit is reached
+    low, step = start, 1
+    high: int | None = None
+    while high is None:
+        candidate = min(low + step, limit)
+        if candidate == low:
+            return Boundary(low, None, probes)
+        if probe(candidate):
+            low, step = candidate, step * 2
+        else:
+            high = candidate
+
+    # Binary search: low is valid, high is broken
+    while high - low > 1:
+        middle = (low + high) // 2
+        if probe(middle):
+            low = middle
+        else:
+            high = middle
+    return Boundary(low, high, probes)
+
+
+class PaginationCrawler:
+    """Probe category pages of one loaded Discover tab."""
+
+    def __init__(self, discover: DiscoverPage) -> None:
+        """Initialize crawler.
+
+        Args:
+            discover: Discover page object (loaded on first use)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.discover = discover
+        self._loaded = False
+
+    def probe(self, category: str, page_number: int) -> PageProbe:
+        """Open one category page and record how it rendered.
+
+        Args:
+            category: Category slug
+            page_number: Page number
+
+        Returns:
+            Probe outcome
+        """
+        if not self._loaded:
+            self.discover.load()
+            self._loaded = True
+        status = self.discover.open_page(category, page_number)
+        state = self.discover.ui_state()
+        result = PageProbe(category, page_number, status, state.results, state.error_visible)
+        self.logger.info("Probe /%s/%d: status=%s results=%d", category, page_number, status, result.results)
+        return result
+
+    def find_last_page(self, category: str, limit: int = DEFAULT_PAGE_LIMIT) -> Boundary:
+        """Find the last valid and first broken page of a category.
+
+        Args:
+            category: Category slug
+            limit: Highest page to consider
+
+        Returns:
+            Category boundary
+        """
+        boundary = find_boundary(lambda page: self.probe(category, page).valid, limit=limit)
+        self.logger.info(
+            "%s: last valid page %d, first broken page %s (%d probes)",
+            CATEGORIES[category],
+            boundary.last_valid,
+            boundary.first_invalid,
+            len(boundary.probes),
+        )
+        return boundary
+
+    def find_all_boundaries(self, limit: int = DEFAULT_PAGE_LIMIT) -> dict[str, Boundary]:
+        """Find the boundary of every category.
+
+        Args:
+            limit: Highest page to consider
+
+        Returns:
+            Category slug -> boundary
+        """
+        return {category: self.find_last_page(category, limit) for category in CATEGORIES}
+
+
+async def _open_checked(
+    discover: AsyncDiscoverPage,
+    category: str,
+    page_number: int,
+) -> tuple[int | None, ConsistencyReport | None]:
+    """Open a page and compare its grid with the TMDB response that served it.
+
+    Returns:
+        Response status and consistency report (None unless the page loaded)
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    expected = ApiResponse(config.tmdb_api_host, page_number=page_number)
+    status = None
+    try:
+        async with discover.page.expect_response(
+            lambda response: expected.matches(response.url), timeout=config.action_timeout
+        ) as info:
+            status = await discover.open_page(category, page_number)
+        response = await info.value
+    except PlaywrightTimeoutError:
+        return status, None
+    if status != 200:
+        return status, None
+    return status, check_consistency(await response.json(), await discover.snapshot_grid(), page_number)
+
+
+async def crawl_pages(
+    context: AsyncBrowserContext,
+    category: str,
+    pages: Iterable[int],
+    concurrency: int = 4,
+    check: bool = False,
+) -> list[PageProbe]:
+    """Open every given page of a category across a bounded set of tabs.
+
+    Each worker loads one tab once and then pulls page numbers from a shared
+    queue, so at most ``concurrency`` pages are in flight at any time.
+
+    Args:
+        context: Async browser context to open tabs in
+        category: Category slug
+        pages: Page numbers to crawl
+        concurrency: Number of tabs working in parallel
+        check: Compare each rendered grid with its TMDB payload
+
+    Returns:
+        Probes sorted by page number
+    """
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for page_number in pages:
+        queue.put_nowait(page_number)
+    results: list[PageProbe] = []
+
+    async def worker() -> None:
+        discover = AsyncDiscoverPage(await context.new_page())
+        await discover.load()
+        try:
+            while not queue.empty():
+                page_number = queue.get_nowait()
+                report = None
+                if check:
+                    status, report = await _open_checked(discover, category, page_number)
+                else:
+                    status = await discover.open_page(category, page_number)
+                state = await discover.ui_state()
+                results.append(PageProbe(category, page_number, status, state.results, state.error_visible, report))
+        finally:
+            await discover.page.close()
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, queue.qsize()))))
+    results.sort(key=lambda probe: probe.page)
+    logger.info(
+        "Crawled %d %s pages, %d broken",
+        len(results),
+        category,
+        sum(not probe.valid for probe in results),
+    )
+    return results
+
+
+async def _crawl_all(
+    category: str,
+    last_page: int,
+    concurrency: int,
+    policy: ResourcePolicy,
+    stats: ResourceStats,
+    check: bool,
+) -> list[PageProbe]:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=config.headless)
+        context = await browser.new_context()
+        await install_resource_policy_async(context, policy, stats)
+        try:
+            return await crawl_pages(context, category, range(1, last_page + 1), concurrency, check)
+        finally:
+            await browser.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Discover pagination boundaries of the TMDB Discover app")
+    parser.add_argument("categories", nargs="*", help=f"Categories: {', '.join(CATEGORIES)} (default: all)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_PAGE_LIMIT, help="Highest page to consider")
+    parser.add_argument("--full", action="store_true", help="Also crawl every page up to the first broken one")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel tabs for --full")
+    parser.add_argument("--check", action="store_true", help="Compare grids with TMDB payloads during --full")
+    parser.add_argument("--lean", action="store_true", help="Stub posters and block media/fonts")
+    parser.add_argument("--log-file", help="Also write structured JSONL logs to this file")
+    args = parser.parse_args(argv)
+    # Queue-backed: hundreds of probes must not block on console/file writes
+    setup_logger("", logging.INFO, log_file=args.log_file, async_mode=True)
+
+    categories = args.categories or list(CATEGORIES)
+    unknown = sorted(set(categories) - set(CATEGORIES))
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(unknown)}")
+    policy = LEAN_POLICY if args.lean else ResourcePolicy.from_config(config)
+    stats = ResourceStats()
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=config.headless)
+        context = browser.new_context()
+        install_resource_policy(context, policy, stats)
+        crawler = PaginationCrawler(DiscoverPage(context.new_page()))
+        boundaries = {category: crawler.find_last_page(category, args.limit) for category in categories}
+        browser.close()
+
+    for category, boundary in boundaries.items():
+        print(
+            f"{category}: last valid page {boundary.last_valid}, "
+            f"first broken page {boundary.first_invalid} ({len(boundary.probes)} probes)"
+        )
+        if args.full:
+            last_page = boundary.first_invalid or boundary.last_valid
+            probes = asyncio.run(_crawl_all(category, last_page, args.concurrency, policy, stats, args.check))
+            broken = [probe.page for probe in probes if not probe.valid]
+            print(f"  crawled {len(probes)} pages, broken: {broken or 'none'}")
+            for probe in probes:
+                if probe.consistency is not None and not probe.consistency.consistent:
+                    print(f"  {probe.consistency.describe()}")
+    if policy.active:
+        print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
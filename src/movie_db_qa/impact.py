@@ -0,0 +1,540 @@
+"""Test impact analysis: run only the tests a change can affect.
+
+A recording run stores, per test node id, which framework functions the test
+executed (page object methods, utilities, the test function itself) in a
+call map. A selection run diffs the tree against a git ref and maps the
+changed lines to:
+
+- functions and methods (``path::Class.method``), matched against the call map
+- ``TestConfig`` fields, matched against functions that read ``config.<field>``
+- requirements in ``rubric/requirements.yml``, matched through their TC ids
+  against test docstrings
+
+Changes the call map cannot see (``conftest.py``, dependencies, deleted files)
+force a full run, as does a missing or stale call map; full runs re-record it.
+"""
+
+import ast
+import json
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+# Framework config module and class whose fields are tracked individually
+CONFIG_MODULE = "src/movie_db_qa/utils/config.py"
+CONFIG_CLASS = "TestConfig"
+
+# Requirements file whose entries map to test cases
+REQUIREMENTS_FILE = "rubric/requirements.yml"
+
+# Changes to these paths can affect every test
+FULL_RUN_PATTERNS = (
+    re.compile(r"(^|/)conftest\.py$"),
+    re.compile(r"^pyproject\.toml$"),
+    re.compile(r"^tests/cassettes/"),
+    re.compile(r"^tests/fixtures/"),
+)
+
+# Changes to these paths affect no test
+IGNORED_PATTERNS = (
+    re.compile(r"\.md$"),
+    re.compile(r"^docs/"),
+    re.compile(r"^artifacts/"),
+    re.compile(r"^\.github/"),
+    re.compile(r"^(Makefile|VERSION|\.gitignore|\.pre-commit-config\.yaml)$"),
+)
+
+# "@@ -a,b +c,d @@" hunk header of a unified diff
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# Top-level key of a YAML mapping ("FLT-CAT-1.1:")
+_YAML_KEY = re.compile(r"^([^\s#][^:]*):")
+
+
+def _top_level_symbol(qualname: str) -> str:
+    """Collapse nested functions onto the function or method that defines them."""
+    return qualname.split(".<locals>", 1)[0]
+
+
+def _owner(key: str) -> str:
+    """Reduce ``path::Class.method`` to ``path::Class`` (functions are their own owner)."""
+    path, _, qualname = key.partition("::")
+    return f"{path}::{qualname.split('.', 1)[0]}"
+
+
+def changed_lines(base: str, root: Path) -> dict[str, set[int]]:
+    """List changed line numbers (new side) per file relative to a git ref.
+
+    Deleted files map to an empty set.
+
+    Args:
+        base: Git ref to diff against (working tree included)
+        root: Repository root
+
+    Returns:
+        Relative path -> changed line numbers
+
+    Raises:
+        ValueError: If git cannot diff against ``base`` (unknown ref, no repository)
+    """
+    try:
+        diff = subprocess.run(
+            ["git", "diff", "--unified=0", "--no-color", "--no-renames", base, "--"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as error:
+        detail = error.stderr.strip().splitlines()[0] if error.stderr.strip() else f"exit status {error.returncode}"
+        raise ValueError(f"cannot diff against {base!r}: {detail}") from error
+    except OSError as error:
+        raise ValueError(f"cannot diff against {base!r}: {error}") from error
+    changes: dict[str, set[int]] = {}
+    current: str | None = None
+    for line in diff.splitlines():
+        if line.startswith("--- a/"):
+            current = line[6:]
+            changes.setdefault(current, set())
+        elif line.startswith("+++ "):
+            current = None if line == "+++ /dev/null" else line[6:]
+            if current is not None:
+                changes.setdefault(current, set())
+        elif current is not None and (hunk := _HUNK.match(line)):
+            start, count = int(hunk.group(1)), int(hunk.group(2) or 1)
+            # Pure deletions (count 0) touch the line after which they happened
+            changes[current].update(range(start, start + count) if count else {max(start, 1)})
+    return changes
+
+
+def symbol_spans(source: str) -> list[tuple[int, int, str]]:
+    """Find the line span of every top-level function, class and method.
+
+    Args:
+        source: Python module source
+
+    Returns:
+        (first line, last line, qualified name); class bodies are listed after their methods
+    """
+    spans: list[tuple[int, int, str]] = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            start = min([node.lineno, *(d.lineno for d in node.decorator_list)])
+            spans.append((start, node.end_lineno or node.lineno, node.name))
+        elif isinstance(node, ast.ClassDef):
+            for member in node.body:
+                if isinstance(member, ast.FunctionDef | ast.AsyncFunctionDef):
+                    start = min([member.lineno, *(d.lineno for d in member.decorator_list)])
+                    spans.append((start, member.end_lineno or member.lineno, f"{node.name}.{member.name}"))
+            start = min([node.lineno, *(d.lineno for d in node.decorator_list)])
+            spans.append((start, node.end_lineno or node.lineno, node.name))
+    return spans
+
+
+def config_field_lines(source: str) -> dict[int, str]:
+    """Map the lines of ``TestConfig`` field declarations to field names.
+
+    Args:
+        source: Source of the config module
+
+    Returns:
+        Line number -> field name
+    """
+    lines: dict[int, str] = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and node.name == CONFIG_CLASS:
+            for member in node.body:
+                if isinstance(member, ast.AnnAssign) and isinstance(member.target, ast.Name):
+                    for line in range(member.lineno, (member.end_lineno or member.lineno) + 1):
+                        lines[line] = member.target.id
+    return lines
+
+
+def config_references(source: str) -> dict[str, set[str]]:
+    """Find which ``config.<field>`` attributes each function reads.
+
+    Args:
+        source: Python module source
+
+    Returns:
+        Qualified function name -> config fields
+    """
+    spans = symbol_spans(source)
+    references: dict[str, set[str]] = defaultdict(set)
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "config":
+            # Innermost span wins: methods are listed before their class
+            owner = next((name for start, end, name in spans if start <= node.lineno <= end), None)
+            if owner is not None:
+                references[owner].add(node.attr)
+    return dict(references)
+
+
+@dataclass
+class ChangeSet:
+    """What a diff changed, in terms tests can be matched against.
+
+    Attributes:
+        symbols: Changed functions, methods and class bodies (``path::qualname``)
+        modules: Files with module-level changes (imports, constants)
+        config_fields: Changed ``TestConfig`` fields
+        requirements: Changed requirement ids
+        full_run_reason: Why every test must run (None if selection is safe)
+    """
+
+    symbols: set[str] = field(default_factory=set)
+    modules: set[str] = field(default_factory=set)
+    config_fields: set[str] = field(default_factory=set)
+    requirements: set[str] = field(default_factory=set)
+    full_run_reason: str | None = None
+
+    def describe(self) -> str:
+        """Summarize the change set in one line.
+
+        Returns:
+            Human readable summary
+        """
+        return (
+            f"{len(self.symbols)} symbols, {len(self.modules)} modules, "
+            f"{len(self.config_fields)} config fields, {len(self.requirements)} requirements changed"
+        )
+
+
+def analyze_changes(changes: dict[str, set[int]], root: Path) -> ChangeSet:
+    """Map changed lines to symbols, config fields and requirements.
+
+    Args:
+        changes: Output of ``changed_lines``
+        root: Repository root
+
+    Returns:
+        Change set
+    """
+    change_set = ChangeSet()
+    for path, lines in sorted(changes.items()):
+        if any(pattern.search(path) for pattern in FULL_RUN_PATTERNS):
+            change_set.full_run_reason = f"{path} changed"
+            continue
+        if any(pattern.search(path) for pattern in IGNORED_PATTERNS):
+            continue
+        source_path = root / path
+        if not source_path.is_file():
+            change_set.full_run_reason = f"{path} deleted"
+            continue
+        if path == REQUIREMENTS_FILE:
+            change_set.requirements |= _changed_requirements(source_path.read_text(encoding="utf-8"), lines)
+        elif path.endswith(".py"):
+            _analyze_python(path, source_path.read_text(encoding="utf-8"), lines, change_set)
+        elif path.startswith(("src/", "tests/")):
+            change_set.full_run_reason = f"{path} changed (not traceable)"
+    return change_set
+
+
+def _analyze_python(path: str, source: str, lines: set[int], change_set: ChangeSet) -> None:
+    spans = symbol_spans(source)
+    fields = config_field_lines(source) if path == CONFIG_MODULE else {}
+    for line in lines:
+        if line in fields:
+            change_set.config_fields.add(fields[line])
+            continue
+        owner = next((name for start, end, name in spans if start <= line <= end), None)
+        if owner is None:
+            change_set.modules.add(path)
+        else:
+            change_set.symbols.add(f"{path}::{owner}")
+
+
+def _changed_requirements(text: str, lines: set[int]) -> set[str]:
+    requirements: set[str] = set()
+    current: str | None = None
+    for number, line in enumerate(text.splitlines(), start=1):
+        if key := _YAML_KEY.match(line):
+            current = key.group(1).strip()
+        if number in lines and current is not None:
+            requirements.add(current)
+    return requirements
+
+
+class CallMap:
+    """Per-test sets of executed framework functions, persisted as JSON.
+
+    Every entry carries the time it was recorded, so a partial recording
+    (e.g. ``--changed-since ... --record-call-map``) refreshes only the tests
+    that ran and the others keep aging.
+    """
+
+    def __init__(self, tests: dict[str, set[str]] | None = None, recorded_at: float = 0.0) -> None:
+        """Initialize call map.
+
+        Args:
+            tests: Test node id -> executed ``path::qualname`` keys
+            recorded_at: Unix time the given entries were recorded
+        """
+        self.tests = tests or {}
+        self.recorded = dict.fromkeys(self.tests, recorded_at)
+
+    def record(self, test: str, calls: set[str], at: float | None = None) -> None:
+        """Store a test's calls.
+
+        Args:
+            test: Test node id
+            calls: Executed ``path::qualname`` keys
+            at: Unix time of the recording (default: now)
+        """
+        self.tests[test] = calls
+        self.recorded[test] = time.time() if at is None else at
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CallMap | None":
+        """Read a stored call map.
+
+        Args:
+            path: Call map file
+
+        Returns:
+            Call map, or None if the file does not exist
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        call_map = cls()
+        for test, entry in data["tests"].items():
+            if isinstance(entry, list):
+                # Written before per-test timestamps: the whole file shares one
+                call_map.record(test, set(entry), data.get("recorded_at", 0.0))
+            else:
+                call_map.record(test, set(entry["calls"]), entry["recorded_at"])
+        return call_map
+
+    def save(self, path: str | Path) -> None:
+        """Write the call map.
+
+        Args:
+            path: Call map file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tests = {
+            test: {"recorded_at": self.recorded[test], "calls": sorted(keys)}
+            for test, keys in sorted(self.tests.items())
+        }
+        path.write_text(json.dumps({"tests": tests}, indent=1) + "\n", encoding="utf-8")
+
+    def merge(self, other: "CallMap") -> None:
+        """Add another (e.g. per-worker) call map; its entries replace ours.
+
+        Args:
+            other: Call map to merge in
+        """
+        self.tests.update(other.tests)
+        self.recorded.update(other.recorded)
+
+    def age_hours(self, tests: Iterable[str] | None = None) -> float:
+        """Hours since the oldest entry was recorded.
+
+        Args:
+            tests: Only consider these tests (default: every entry); tests
+                without an entry are ignored
+
+        Returns:
+            Age of the oldest entry (0 if there is none)
+        """
+        selected = self.recorded if tests is None else [test for test in tests if test in self.recorded]
+        if not selected:
+            return 0.0
+        return (time.time() - min(self.recorded[test] for test in selected)) / 3600
+
+
+def merge_call_maps(path: str | Path, recorded: CallMap | None = None) -> CallMap | None:
+    """Update the stored call map with this run's recordings.
+
+    Entries of tests that ran replace their old entries; per-worker maps
+    (``<stem>.gw*.json``) are merged in and removed.
+
+    Args:
+        path: Stored call map file
+        recorded: Call map recorded by this process
+
+    Returns:
+        Updated call map, or None if nothing was recorded
+    """
+    path = Path(path)
+    parts = sorted(path.parent.glob(f"{path.stem}.gw*{path.suffix}"))
+    if not parts and (recorded is None or not recorded.tests):
+        return None
+    merged = CallMap.load(path) or CallMap()
+    for part in parts:
+        worker_map = CallMap.load(part)
+        if worker_map is not None:
+            merged.merge(worker_map)
+        part.unlink()
+    if recorded is not None:
+        merged.merge(recorded)
+    merged.save(path)
+    return merged
+
+
+class CallRecorder:
+    """Record which functions under the given directories a test executes."""
+
+    def __init__(self, root: Path, directories: Iterable[str] = ("src", "tests")) -> None:
+        """Initialize recorder.
+
+        Args:
+            root: Repository root
+            directories: Directories (relative to root) whose functions are recorded
+        """
+        self.root = root.resolve()
+        self.prefixes = tuple(f"{self.root / directory}/" for directory in directories)
+        self.calls: set[str] = set()
+        self._relative: dict[str, str | None] = {}
+
+    def _profile(self, frame: FrameType, event: str, arg: object) -> None:
+        if event != "call":
+            return
+        code = frame.f_code
+        filename = code.co_filename
+        relative = self._relative.get(filename, "")
+        if relative == "":
+            relative = filename[len(str(self.root)) + 1 :] if filename.startswith(self.prefixes) else None
+            self._relative[filename] = relative
+        if relative is not None:
+            # co_qualname is Python 3.11+; on 3.10 methods are recorded by bare name
+            qualname = getattr(code, "co_qualname", code.co_name)
+            self.calls.add(f"{relative}::{_top_level_symbol(qualname)}")
+
+    def start(self) -> None:
+        """Start recording on the current thread."""
+        self.calls = set()
+        sys.setprofile(self._profile)
+
+    def stop(self) -> set[str]:
+        """Stop recording.
+
+        Returns:
+            Executed ``path::qualname`` keys
+        """
+        sys.setprofile(None)
+        return self.calls
+
+
+@dataclass
+class Selection:
+    """Outcome of impact selection.
+
+    Attributes:
+        selected: Test node ids to run
+        reasons: Node id -> why it was selected
+    """
+
+    selected: list[str]
+    reasons: dict[str, str]
+
+
+def config_reference_index(root: Path, directories: Iterable[str] = ("src", "tests")) -> dict[str, set[str]]:
+    """Index ``config.<field>`` reads of every function in the given directories.
+
+    Args:
+        root: Repository root
+        directories: Directories to scan
+
+    Returns:
+        ``path::qualname`` -> config fields read
+    """
+    index: dict[str, set[str]] = {}
+    for directory in directories:
+        for path in sorted((root / directory).rglob("*.py")):
+            relative = path.relative_to(root).as_posix()
+            for name, fields in config_references(path.read_text(encoding="utf-8")).items():
+                index[f"{relative}::{name}"] = fields
+    return index
+
+
+def select_tests(
+    node_ids: list[str],
+    change_set: ChangeSet,
+    call_map: CallMap,
+    config_index: dict[str, set[str]],
+    requirement_tests: dict[str, set[str]],
+    test_case_ids: dict[str, list[str]],
+) -> Selection:
+    """Pick the tests a change set can affect.
+
+    Args:
+        node_ids: Collected test node ids
+        change_set: Output of ``analyze_changes``
+        call_map: Recorded call map
+        config_index: Output of ``config_reference_index``
+        requirement_tests: Requirement id -> TC ids
+        test_case_ids: Test function name -> TC ids from its docstring
+
+    Returns:
+        Selected node ids with reasons
+    """
+    changed_tcs = {tc for req in change_set.requirements for tc in requirement_tests.get(req, set())}
+    recorded = {key for calls in call_map.tests.values() for key in calls}
+    # Classes run their body (and dataclass-generated methods) outside any recorded
+    # function, so a class-level change matches every call into the class
+    recorded |= {_owner(key) for key in recorded}
+    # Code no test executed may run at import time (e.g. config defaults): treat as module-level
+    unexecuted = {symbol for symbol in change_set.symbols if symbol not in recorded and symbol.startswith("src/")}
+    modules = change_set.modules | {symbol.split("::", 1)[0] for symbol in unexecuted}
+    reasons: dict[str, str] = {}
+    for node_id in node_ids:
+        calls = call_map.tests.get(node_id)
+        test_name = node_id.split("::")[-1].split("[", 1)[0]
+        if calls is None:
+            reasons[node_id] = "not in call map (new test)"
+        elif hit := (calls | {_owner(key) for key in calls}) & change_set.symbols:
+            reasons[node_id] = f"calls changed {sorted(hit)[0]}"
+        elif hit := {key.split("::", 1)[0] for key in calls} & modules:
+            reasons[node_id] = f"uses changed module {sorted(hit)[0]}"
+        elif hit := {f for key in calls for f in config_index.get(key, set())} & change_set.config_fields:
+            reasons[node_id] = f"reads changed config.{sorted(hit)[0]}"
+        elif hit := set(test_case_ids.get(test_name, [])) & changed_tcs:
+            reasons[node_id] = f"traces changed requirement of {sorted(hit)[0]}"
+    return Selection([node_id for node_id in node_ids if node_id in reasons], reasons)
+
+
+def requirement_test_cases(root: Path) -> dict[str, set[str]]:
+    """Map requirement ids to their TC ids.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Requirement id -> TC ids
+    """
+    import yaml
+
+    path = root / REQUIREMENTS_FILE
+    if not path.exists():
+        return {}
+    requirements = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return {req_id: set(entry.get("tests") or []) for req_id, entry in requirements.items()}
+
+
+def docstring_test_cases(root: Path) -> dict[str, list[str]]:
+    """Map test function names to the TC ids in their docstrings.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Test function name -> TC ids
+    """
+    from movie_db_qa.audit import index_python
+
+    index: dict[str, list[str]] = defaultdict(list)
+    for path in sorted((root / "tests").rglob("test_*.py")):
+        for name, ids in index_python(path.read_text(encoding="utf-8"))["test_cases"].items():
+            index[name].extend(ids)
+    return dict(index)
@@ -0,0 +1,121 @@
+"""Async base page object for concurrent multi-tab exploration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING
+
+from movie_db_qa.pages.waits import ActionTiming, WaitCondition
+from movie_db_qa.utils.config import config
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+class AsyncBasePage:
+    """Async twin of ``BasePage`` built on ``playwright.async_api``.
+
+    One event loop can drive many of these concurrently (one per tab), which
+    suits read-only verification sweeps that mostly wait on I/O.
+    """
+
+    def __init__(self, page: Page) -> None:
+        """Initialize async base page.
+
+        Args:
+            page: Async Playwright page instance
+        """
+        # CLAUDE.md: Instantiate logging as first step in constructor
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.page = page
+        self.action_timings: list[ActionTiming] = []
+
+    async def perform(
+        self,
+        name: str,
+        action: Callable[[], Awaitable[object]],
+        *conditions: WaitCondition,
+        tolerate_timeout: bool = False,
+    ) -> ActionTiming:
+        """Run an action and wait only for the conditions that mean "done".
+
+        Args:
+            name: Action name used in logs and timings
+            action: Coroutine function performing the interaction
+            *conditions: Completion conditions to wait for
+            tolerate_timeout: Log and record an unmet condition instead of raising
+
+        Returns:
+            Timing record for the action (also appended to ``action_timings``)
+
+        Raises:
+            TimeoutError: If a condition is not met in time and ``tolerate_timeout`` is off
+        """
+        # Imported here so importing page objects does not load Playwright
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        description = " + ".join(condition.describe() for condition in conditions) or "none"
+        started = time.perf_counter()
+        error: PlaywrightTimeoutError | None = None
+        async with AsyncExitStack() as stack:
+            for condition in conditions:
+                await stack.enter_async_context(condition.async_expect(self.page, config.action_timeout))
+            await action()
+            pending = stack.pop_all()
+        try:
+            await pending.aclose()
+        except PlaywrightTimeoutError as timeout:
+            error = timeout
+
+        timing = ActionTiming(name, description, (time.perf_counter() - started) * 1000, error is not None)
+        self.action_timings.append(timing)
+        if error is not None:
+            message = f"{name}: '{description}' not met within {config.action_timeout} ms"
+            if not tolerate_timeout:
+                raise TimeoutError(message) from error
+            self.logger.warning(message)
+        self.logger.debug("%s done in %.1f ms (%s)", name, timing.elapsed_ms, description)
+        return timing
+
+    async def navigate_to(self, url: str) -> None:
+        """Navigate to a specific URL.
+
+        Args:
+            url: The URL to navigate to
+        """
+        await self.page.goto(url)
+
+    async def get_title(self) -> str:
+        """Get the page title.
+
+        Returns:
+            Page title as string
+        """
+        return await self.page.title()
+
+    def get_url(self) -> str:
+        """Get current page URL.
+
+        Returns:
+            Current URL as string
+        """
+        return self.page.url
+
+    async def wait_for_load_state(self, state: str = "load") -> None:
+        """Wait for page to reach specific load state.
+
+        Args:
+            state: Load state to wait for (load, domcontentloaded, networkidle)
+        """
+        await self.page.wait_for_load_state(state)  # type: ignore
+
+    async def screenshot(self, path: str) -> None:
+        """Take a screenshot of the current page.
+
+        Args:
+            path: File path to save screenshot
+        """
+        await self.page.screenshot(path=path)
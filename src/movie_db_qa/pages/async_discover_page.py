@@ -0,0 +1,237 @@
+"""Async page object for TMDB Discovery page."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from movie_db_qa.pages.async_base_page import AsyncBasePage
+from movie_db_qa.pages.discover_page import (
+    CATEGORIES,
+    category_conditions,
+    page_number_from_url,
+    pagination_conditions,
+)
+from movie_db_qa.pages.grid import SNAPSHOT_GRID_JS, GridSnapshot
+from movie_db_qa.pages.ui_state import FILTER_LABELS, READ_UI_STATE_JS, UI_CHANGED_JS, UIState
+from movie_db_qa.pages.waits import PUSH_STATE_JS, ApiResponse, GridOrError, GridReady
+from movie_db_qa.utils.config import config
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+class AsyncDiscoverPage(AsyncBasePage):
+    """Async twin of ``DiscoverPage`` with the same method surface.
+
+    Selectors, in-page scripts and completion conditions are shared with
+    ``DiscoverPage``; only the driver calls are awaited.
+    """
+
+    def __init__(self, page: Page) -> None:
+        """Initialize async Discover page.
+
+        Args:
+            page: Async Playwright page instance
+        """
+        super().__init__(page)
+        self.url = config.base_url
+
+    async def load(self) -> None:
+        """Load the discover page (auto-forwards to /popular)."""
+        await self.perform(
+            "load",
+            lambda: self.navigate_to(self.url),
+            ApiResponse(config.tmdb_api_host),
+            GridReady(),
+        )
+
+    # Filter actions
+    async def select_category(self, slug: str) -> None:
+        """Click a category filter and wait for its results.
+
+        Args:
+            slug: Category URL path segment (popular, trend, new, top)
+        """
+        self.logger.info("Clicking %s filter", CATEGORIES[slug])
+        await self.perform(
+            f"select_{slug}_filter",
+            lambda: self.page.click(f"a[href='/{slug}']"),
+            *category_conditions(self.page.url, slug),
+        )
+
+    async def select_popular_filter(self) -> None:
+        """Click Popular category filter."""
+        await self.select_category("popular")
+
+    async def select_trending_filter(self) -> None:
+        """Click Trending category filter."""
+        await self.select_category("trend")
+
+    async def select_newest_filter(self) -> None:
+        """Click Newest category filter."""
+        await self.select_category("new")
+
+    async def select_top_rated_filter(self) -> None:
+        """Click Top Rated category filter."""
+        await self.select_category("top")
+
+    # Pagination actions
+    async def _paginate(self, name: str, selector: str, target_page: int) -> None:
+        """Click a pagination control and wait for the target page's results.
+
+        Args:
+            name: Action name used in timings
+            selector: Selector of the control to click
+            target_page: Page number the click should load
+        """
+        await self.perform(name, lambda: self.page.click(selector), *pagination_conditions(target_page))
+
+    async def click_next_page(self) -> None:
+        """Click Next pagination button."""
+        self.logger.info("Clicking Next page button")
+        await self._paginate("click_next_page", "text=Next", self.get_current_page() + 1)
+
+    async def click_previous_page(self) -> None:
+        """Click Previous pagination button."""
+        current_page = self.get_current_page()
+        if current_page == 1:
+            # Nothing to go back to: the click would trigger no fetch to wait for
+            self.logger.info("Already on page 1, not clicking Previous")
+            return
+        self.logger.info("Clicking Previous page button")
+        await self._paginate("click_previous_page", "text=Previous", current_page - 1)
+
+    async def navigate_to_page(self, page_number: int) -> None:
+        """Navigate to specific page number.
+
+        Args:
+            page_number: Page number to navigate to
+        """
+        self.logger.info("Navigating to page: %d", page_number)
+        await self._paginate("navigate_to_page", f"a:has-text('{page_number}')", page_number)
+
+    async def open_page(self, category: str, page_number: int) -> int | None:
+        """Open a category page through the SPA router (no full page load).
+
+        Args:
+            category: Category URL path segment (popular, trend, new, top)
+            page_number: Page number to open
+
+        Returns:
+            Status of the TMDB response for that page, or None if none arrived
+        """
+        self.logger.info("Opening /%s/%d in app", category, page_number)
+        response = ApiResponse(config.tmdb_api_host, page_number=page_number)
+        await self.perform(
+            "open_page",
+            lambda: self.page.evaluate(PUSH_STATE_JS, f"/{category}/{page_number}"),
+            response,
+            GridOrError(),
+            # Probing: a page that never answers is an outcome, not an error
+            tolerate_timeout=True,
+        )
+        return response.status
+
+    # Getters
+    async def get_results_count(self) -> int:
+        """Get number of movie results displayed.
+
+        Returns:
+            Count of movie cards on page
+        """
+        await self.page.wait_for_selector(".grid", state="visible", timeout=10000)
+        count = await self.page.locator(".grid > div").count()
+        self.logger.debug("Found %d movie results on page", count)
+        return count
+
+    def get_current_page(self) -> int:
+        """Get current page number (read from the URL, no driver call).
+
+        Returns:
+            Current page number
+        """
+        return page_number_from_url(self.page.url)
+
+    async def get_movie_titles(self) -> list[str]:
+        """Get list of movie titles on current page.
+
+        Returns:
+            List of movie title strings
+        """
+        return (await self.snapshot_grid()).titles
+
+    async def snapshot_grid(self) -> GridSnapshot:
+        """Read every movie card in a single in-page evaluation.
+
+        Returns:
+            Snapshot with title, poster URL, year, rating, genre and position per card
+        """
+        snapshot = GridSnapshot.from_raw(await self.page.evaluate(SNAPSHOT_GRID_JS))
+        self.logger.debug("Grid snapshot: %d cards", len(snapshot))
+        return snapshot
+
+    # Filter state checkers
+    async def is_filter_active(self, filter_name: str) -> bool:
+        """Check if a filter is in active state.
+
+        Args:
+            filter_name: Filter name to check (Popular, Trend, Newest, Top rated)
+
+        Returns:
+            True if filter is active, False otherwise
+        """
+        return (await self.ui_state()).is_active(filter_name)
+
+    async def is_popular_filter_active(self) -> bool:
+        """Check if Popular filter is active."""
+        return await self.is_filter_active("Popular")
+
+    async def is_trending_filter_active(self) -> bool:
+        """Check if Trending filter is active."""
+        return await self.is_filter_active("Trend")
+
+    async def is_newest_filter_active(self) -> bool:
+        """Check if Newest filter is active."""
+        return await self.is_filter_active("Newest")
+
+    async def is_top_rated_filter_active(self) -> bool:
+        """Check if Top Rated filter is active."""
+        return await self.is_filter_active("Top rated")
+
+    # UI state
+    async def ui_state(self) -> UIState:
+        """Read filters, pagination and error banner in one evaluation.
+
+        Returns:
+            Current UI state snapshot
+        """
+        return UIState.from_raw(await self.page.evaluate(READ_UI_STATE_JS, list(FILTER_LABELS.values())))
+
+    async def wait_for_ui_change(
+        self,
+        since: UIState,
+        predicate: Callable[[UIState], bool] | None = None,
+        timeout: float | None = None,
+    ) -> UIState:
+        """Wait for the next UI state transition instead of polling.
+
+        Args:
+            since: State to wait past (usually read before the action)
+            predicate: Optional condition the new state must satisfy
+            timeout: Maximum wait in milliseconds (defaults to ``config.action_timeout``)
+
+        Returns:
+            First state after ``since`` that satisfies ``predicate``
+        """
+        deadline = time.monotonic() + (timeout or config.action_timeout) / 1000
+        state = since
+        while True:
+            remaining_ms = max((deadline - time.monotonic()) * 1000, 1)
+            await self.page.wait_for_function(
+                UI_CHANGED_JS, arg=[state.time_origin, state.version], timeout=remaining_ms
+            )
+            state = await self.ui_state()
+            if predicate is None or predicate(state):
+                return state
@@ -1,8 +1,18 @@
 """Base page object with common interactions for all pages."""
 
+from __future__ import annotations
+
 import logging
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from typing import TYPE_CHECKING
+
+from movie_db_qa.pages.waits import ActionTiming, WaitCondition
+from movie_db_qa.utils.config import config
 
-from playwright.sync_api import Page
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
 class BasePage:
@@ -21,6 +31,64 @@ class BasePage:
         # CLAUDE.md: Instantiate logging as first step in constructor
         self.logger = logging.getLogger(self.__class__.__name__)
         self.page = page
+        # Shared by every page object on the tab, so fixtures can read them too
+        if not hasattr(page, "action_timings"):
+            page.action_timings = []  # type: ignore[attr-defined]
+        self.action_timings: list[ActionTiming] = page.action_timings  # type: ignore[attr-defined]
+
+    def perform(
+        self,
+        name: str,
+        action: Callable[[], object],
+        *conditions: WaitCondition,
+        tolerate_timeout: bool = False,
+    ) -> ActionTiming:
+        """Run an action and wait only for the conditions that mean "done".
+
+        Conditions are armed before the action so fast events are not missed.
+        A condition that is not met within ``config.action_timeout`` raises,
+        naming the action and the unmet condition; callers that probe for an
+        outcome (e.g. whether a page exists) pass ``tolerate_timeout`` to get
+        a timed-out timing instead.
+
+        Args:
+            name: Action name used in logs and timings
+            action: Callable performing the interaction
+            *conditions: Completion conditions to wait for
+            tolerate_timeout: Log and record an unmet condition instead of raising
+
+        Returns:
+            Timing record for the action (also appended to ``action_timings``)
+
+        Raises:
+            TimeoutError: If a condition is not met in time and ``tolerate_timeout`` is off
+        """
+        # Imported here so importing page objects does not load Playwright
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        description = " + ".join(condition.describe() for condition in conditions) or "none"
+        started = time.perf_counter()
+        error: PlaywrightTimeoutError | None = None
+        with ExitStack() as stack:
+            for condition in conditions:
+                stack.enter_context(condition.expect(self.page, config.action_timeout))
+            action()
+            # Action succeeded: detach the waits so their timeouts are not errors
+            pending = stack.pop_all()
+        try:
+            pending.close()
+        except PlaywrightTimeoutError as timeout:
+            error = timeout
+
+        timing = ActionTiming(name, description, (time.perf_counter() - started) * 1000, error is not None)
+        self.action_timings.append(timing)
+        if error is not None:
+            message = f"{name}: '{description}' not met within {config.action_timeout} ms"
+            if not tolerate_timeout:
+                raise TimeoutError(message) from error
+            self.logger.warning(message)
+        self.logger.debug("%s done in %.1f ms (%s)", name, timing.elapsed_ms, description)
+        return timing
 
     def navigate_to(self, url: str) -> None:
         """Navigate to a specific URL.
@@ -1,8 +1,86 @@
 """Page object for TMDB Discovery page."""
 
-from playwright.sync_api import Page
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 from movie_db_qa.pages.base_page import BasePage
+from movie_db_qa.pages.grid import SNAPSHOT_GRID_JS, GridSnapshot
+from movie_db_qa.pages.ui_state import FILTER_LABELS, READ_UI_STATE_JS, UI_CHANGED_JS, UIState
+from movie_db_qa.pages.waits import (
+    PUSH_STATE_JS,
+    ApiResponse,
+    GridMutation,
+    GridOrError,
+    GridReady,
+    UrlMatches,
+    WaitCondition,
+)
+from movie_db_qa.utils.config import config
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# Category filters (URL slug -> name used in logs)
+CATEGORIES = {"popular": "Popular", "trend": "Trending", "new": "Newest", "top": "Top Rated"}
+
+
+def category_from_url(url: str) -> str:
+    """Get the category slug from a Discover URL.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        First path segment (e.g. "popular"), or "" on the root URL
+    """
+    segments = [part for part in urlsplit(url).path.split("/") if part]
+    return segments[0] if segments else ""
+
+
+def page_number_from_url(url: str) -> int:
+    """Get the result page number from a Discover URL.
+
+    Args:
+        url: Page URL (patterns: /popular, /popular/1, /popular/2, ...)
+
+    Returns:
+        Page number, defaulting to 1 if the URL has none
+    """
+    parts = url.rstrip("/").split("/")
+    return int(parts[-1]) if parts[-1].isdigit() else 1
+
+
+def category_conditions(current_url: str, slug: str) -> tuple[WaitCondition, ...]:
+    """Completion conditions for clicking a category filter.
+
+    Args:
+        current_url: URL before the click
+        slug: Category being selected
+
+    Returns:
+        Conditions meaning "the category's results are shown"
+    """
+    if category_from_url(current_url) == slug and page_number_from_url(current_url) == 1:
+        # Already showing this category's first page: the click triggers no fetch or re-render
+        return (GridReady(),)
+    # The filter links to the category's first page, so a later page of it refetches too
+    return (UrlMatches(f"**/{slug}"), ApiResponse(config.tmdb_api_host), GridMutation())
+
+
+def pagination_conditions(target_page: int) -> tuple[WaitCondition, ...]:
+    """Completion conditions for a pagination click.
+
+    Args:
+        target_page: Page number the click should load
+
+    Returns:
+        Conditions meaning "the target page's results are shown"
+    """
+    return (ApiResponse(config.tmdb_api_host, page_number=target_page), GridMutation())
 
 
 class DiscoverPage(BasePage):
@@ -12,8 +90,6 @@ class DiscoverPage(BasePage):
     filters, search, and pagination.
     """
 
-    BASE_URL = "https://tmdb-discover.surge.sh"
-
     def __init__(self, page: Page) -> None:
         """Initialize Discover page.
 
@@ -21,50 +97,73 @@ class DiscoverPage(BasePage):
             page: Playwright page instance
         """
         super().__init__(page)
-        self.url = self.BASE_URL
+        # Read at construction time so a session stand-in server can redirect it
+        self.url = config.base_url
 
     def load(self) -> None:
-        """Load the discover page."""
-        self.navigate_to(self.url)
-        self.wait_for_load_state("networkidle")
+        """Load the discover page (auto-forwards to /popular)."""
+        self.perform(
+            "load",
+            lambda: self.navigate_to(self.url),
+            ApiResponse(config.tmdb_api_host),
+            GridReady(),
+        )
 
     # Filter actions
+    def select_category(self, slug: str) -> None:
+        """Click a category filter and wait for its results.
+
+        Args:
+            slug: Category URL path segment (popular, trend, new, top)
+        """
+        self.logger.info("Clicking %s filter", CATEGORIES[slug])
+        self.perform(
+            f"select_{slug}_filter",
+            lambda: self.page.click(f"a[href='/{slug}']"),
+            *category_conditions(self.page.url, slug),
+        )
+
     def select_popular_filter(self) -> None:
         """Click Popular category filter."""
-        self.logger.info("Clicking Popular filter")
-        self.page.click("a[href='/popular']")
-        self.wait_for_load_state("networkidle")
+        self.select_category("popular")
 
     def select_trending_filter(self) -> None:
         """Click Trending category filter."""
-        self.logger.info("Clicking Trending filter")
-        self.page.click("a[href='/trend']")
-        self.wait_for_load_state("networkidle")
+        self.select_category("trend")
 
     def select_newest_filter(self) -> None:
         """Click Newest category filter."""
-        self.logger.info("Clicking Newest filter")
-        self.page.click("a[href='/new']")
-        self.wait_for_load_state("networkidle")
+        self.select_category("new")
 
     def select_top_rated_filter(self) -> None:
         """Click Top Rated category filter."""
-        self.logger.info("Clicking Top Rated filter")
-        self.page.click("a[href='/top']")
-        self.wait_for_load_state("networkidle")
+        self.select_category("top")
 
     # Pagination actions
+    def _paginate(self, name: str, selector: str, target_page: int) -> None:
+        """Click a pagination control and wait for the target page's results.
+
+        Args:
+            name: Action name used in timings
+            selector: Selector of the control to click
+            target_page: Page number the click should load
+        """
+        self.perform(name, lambda: self.page.click(selector), *pagination_conditions(target_page))
+
     def click_next_page(self) -> None:
         """Click Next pagination button."""
         self.logger.info("Clicking Next page button")
-        self.page.click("text=Next")
-        self.wait_for_load_state("networkidle")
+        self._paginate("click_next_page", "text=Next", self.get_current_page() + 1)
 
     def click_previous_page(self) -> None:
         """Click Previous pagination button."""
+        current_page = self.get_current_page()
+        if current_page == 1:
+            # Nothing to go back to: the click would trigger no fetch to wait for
+            self.logger.info("Already on page 1, not clicking Previous")
+            return
         self.logger.info("Clicking Previous page button")
-        self.page.click("text=Previous")
-        self.wait_for_load_state("networkidle")
+        self._paginate("click_previous_page", "text=Previous", current_page - 1)
 
     def navigate_to_page(self, page_number: int) -> None:
         """Navigate to specific page number.
@@ -74,8 +173,29 @@ class DiscoverPage(BasePage):
         """
         self.logger.info("Navigating to page: %d", page_number)
         # Click on the page number link in pagination
-        self.page.click(f"a:has-text('{page_number}')")
-        self.wait_for_load_state("networkidle")
+        self._paginate("navigate_to_page", f"a:has-text('{page_number}')", page_number)
+
+    def open_page(self, category: str, page_number: int) -> int | None:
+        """Open a category page through the SPA router (no full page load).
+
+        Args:
+            category: Category URL path segment (popular, trend, new, top)
+            page_number: Page number to open
+
+        Returns:
+            Status of the TMDB response for that page, or None if none arrived
+        """
+        self.logger.info("Opening /%s/%d in app", category, page_number)
+        response = ApiResponse(config.tmdb_api_host, page_number=page_number)
+        self.perform(
+            "open_page",
+            lambda: self.page.evaluate(PUSH_STATE_JS, f"/{category}/{page_number}"),
+            response,
+            GridOrError(),
+            # Probing: a page that never answers is an outcome, not an error
+            tolerate_timeout=True,
+        )
+        return response.status
 
     # Getters
     def get_results_count(self) -> int:
@@ -88,8 +208,7 @@ class DiscoverPage(BasePage):
         self.page.wait_for_selector(".grid", state="visible", timeout=10000)
 
         # Movie cards are divs in grid with image + title structure
-        movie_cards = self.page.locator(".grid > div").all()
-        count = len(movie_cards)
+        count = self.page.locator(".grid > div").count()
         self.logger.debug("Found %d movie results on page", count)
         return count
 
@@ -102,13 +221,7 @@ class DiscoverPage(BasePage):
         # Extract page number from URL (e.g., /popular/2 -> 2)
         url = self.page.url
         self.logger.debug("Current URL: %s", url)
-
-        # URL patterns: /popular, /popular/1, /popular/2, etc.
-        parts = url.rstrip("/").split("/")
-        if parts[-1].isdigit():
-            page_num = int(parts[-1])
-        else:
-            page_num = 1  # Default to page 1 if no page number in URL
+        page_num = page_number_from_url(url)
 
         self.logger.debug("Current page number: %d", page_num)
         return page_num
@@ -119,12 +232,20 @@ class DiscoverPage(BasePage):
         Returns:
             List of movie title strings
         """
-        # Movie titles are in <p class="text-blue-500 font-bold py-1">
-        title_elements = self.page.locator("p.text-blue-500.font-bold.py-1").all()
-        titles = [elem.text_content() or "" for elem in title_elements]
+        titles = self.snapshot_grid().titles
         self.logger.debug("Found %d movie titles", len(titles))
         return titles
 
+    def snapshot_grid(self) -> GridSnapshot:
+        """Read every movie card in a single in-page evaluation.
+
+        Returns:
+            Snapshot with title, poster URL, year, rating, genre and position per card
+        """
+        snapshot = GridSnapshot.from_raw(self.page.evaluate(SNAPSHOT_GRID_JS))
+        self.logger.debug("Grid snapshot: %d cards", len(snapshot))
+        return snapshot
+
     # Filter state checkers
     def is_filter_active(self, filter_name: str) -> bool:
         """Check if a filter is in active state.
@@ -135,10 +256,7 @@ class DiscoverPage(BasePage):
         Returns:
             True if filter is active, False otherwise
         """
-        # Active filter has text-white class, inactive has text-blue-500
-        filter_locator = self.page.locator(f"li:has-text('{filter_name}')")
-        class_attr = filter_locator.get_attribute("class")
-        is_active = "text-white" in (class_attr or "")
+        is_active = self.ui_state().is_active(filter_name)
         self.logger.debug("Filter '%s' active state: %s", filter_name, is_active)
         return is_active
 
@@ -173,3 +291,40 @@ class DiscoverPage(BasePage):
             True if Top Rated filter is active
         """
         return self.is_filter_active("Top rated")
+
+    # UI state
+    def ui_state(self) -> UIState:
+        """Read filters, pagination and error banner in one evaluation.
+
+        Returns:
+            Current UI state snapshot
+        """
+        return UIState.from_raw(self.page.evaluate(READ_UI_STATE_JS, list(FILTER_LABELS.values())))
+
+    def wait_for_ui_change(
+        self,
+        since: UIState,
+        predicate: Callable[[UIState], bool] | None = None,
+        timeout: float | None = None,
+    ) -> UIState:
+        """Wait for the next UI state transition instead of polling.
+
+        Backed by the MutationObserver installed by ``ui_state()`` plus a URL
+        check on every animation frame (the app's ``history`` is not patched).
+
+        Args:
+            since: State to wait past (usually read before the action)
+            predicate: Optional condition the new state must satisfy
+            timeout: Maximum wait in milliseconds (defaults to ``config.action_timeout``)
+
+        Returns:
+            First state after ``since`` that satisfies ``predicate``
+        """
+        deadline = time.monotonic() + (timeout or config.action_timeout) / 1000
+        state = since
+        while True:
+            remaining_ms = max((deadline - time.monotonic()) * 1000, 1)
+            self.page.wait_for_function(UI_CHANGED_JS, arg=[state.time_origin, state.version], timeout=remaining_ms)
+            state = self.ui_state()
+            if predicate is None or predicate(state):
+                return state
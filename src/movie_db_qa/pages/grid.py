@@ -0,0 +1,195 @@
+"""Compact records for the movie results grid.
+
+``DiscoverPage.snapshot_grid`` reads every card in one in-page evaluation and
+returns a ``GridSnapshot`` of ``MovieCard`` records, so grid reads cost a
+single driver round-trip regardless of how many cards are shown.
+"""
+
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
+
+# Extracts [title, poster URL, other card texts] per card in document order
+SNAPSHOT_GRID_JS = """
+() => Array.from(document.querySelectorAll('.grid > div'), card => {
+    const title = card.querySelector('p.text-blue-500.font-bold.py-1');
+    const poster = card.querySelector('img');
+    const details = Array.from(card.querySelectorAll('p, span'))
+        .filter(el => el !== title)
+        .map(el => el.textContent.trim())
+        .filter(Boolean);
+    return [title ? title.textContent.trim() : '', poster ? poster.src : '', details];
+})
+"""
+
+_YEAR = re.compile(r"\b(?:18|19|20)\d{2}\b")
+_RATING = re.compile(r"^\d{1,2}(?:\.\d+)?$")
+
+
+class MovieCard:
+    """One rendered movie card.
+
+    Attributes:
+        position: Zero-based position in the grid
+        title: Movie title
+        poster_url: Poster image URL ("" if none)
+        year: Release year, if shown
+        rating: Vote average, if shown
+        genre: Remaining descriptive text (genres), if shown
+    """
+
+    __slots__ = ("position", "title", "poster_url", "year", "rating", "genre")
+
+    def __init__(
+        self,
+        position: int,
+        title: str,
+        poster_url: str = "",
+        year: int | None = None,
+        rating: float | None = None,
+        genre: str = "",
+    ) -> None:
+        """Initialize movie card record."""
+        self.position = position
+        self.title = title
+        self.poster_url = poster_url
+        self.year = year
+        self.rating = rating
+        self.genre = genre
+
+    @classmethod
+    def from_raw(cls, position: int, title: str, poster_url: str, details: list[str]) -> "MovieCard":
+        """Build a card from the raw values extracted in the page.
+
+        Args:
+            position: Zero-based grid position
+            title: Title text
+            poster_url: Poster image source
+            details: Remaining non-empty texts of the card
+
+        Returns:
+            Parsed movie card
+        """
+        year: int | None = None
+        rating: float | None = None
+        genres: list[str] = []
+        for text in details:
+            if _RATING.match(text) and rating is None:
+                rating = float(text)
+            elif (match := _YEAR.search(text)) and year is None:
+                year = int(match.group())
+            else:
+                genres.append(text)
+        return cls(position, title, poster_url, year, rating, ", ".join(genres))
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Identity used to match cards across snapshots (title + poster)."""
+        return (self.title, self.poster_url)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all fields."""
+        if not isinstance(other, MovieCard):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        """Hash all fields."""
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        """Show position and title."""
+        return f"MovieCard({self.position}, {self.title!r})"
+
+
+@dataclass
+class GridDiff:
+    """Difference between two grid snapshots.
+
+    Attributes:
+        added: Cards only in the newer snapshot
+        removed: Cards only in the older snapshot
+        moved: (old, new) pairs of cards present in both at different positions
+    """
+
+    added: list[MovieCard] = field(default_factory=list)
+    removed: list[MovieCard] = field(default_factory=list)
+    moved: list[tuple[MovieCard, MovieCard]] = field(default_factory=list)
+
+    @property
+    def identical(self) -> bool:
+        """True if both snapshots show the same cards in the same order."""
+        return not (self.added or self.removed or self.moved)
+
+
+class GridSnapshot(Sequence[MovieCard]):
+    """Immutable, ordered snapshot of the results grid."""
+
+    __slots__ = ("cards",)
+
+    def __init__(self, cards: Sequence[MovieCard]) -> None:
+        """Initialize snapshot.
+
+        Args:
+            cards: Cards in grid order
+        """
+        self.cards = tuple(cards)
+
+    @classmethod
+    def from_raw(cls, rows: list[tuple[str, str, list[str]]]) -> "GridSnapshot":
+        """Build a snapshot from ``SNAPSHOT_GRID_JS`` output.
+
+        Args:
+            rows: [title, poster_url, details] per card
+
+        Returns:
+            Parsed snapshot
+        """
+        return cls([MovieCard.from_raw(index, *row) for index, row in enumerate(rows)])
+
+    @property
+    def titles(self) -> list[str]:
+        """Titles in grid order."""
+        return [card.title for card in self.cards]
+
+    def diff(self, newer: "GridSnapshot") -> GridDiff:
+        """Compare this snapshot with a newer one.
+
+        Args:
+            newer: Snapshot taken later (e.g. after paginating)
+
+        Returns:
+            Added, removed and moved cards
+        """
+        old = {card.key: card for card in self.cards}
+        new = {card.key: card for card in newer.cards}
+        return GridDiff(
+            added=[card for key, card in new.items() if key not in old],
+            removed=[card for key, card in old.items() if key not in new],
+            moved=[(old[key], card) for key, card in new.items() if key in old and old[key].position != card.position],
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> MovieCard: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "GridSnapshot": ...
+
+    def __getitem__(self, index: int | slice) -> "MovieCard | GridSnapshot":
+        """Get a card (or a sub-snapshot for slices)."""
+        if isinstance(index, slice):
+            return GridSnapshot(self.cards[index])
+        return self.cards[index]
+
+    def __len__(self) -> int:
+        """Number of cards."""
+        return len(self.cards)
+
+    def __iter__(self) -> Iterator[MovieCard]:
+        """Iterate cards in grid order."""
+        return iter(self.cards)
+
+    def __repr__(self) -> str:
+        """Show card count."""
+        return f"GridSnapshot({len(self.cards)} cards)"
@@ -0,0 +1,138 @@
+"""Batched snapshot of the Discover UI state.
+
+``READ_UI_STATE_JS`` reads every filter's active state, the current page, the
+pagination controls and the error banner in one in-page evaluation. It also
+installs a MutationObserver that bumps ``window.__mdqUiVersion`` on every DOM
+change, which ``DiscoverPage.wait_for_ui_change`` waits on instead of polling
+the page from Python. URL changes bump it too; they are detected by comparing
+``location.href`` on every read and every check of ``UI_CHANGED_JS``, so the
+app's ``history`` methods are left untouched.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+# Category filter labels as rendered in the filter list (slug -> label)
+FILTER_LABELS = {"popular": "Popular", "trend": "Trend", "new": "Newest", "top": "Top rated"}
+
+# Counts a URL change (pushState, replaceState, popstate) seen since the last read as a UI change
+_SYNC_URL_JS = """
+    if (location.href !== window.__mdqUiHref) {
+        window.__mdqUiHref = location.href;
+        window.__mdqUiVersion += 1;
+    }
+"""
+
+READ_UI_STATE_JS = (
+    """
+(labels) => {
+    if (!window.__mdqUiObserver) {
+        window.__mdqUiVersion = 0;
+        window.__mdqUiHref = location.href;
+        window.__mdqUiObserver = new MutationObserver(() => { window.__mdqUiVersion += 1; });
+        window.__mdqUiObserver.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, attributeFilter: ['class', 'disabled'],
+        });
+    }
+"""
+    + _SYNC_URL_JS
+    + """
+    const items = Array.from(document.querySelectorAll('li'));
+    const active = labels.filter(label => {
+        const item = items.find(li => li.textContent.toLowerCase().includes(label.toLowerCase()));
+        return !!item && item.className.includes('text-white');
+    });
+    const controls = Array.from(document.querySelectorAll('a, button'));
+    const enabled = text => controls.some(el => el.textContent.trim() === text
+        && !el.disabled && el.getAttribute('aria-disabled') !== 'true' && !el.className.includes('disabled'));
+    const pages = controls.map(el => el.textContent.trim()).filter(text => /^\\d+$/.test(text)).map(Number);
+    const last = location.pathname.replace(/\\/+$/, '').split('/').pop();
+    return {
+        active_filters: active,
+        current_page: /^\\d+$/.test(last) ? Number(last) : 1,
+        page_numbers: pages,
+        has_previous: enabled('Previous'),
+        has_next: enabled('Next'),
+        error_visible: document.body.innerText.includes('Something went wrong'),
+        results: document.querySelectorAll('.grid > div').length,
+        version: window.__mdqUiVersion,
+        time_origin: performance.timeOrigin,
+    };
+}
+"""
+)
+
+# Resolves once the UI changed after the given version (or the document was replaced);
+# ``wait_for_function`` runs it every animation frame, which is what notices URL changes
+UI_CHANGED_JS = (
+    """
+([origin, version]) => {
+    if (performance.timeOrigin !== origin) return true;
+    if (window.__mdqUiVersion === undefined) return false;
+"""
+    + _SYNC_URL_JS
+    + """
+    return window.__mdqUiVersion > version;
+}
+"""
+)
+
+
+@dataclass(frozen=True)
+class UIState:
+    """Point-in-time state of filters, pagination and error banner.
+
+    Attributes:
+        active_filters: Labels of active category filters
+        current_page: Page number from the URL (1 if none)
+        page_numbers: Page number links shown in the pagination bar
+        has_previous: Previous control present and enabled
+        has_next: Next control present and enabled
+        error_visible: "Something went wrong" banner shown
+        results: Number of movie cards in the grid
+        version: Change counter of the in-page observer when read
+        time_origin: Document time origin (identifies the document instance)
+    """
+
+    active_filters: tuple[str, ...]
+    current_page: int
+    page_numbers: tuple[int, ...]
+    has_previous: bool
+    has_next: bool
+    error_visible: bool
+    results: int = 0
+    version: int = 0
+    time_origin: float = 0.0
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any]) -> "UIState":
+        """Build state from ``READ_UI_STATE_JS`` output.
+
+        Args:
+            raw: Evaluation result
+
+        Returns:
+            Parsed UI state
+        """
+        return cls(
+            active_filters=tuple(raw["active_filters"]),
+            current_page=int(raw["current_page"]),
+            page_numbers=tuple(raw["page_numbers"]),
+            has_previous=bool(raw["has_previous"]),
+            has_next=bool(raw["has_next"]),
+            error_visible=bool(raw["error_visible"]),
+            results=int(raw.get("results", 0)),
+            version=int(raw["version"]),
+            time_origin=float(raw["time_origin"]),
+        )
+
+    def is_active(self, label: str) -> bool:
+        """Check whether a filter is active.
+
+        Args:
+            label: Filter label (Popular, Trend, Newest, Top rated)
+
+        Returns:
+            True if the filter is active
+        """
+        return label in self.active_filters
@@ -0,0 +1,252 @@
+"""Wait conditions that define when a page action is done.
+
+Each condition is armed before the action runs and waited on afterwards, so
+events that fire while the action is still in flight are not missed. Page
+objects pass the conditions describing "done" to ``BasePage.perform`` (or
+``AsyncBasePage.perform`` via ``async_expect``) instead of waiting for
+``networkidle``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as AsyncPage
+    from playwright.async_api import Response as AsyncResponse
+    from playwright.sync_api import Page, Response
+
+
+# Sets window.__mdqGridMutated once the results grid (or, before it exists,
+# the document body) changes after the observer is armed
+GRID_OBSERVER_JS = """
+() => {
+    window.__mdqGridMutated = false;
+    if (window.__mdqGridObserver) window.__mdqGridObserver.disconnect();
+    const target = document.querySelector('.grid') || document.body;
+    const observer = new MutationObserver(() => {
+        if (document.querySelector('.grid > div')) {
+            window.__mdqGridMutated = true;
+            observer.disconnect();
+        }
+    });
+    observer.observe(target, {childList: true, subtree: true, characterData: true});
+    window.__mdqGridObserver = observer;
+}
+"""
+
+GRID_MUTATED_JS = "() => window.__mdqGridMutated === true"
+
+# Grid re-rendered or the app's error screen is showing
+GRID_OR_ERROR_JS = "() => window.__mdqGridMutated === true || document.body.innerText.includes('Something went wrong')"
+
+# Client-side navigation: the SPA router follows pushState + popstate, which
+# avoids the full page load that breaks direct URL access (DEF-001)
+PUSH_STATE_JS = """
+(path) => {
+    history.pushState({}, '', path);
+    window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+}
+"""
+
+
+@dataclass
+class ActionTiming:
+    """Timing of one page action and its completion condition.
+
+    Attributes:
+        action: Action name (e.g. "click_next_page")
+        condition: Description of the awaited condition(s)
+        elapsed_ms: Time from action start until the condition was met
+        timed_out: True if the condition was not met within the timeout
+    """
+
+    action: str
+    condition: str
+    elapsed_ms: float
+    timed_out: bool = False
+
+
+class WaitCondition:
+    """Base class for completion conditions."""
+
+    def describe(self) -> str:
+        """Describe the condition for logs and timings.
+
+        Returns:
+            Short human readable description
+        """
+        return self.__class__.__name__
+
+    @contextmanager
+    def expect(self, page: Page, timeout: float) -> Iterator[None]:
+        """Arm before the action, wait for the condition on exit.
+
+        Args:
+            page: Playwright page instance
+            timeout: Maximum wait in milliseconds
+
+        Yields:
+            Control back to the caller to run the action
+        """
+        yield
+
+    @asynccontextmanager
+    async def async_expect(self, page: AsyncPage, timeout: float) -> AsyncIterator[None]:
+        """Async twin of ``expect`` for ``playwright.async_api`` pages.
+
+        Args:
+            page: Async Playwright page instance
+            timeout: Maximum wait in milliseconds
+
+        Yields:
+            Control back to the caller to run the action
+        """
+        yield
+
+
+class ApiResponse(WaitCondition):
+    """Done when a matching TMDB API response arrives."""
+
+    def __init__(self, api_host: str, path: str | None = None, page_number: int | None = None) -> None:
+        """Initialize API response condition.
+
+        Args:
+            api_host: TMDB API host
+            path: Substring the response URL path must contain
+            page_number: Required value of the ``page`` query parameter
+        """
+        self.api_host = api_host
+        self.path = path
+        self.page_number = page_number
+        # Status of the matched response, set once the condition is met
+        self.status: int | None = None
+
+    def describe(self) -> str:
+        """Describe the awaited response."""
+        page = f" page={self.page_number}" if self.page_number is not None else ""
+        return f"api response {self.path or '*'}{page}"
+
+    def matches(self, url: str) -> bool:
+        """Check whether a response URL satisfies the condition.
+
+        Args:
+            url: Response URL
+
+        Returns:
+            True if the URL matches host, path and page
+        """
+        parts = urlsplit(url)
+        if parts.netloc != self.api_host:
+            return False
+        if self.path is not None and self.path not in parts.path:
+            return False
+        if self.page_number is not None:
+            return parse_qs(parts.query).get("page") == [str(self.page_number)]
+        return True
+
+    @contextmanager
+    def expect(self, page: Page, timeout: float) -> Iterator[None]:
+        """Wait for the matching response after the action."""
+
+        def predicate(response: Response) -> bool:
+            return self.matches(response.url)
+
+        with page.expect_response(predicate, timeout=timeout) as info:
+            yield
+        self.status = info.value.status
+
+    @asynccontextmanager
+    async def async_expect(self, page: AsyncPage, timeout: float) -> AsyncIterator[None]:
+        """Wait for the matching response after the action."""
+
+        def predicate(response: AsyncResponse) -> bool:
+            return self.matches(response.url)
+
+        async with page.expect_response(predicate, timeout=timeout) as info:
+            yield
+        self.status = (await info.value).status
+
+
+class UrlMatches(WaitCondition):
+    """Done when the page URL matches a glob pattern."""
+
+    def __init__(self, pattern: str) -> None:
+        """Initialize URL condition.
+
+        Args:
+            pattern: Glob pattern such as ``**/popular``
+        """
+        self.pattern = pattern
+
+    def describe(self) -> str:
+        """Describe the awaited URL."""
+        return f"url {self.pattern}"
+
+    @contextmanager
+    def expect(self, page: Page, timeout: float) -> Iterator[None]:
+        """Wait for the URL after the action (SPA navigations commit instantly)."""
+        yield
+        page.wait_for_url(self.pattern, wait_until="commit", timeout=timeout)
+
+    @asynccontextmanager
+    async def async_expect(self, page: AsyncPage, timeout: float) -> AsyncIterator[None]:
+        """Wait for the URL after the action."""
+        yield
+        await page.wait_for_url(self.pattern, wait_until="commit", timeout=timeout)
+
+
+class GridMutation(WaitCondition):
+    """Done when the results grid re-renders after the action."""
+
+    @contextmanager
+    def expect(self, page: Page, timeout: float) -> Iterator[None]:
+        """Install a MutationObserver, then wait for it to fire."""
+        page.evaluate(GRID_OBSERVER_JS)
+        yield
+        page.wait_for_function(GRID_MUTATED_JS, timeout=timeout)
+
+    @asynccontextmanager
+    async def async_expect(self, page: AsyncPage, timeout: float) -> AsyncIterator[None]:
+        """Install a MutationObserver, then wait for it to fire."""
+        await page.evaluate(GRID_OBSERVER_JS)
+        yield
+        await page.wait_for_function(GRID_MUTATED_JS, timeout=timeout)
+
+
+class GridReady(WaitCondition):
+    """Done when at least one result card is attached."""
+
+    @contextmanager
+    def expect(self, page: Page, timeout: float) -> Iterator[None]:
+        """Wait for the first result card after the action."""
+        yield
+        page.wait_for_selector(".grid > div", state="attached", timeout=timeout)
+
+    @asynccontextmanager
+    async def async_expect(self, page: AsyncPage, timeout: float) -> AsyncIterator[None]:
+        """Wait for the first result card after the action."""
+        yield
+        await page.wait_for_selector(".grid > div", state="attached", timeout=timeout)
+
+
+class GridOrError(WaitCondition):
+    """Done when the grid re-renders or the error screen appears."""
+
+    @contextmanager
+    def expect(self, page: Page, timeout: float) -> Iterator[None]:
+        """Install the grid observer, then wait for grid or error."""
+        page.evaluate(GRID_OBSERVER_JS)
+        yield
+        page.wait_for_function(GRID_OR_ERROR_JS, timeout=timeout)
+
+    @asynccontextmanager
+    async def async_expect(self, page: AsyncPage, timeout: float) -> AsyncIterator[None]:
+        """Install the grid observer, then wait for grid or error."""
+        await page.evaluate(GRID_OBSERVER_JS)
+        yield
+        await page.wait_for_function(GRID_OR_ERROR_JS, timeout=timeout)
@@ -0,0 +1,268 @@
+"""Indexed, timed log of TMDB API calls made by a page.
+
+Calls are captured by a route on the TMDB host only, so images, fonts and
+scripts never reach Python. Each call's endpoint and query are parsed once
+and indexed by endpoint, category and page; status, timing and payload size
+are read from the finished request on demand.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlsplit
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Request, Route
+
+
+logger = logging.getLogger(__name__)
+
+# Endpoint prefixes that serve each category filter (slug -> prefixes)
+CATEGORY_ENDPOINTS = {
+    "popular": ("/movie/popular",),
+    "trend": ("/trending/",),
+    "new": ("/movie/now_playing", "/movie/upcoming", "/discover/"),
+    "top": ("/movie/top_rated",),
+}
+
+
+def parse_endpoint(url: str) -> tuple[str, dict[str, str]]:
+    """Split a TMDB URL into endpoint and query parameters.
+
+    Args:
+        url: TMDB API URL
+
+    Returns:
+        Endpoint without API version prefix (e.g. "/movie/popular") and params
+    """
+    parts = urlsplit(url)
+    path = parts.path
+    segments = path.split("/", 2)
+    if len(segments) == 3 and segments[1].isdigit():
+        path = "/" + segments[2]
+    return path.rstrip("/") or "/", dict(parse_qsl(parts.query))
+
+
+def endpoint_category(endpoint: str) -> str:
+    """Map an endpoint to its category filter.
+
+    Args:
+        endpoint: Endpoint path from ``parse_endpoint``
+
+    Returns:
+        Category slug, or "" for non-category endpoints (genres, configuration)
+    """
+    for category, prefixes in CATEGORY_ENDPOINTS.items():
+        if endpoint.startswith(prefixes):
+            return category
+    return ""
+
+
+@dataclass(slots=True)
+class ApiCall:
+    """One TMDB API request paired with its response.
+
+    Attributes:
+        url: Full request URL
+        method: HTTP method
+        resource_type: Playwright resource type (fetch, xhr)
+        endpoint: Endpoint path without version prefix
+        params: Query parameters
+        category: Category slug ("" if not a category endpoint)
+        page: Value of the ``page`` parameter, if any
+        status: Response status (None until resolved or if the request failed)
+        ttfb_ms: Time from request start to first response byte
+        duration_ms: Time from request start to response end
+        response_bytes: Response body size
+    """
+
+    url: str
+    method: str
+    resource_type: str
+    endpoint: str
+    params: dict[str, str]
+    category: str
+    page: int | None
+    status: int | None = None
+    ttfb_ms: float | None = None
+    duration_ms: float | None = None
+    response_bytes: int | None = None
+    request: Request | None = field(default=None, repr=False, compare=False)
+
+    def resolve(self) -> None:
+        """Read status, timing and size from the finished request.
+
+        No-op once resolved; calls whose response has not finished yet stay
+        unresolved and are retried on the next query.
+        """
+        if self.request is None or self.duration_ms is not None:
+            return
+        response = self.request.response()
+        if response is None:
+            return
+        timing = self.request.timing
+        if timing["responseEnd"] < 0:
+            return
+        self.status = response.status
+        if timing["responseStart"] >= 0:
+            self.ttfb_ms = timing["responseStart"] - max(timing["requestStart"], 0)
+        self.duration_ms = timing["responseEnd"]
+        self.response_bytes = self.request.sizes()["responseBodySize"]
+
+    def payload(self) -> Any:
+        """Decode the response body as JSON (read on demand, not at capture).
+
+        Returns:
+            Decoded response
+
+        Raises:
+            LookupError: If the request got no response
+        """
+        response = self.request.response() if self.request is not None else None
+        if response is None:
+            raise LookupError(f"No response for {self.url}")
+        return response.json()
+
+
+class ApiCallLog:
+    """TMDB API calls of one page, indexed by endpoint, category and page."""
+
+    def __init__(self) -> None:
+        """Initialize empty call log."""
+        self.calls: list[ApiCall] = []
+        self._by_endpoint: dict[str, list[ApiCall]] = defaultdict(list)
+        self._by_category: dict[str, list[ApiCall]] = defaultdict(list)
+        self._by_page: dict[int, list[ApiCall]] = defaultdict(list)
+
+    def record(self, request: Request) -> ApiCall:
+        """Parse and index a request.
+
+        Args:
+            request: Playwright request to the TMDB API
+
+        Returns:
+            Recorded call
+        """
+        endpoint, params = parse_endpoint(request.url)
+        page = params.get("page", "")
+        call = ApiCall(
+            url=request.url,
+            method=request.method,
+            resource_type=request.resource_type,
+            endpoint=endpoint,
+            params=params,
+            category=endpoint_category(endpoint),
+            page=int(page) if page.isdigit() else None,
+            request=request,
+        )
+        self.calls.append(call)
+        self._by_endpoint[endpoint].append(call)
+        if call.category:
+            self._by_category[call.category].append(call)
+        if call.page is not None:
+            self._by_page[call.page].append(call)
+        return call
+
+    def install(self, page: Page, api_host: str) -> None:
+        """Capture TMDB calls of a page through a host-scoped route.
+
+        The route falls back to any context-level routes (cassettes, stand-in).
+
+        Args:
+            page: Page to capture
+            api_host: TMDB API host
+        """
+
+        def handle(route: Route) -> None:
+            call = self.record(route.request)
+            logger.info("API call captured: %s %s", call.method, call.url)
+            route.fallback()
+
+        page.route(f"**://{api_host}/**", handle)
+
+    def by_endpoint(self, endpoint: str) -> list[ApiCall]:
+        """Get calls to an exact endpoint.
+
+        Args:
+            endpoint: Endpoint path (e.g. "/movie/popular")
+
+        Returns:
+            Matching calls in request order
+        """
+        return self._resolved(self._by_endpoint.get(endpoint, []))
+
+    def by_category(self, category: str) -> list[ApiCall]:
+        """Get calls that served a category filter.
+
+        Args:
+            category: Category slug (popular, trend, new, top)
+
+        Returns:
+            Matching calls in request order
+        """
+        return self._resolved(self._by_category.get(category, []))
+
+    def by_page(self, page: int, path: str | None = None) -> list[ApiCall]:
+        """Get calls requesting a result page.
+
+        Args:
+            page: Page number
+            path: Optional substring the endpoint must contain
+
+        Returns:
+            Matching calls in request order
+        """
+        calls = self._by_page.get(page, [])
+        return self._resolved([call for call in calls if path is None or path in call.endpoint])
+
+    def with_path(self, fragment: str) -> list[ApiCall]:
+        """Get calls whose endpoint contains a path fragment.
+
+        Scans the (few) distinct endpoints, not every call.
+
+        Args:
+            fragment: Path fragment such as "/movie/"
+
+        Returns:
+            Matching calls in request order
+        """
+        matches = {id(call) for endpoint, calls in self._by_endpoint.items() if fragment in endpoint for call in calls}
+        return self._resolved([call for call in self.calls if id(call) in matches])
+
+    def latency_summary(self) -> dict[str, dict[str, float]]:
+        """Summarize latency per endpoint.
+
+        Returns:
+            Endpoint -> {count, median_ms, median_ttfb_ms, bytes}
+        """
+        summary: dict[str, dict[str, float]] = {}
+        for endpoint, calls in self._by_endpoint.items():
+            finished = [call for call in self._resolved(calls) if call.duration_ms is not None]
+            if not finished:
+                continue
+            summary[endpoint] = {
+                "count": len(finished),
+                "median_ms": statistics.median(call.duration_ms for call in finished if call.duration_ms is not None),
+                "median_ttfb_ms": statistics.median(call.ttfb_ms or 0.0 for call in finished),
+                "bytes": sum(call.response_bytes or 0 for call in finished),
+            }
+        return summary
+
+    @staticmethod
+    def _resolved(calls: list[ApiCall]) -> list[ApiCall]:
+        for call in calls:
+            call.resolve()
+        return list(calls)
+
+    def __len__(self) -> int:
+        """Number of captured calls."""
+        return len(self.calls)
+
+    def __iter__(self) -> Iterator[ApiCall]:
+        """Iterate calls in request order."""
+        return iter(self._resolved(self.calls))
@@ -0,0 +1,233 @@
+"""Micro-benchmark harness for page object operations.
+
+Each benchmark warms up, calibrates how many rounds fit into a time budget,
+then times every round individually so min and tail percentiles can be
+reported. One extra round runs under ``tracemalloc`` to count Python-side
+allocations (kept out of the timed rounds, which it would slow down).
+Results are saved as JSON so runs on two commits can be compared.
+
+A round whose page action timed out measured the action timeout, not the
+operation, so the benchmark fails as soon as one round records a timed-out
+``ActionTiming``.
+
+Usage:
+    python -m movie_db_qa.utils.benchmark compare old.json new.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from movie_db_qa.pages.waits import ActionTiming
+from movie_db_qa.utils.perf import percentile
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and allocation statistics of one benchmark.
+
+    Attributes:
+        name: Benchmark name
+        rounds: Timed rounds
+        min_ms: Fastest round
+        p50_ms: Median round
+        p95_ms: 95th percentile round
+        p99_ms: 99th percentile round
+        allocations: Memory blocks allocated (and not yet freed) by one round
+        peak_bytes: Peak traced Python memory during one round
+    """
+
+    name: str
+    rounds: int
+    min_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    allocations: int
+    peak_bytes: int
+
+    def describe(self) -> str:
+        """Describe the result as one report line.
+
+        Returns:
+            Formatted line
+        """
+        return (
+            f"{self.name:<28} rounds={self.rounds:<4} min={self.min_ms:8.1f} p50={self.p50_ms:8.1f} "
+            f"p95={self.p95_ms:8.1f} p99={self.p99_ms:8.1f} ms allocs={self.allocations} peak={self.peak_bytes} B"
+        )
+
+
+def run_benchmark(
+    name: str,
+    operation: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+    warmup: int = 2,
+    target_seconds: float = 5.0,
+    min_rounds: int = 5,
+    max_rounds: int = 100,
+    timings: list[ActionTiming] | None = None,
+) -> BenchmarkResult:
+    """Warm up, calibrate and time an operation.
+
+    Args:
+        name: Benchmark name
+        operation: Operation to time
+        setup: Untimed step run before every round (e.g. reset the filter)
+        warmup: Untimed rounds before calibration
+        target_seconds: Time budget the calibrated rounds should fill
+        min_rounds: Lower bound on timed rounds
+        max_rounds: Upper bound on timed rounds
+        timings: Action timings the operation appends to (``page.action_timings``)
+
+    Returns:
+        Benchmark result
+
+    Raises:
+        RuntimeError: If a round's page action timed out
+    """
+
+    def timed_round() -> float:
+        if setup is not None:
+            setup()
+        seen = len(timings) if timings is not None else 0
+        started = time.perf_counter()
+        operation()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timed_out = [timing for timing in (timings or [])[seen:] if timing.timed_out]
+        if timed_out:
+            raise RuntimeError(
+                f"Benchmark {name}: {timed_out[0].action} timed out waiting for '{timed_out[0].condition}'"
+                f" ({elapsed_ms:.0f} ms) - the round measured the timeout, not the operation"
+            )
+        return elapsed_ms
+
+    for _ in range(warmup):
+        timed_round()
+
+    # Calibrate: one round's duration decides how many fit into the budget
+    calibration_ms = timed_round()
+    rounds = max(min_rounds, min(max_rounds, int(target_seconds * 1000 / max(calibration_ms, 0.001))))
+    samples = [timed_round() for _ in range(rounds)]
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        operation()
+        after = tracemalloc.take_snapshot()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    allocations = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+
+    result = BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        min_ms=min(samples),
+        p50_ms=percentile(samples, 50),
+        p95_ms=percentile(samples, 95),
+        p99_ms=percentile(samples, 99),
+        allocations=allocations,
+        peak_bytes=peak_bytes,
+    )
+    logger.info("Benchmark %s", result.describe())
+    return result
+
+
+def environment_info() -> dict[str, str]:
+    """Describe what the benchmarks ran on, so saved runs can be compared.
+
+    Returns:
+        Commit, Python and Playwright versions
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    try:
+        playwright_version = version("playwright")
+    except PackageNotFoundError:
+        playwright_version = "unknown"
+    return {"commit": commit, "python": platform.python_version(), "playwright": playwright_version}
+
+
+def save_results(results: list[BenchmarkResult], path: str | Path) -> Path:
+    """Write benchmark results and environment info as JSON.
+
+    Args:
+        results: Benchmark results
+        path: Output file
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"environment": environment_info(), "results": [asdict(result) for result in results]}
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_results(path: str | Path) -> dict[str, BenchmarkResult]:
+    """Read saved benchmark results.
+
+    Args:
+        path: Results file written by ``save_results``
+
+    Returns:
+        Benchmark name -> result
+    """
+    payload: dict[str, Any] = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {entry["name"]: BenchmarkResult(**entry) for entry in payload["results"]}
+
+
+def compare_results(
+    old: dict[str, BenchmarkResult],
+    new: dict[str, BenchmarkResult],
+) -> list[tuple[str, float, float, float]]:
+    """Compare the p50 of benchmarks present in both runs.
+
+    Args:
+        old: Results of the reference run
+        new: Results of the run under test
+
+    Returns:
+        (name, old p50, new p50, relative change) per shared benchmark
+    """
+    rows = []
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name].p50_ms, new[name].p50_ms
+        rows.append((name, before, after, (after - before) / before if before else 0.0))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Compare two saved benchmark runs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare = subparsers.add_parser("compare", help="Compare p50 of two result files")
+    compare.add_argument("old", help="Reference results JSON")
+    compare.add_argument("new", help="Results JSON under test")
+    args = parser.parse_args(argv)
+
+    for name, before, after, change in compare_results(load_results(args.old), load_results(args.new)):
+        print(f"{name:<28} {before:8.1f} ms -> {after:8.1f} ms ({change:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Browser servers the ``browser`` fixture connects to instead of launching.
+
+``playwright launch-server`` starts the browser in a separate driver process
+and prints a WebSocket endpoint. Two uses:
+
+- Per run: ``pytest_configure`` starts one so the browser boots while tests
+  are collected (stopped when the session ends).
+- Long-lived: ``serve`` keeps one running across pytest invocations and
+  records its endpoint in a state file; every run connects to it instead of
+  paying the launch cost.
+
+If no server is reachable, the fixture launches a browser the usual way.
+
+Usage:
+    python -m movie_db_qa.utils.browser_server serve   # until Ctrl+C
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from movie_db_qa.utils.config import config
+
+logger = logging.getLogger(__name__)
+
+# Endpoint line printed by ``playwright launch-server``
+_ENDPOINT = re.compile(r"^wss?://\S+$")
+
+# Where a long-lived server publishes its endpoint
+STATE_FILE = Path("artifacts/browser-server.json")
+
+
+class BrowserServer:
+    """Playwright browser server running in a subprocess."""
+
+    def __init__(self, browser_name: str = "chromium", **launch_options: Any) -> None:
+        """Initialize server (not started yet).
+
+        Args:
+            browser_name: "chromium", "firefox" or "webkit"
+            **launch_options: ``launchServer`` options (e.g. ``headless``)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.browser_name = browser_name
+        self.launch_options = launch_options
+        self._process: subprocess.Popen[str] | None = None
+        self._config_path: Path | None = None
+        self._endpoint: str | None = None
+        self._ready = threading.Event()
+
+    def command(self, config_path: Path) -> list[str]:
+        """Build the server command line.
+
+        Args:
+            config_path: JSON file holding the launch options
+
+        Returns:
+            Command starting ``playwright launch-server``
+        """
+        return [
+            sys.executable,
+            "-m",
+            "playwright",
+            "launch-server",
+            "--browser",
+            self.browser_name,
+            "--config",
+            str(config_path),
+        ]
+
+    def start(self) -> None:
+        """Start the server and return immediately."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as options_file:
+            json.dump(self.launch_options, options_file)
+        self._config_path = Path(options_file.name)
+        self._process = subprocess.Popen(
+            self.command(self._config_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        threading.Thread(target=self._read_output, name="browser-server", daemon=True).start()
+        self.logger.info("Launching %s browser server in the background", self.browser_name)
+
+    def _read_output(self) -> None:
+        assert self._process is not None and self._process.stdout is not None
+        # Keep draining after the endpoint so the pipe never fills up
+        for line in self._process.stdout:
+            line = line.strip()
+            if self._endpoint is None and _ENDPOINT.match(line):
+                self._endpoint = line
+                self._ready.set()
+            elif line:
+                self.logger.debug("browser server: %s", line)
+        # Process exited: wake up anyone waiting for an endpoint that will never come
+        self._ready.set()
+
+    def endpoint(self, timeout: float) -> str | None:
+        """Wait for the server's WebSocket endpoint.
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Endpoint to ``connect`` to, or None if the server did not start
+        """
+        if self._process is None:
+            return None
+        if not self._ready.wait(timeout):
+            self.logger.warning("Browser server did not start within %.0f s", timeout)
+        elif self._endpoint is None:
+            self.logger.warning("Browser server exited with code %s", self._process.poll())
+        return self._endpoint
+
+    def wait(self) -> None:
+        """Block until the server process exits."""
+        if self._process is not None:
+            self._process.wait()
+
+    def stop(self) -> None:
+        """Shut the server (and its browser) down."""
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+        if self._config_path is not None:
+            self._config_path.unlink(missing_ok=True)
+        self.logger.info("Browser server stopped")
+
+
+def running_endpoint(state_file: Path = STATE_FILE) -> str | None:
+    """Find the endpoint of a long-lived server started with ``serve``.
+
+    Args:
+        state_file: State file written by ``serve``
+
+    Returns:
+        WebSocket endpoint, or None if no server is running
+    """
+    if not state_file.exists():
+        return None
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    try:
+        os.kill(state["pid"], 0)
+    except OSError:
+        logger.info("Removing stale browser server state %s", state_file)
+        state_file.unlink(missing_ok=True)
+        return None
+    endpoint: str = state["endpoint"]
+    return endpoint
+
+
+def serve(port: int = 0, headless: bool = True, state_file: Path = STATE_FILE) -> None:
+    """Run a browser server until interrupted, publishing its endpoint.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        headless: Run the browser headless
+        state_file: State file pytest runs read the endpoint from
+    """
+    server = BrowserServer("chromium", headless=headless, port=port)
+    server.start()
+    endpoint = server.endpoint(timeout=config.timeout / 1000)
+    if endpoint is None:
+        server.stop()
+        raise SystemExit("Browser server failed to start")
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    state_file.write_text(json.dumps({"endpoint": endpoint, "pid": os.getpid()}), encoding="utf-8")
+    logger.info("Browser server listening on %s (state in %s)", endpoint, state_file)
+    try:
+        server.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        state_file.unlink(missing_ok=True)
+        server.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["serve"])
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    serve(args.port, headless=config.headless and not args.headed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Record/replay cassette store for TMDB API traffic.
+
+Record mode forwards each TMDB request to the network and writes the response
+to a cassette file. Replay mode serves responses from those files without
+touching the network, so test runs become hermetic and repeatable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import BrowserContext, Page, Route
+
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that must never end up in cassette keys or files
+SENSITIVE_PARAMS = frozenset({"api_key", "session_id", "guest_session_id"})
+
+# Response headers worth persisting (everything else is transport noise)
+PERSISTED_HEADERS = frozenset({"content-type", "access-control-allow-origin", "cache-control"})
+
+
+def normalize_url(url: str) -> str:
+    """Normalize URL so equivalent requests share one cassette key.
+
+    Lowercases the host, drops the fragment and sensitive parameters, strips a
+    trailing slash and sorts query parameters.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Normalized URL string
+    """
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SENSITIVE_PARAMS)
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, urlencode(query), ""))
+
+
+@dataclass
+class CassetteEntry:
+    """Single recorded request/response pair.
+
+    Attributes:
+        method: HTTP method
+        url: Normalized request URL
+        status: Response status code
+        headers: Persisted response headers
+        body: Response body text
+    """
+
+    method: str
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: str
+
+
+class CassetteStore:
+    """On-disk cassette store keyed by method and normalized URL.
+
+    Each entry is one small JSON file, which keeps diffs readable and lets
+    parallel workers record without contending on a shared file.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize cassette store.
+
+        Args:
+            directory: Directory holding cassette files
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Build cassette key for a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL (normalized internally)
+
+        Returns:
+            Stable hex key
+        """
+        digest = hashlib.sha1(f"{method.upper()} {normalize_url(url)}".encode())
+        return digest.hexdigest()[:16]
+
+    def path_for(self, method: str, url: str) -> Path:
+        """Get cassette file path for a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+
+        Returns:
+            Path of the cassette file
+        """
+        # Prefix with the endpoint so the directory listing stays browsable
+        slug = urlsplit(url).path.strip("/").replace("/", "_") or "root"
+        return self.directory / f"{slug}-{self.key(method, url)}.json"
+
+    def get(self, method: str, url: str) -> CassetteEntry | None:
+        """Look up a recorded response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+
+        Returns:
+            Recorded entry, or None if not recorded
+        """
+        path = self.path_for(method, url)
+        if not path.exists():
+            return None
+        return CassetteEntry(**json.loads(path.read_text(encoding="utf-8")))
+
+    def put(self, entry: CassetteEntry) -> Path:
+        """Persist a recorded response.
+
+        Args:
+            entry: Entry to write (URL is normalized before writing)
+
+        Returns:
+            Path of the written cassette file
+        """
+        entry.url = normalize_url(entry.url)
+        path = self.path_for(entry.method, entry.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(entry), separators=(",", ":")), encoding="utf-8")
+        return path
+
+
+def install_cassette(
+    target: Page | BrowserContext,
+    store: CassetteStore,
+    mode: str,
+    api_host: str,
+) -> None:
+    """Route TMDB traffic through the cassette store.
+
+    Args:
+        target: Page or context to install the route on
+        store: Cassette store to read from / write to
+        mode: "record" or "replay" ("live" installs nothing)
+        api_host: TMDB API host to intercept
+    """
+    if mode == "live":
+        return
+
+    def handle_record(route: Route) -> None:
+        request = route.request
+        response = route.fetch()
+        headers = {k: v for k, v in response.headers.items() if k.lower() in PERSISTED_HEADERS}
+        store.put(CassetteEntry(request.method, request.url, response.status, headers, response.text()))
+        logger.debug("Recorded %s %s", request.method, normalize_url(request.url))
+        route.fulfill(response=response)
+
+    def handle_replay(route: Route) -> None:
+        request = route.request
+        entry = store.get(request.method, request.url)
+        if entry is None:
+            # Hermetic: never fall through to the network in replay mode
+            logger.error("No cassette for %s %s", request.method, normalize_url(request.url))
+            route.abort("internetdisconnected")
+            return
+        route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+
+    handler = handle_record if mode == "record" else handle_replay
+    target.route(f"**://{api_host}/**", handler)
+    logger.info("TMDB cassette %s mode active (%s)", mode, store.directory)
+
+
+async def install_cassette_async(
+    context: AsyncBrowserContext,
+    store: CassetteStore,
+    mode: str,
+    api_host: str,
+) -> None:
+    """Async twin of ``install_cassette`` for ``playwright.async_api`` contexts.
+
+    Args:
+        context: Async browser context to install the route on
+        store: Cassette store to read from / write to
+        mode: "record" or "replay" ("live" installs nothing)
+        api_host: TMDB API host to intercept
+    """
+    if mode == "live":
+        return
+
+    async def handle(route: AsyncRoute) -> None:
+        request = route.request
+        if mode == "record":
+            response = await route.fetch()
+            headers = {k: v for k, v in response.headers.items() if k.lower() in PERSISTED_HEADERS}
+            store.put(CassetteEntry(request.method, request.url, response.status, headers, await response.text()))
+            await route.fulfill(response=response)
+            return
+        entry = store.get(request.method, request.url)
+        if entry is None:
+            logger.error("No cassette for %s %s", request.method, normalize_url(request.url))
+            await route.abort("internetdisconnected")
+            return
+        await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+
+    await context.route(f"**://{api_host}/**", handle)
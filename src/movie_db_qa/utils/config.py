@@ -1,7 +1,11 @@
 """Configuration management for test framework."""
 
-from dataclasses import dataclass
-from typing import Literal
+import os
+from dataclasses import dataclass, fields
+from typing import Literal, get_args, get_origin
+
+# Prefix for environment variable overrides (e.g. MOVIE_DB_QA_TMDB_MODE=replay)
+ENV_PREFIX = "MOVIE_DB_QA_"
 
 
 @dataclass
@@ -13,26 +17,134 @@ class TestConfig:
         browser: Browser type for Playwright
         headless: Run browser in headless mode
         timeout: Default timeout in milliseconds
+        action_timeout: Maximum wait for a page action's completion condition in milliseconds
         slow_mo: Slow down operations by milliseconds (for debugging)
         expected_results_per_page: Expected number of results per page
+        tmdb_api_host: Host serving the TMDB API used by the application
+        tmdb_mode: TMDB traffic mode (live network, record cassettes, replay cassettes)
+        cassette_dir: Directory holding recorded TMDB cassettes
+        use_stand_in: Serve the SPA snapshot and fake TMDB API from a local server
+        spa_snapshot_dir: Directory holding the SPA bundle snapshot for the stand-in server
+        browser_ws_endpoint: Endpoint of a running browser server to connect to (found automatically
+            when started with ``python -m movie_db_qa.utils.browser_server serve``)
+        browser_prelaunch: Start the browser in the background while pytest collects tests
+        resource_block: Resource types aborted in every context, comma-separated ("image", "media", "font")
+        resource_stub: Resource types answered with a placeholder (e.g. a 1x1 image) instead of downloaded
+        resource_block_hosts: Third-party hosts aborted in every context, comma-separated
+        context_pool_size: Pre-warmed browser contexts to reuse across tests (0 disables pooling)
+        perf_metrics: Collect navigation, paint, heap and per-action timings for every test
+        perf_history_file: JSONL time series the performance samples are appended to
+        perf_history_runs: Most recent runs kept in the time series (0 keeps every run)
+        perf_baseline_file: Stored p50/p95 baseline the run is compared against
+        perf_threshold: Allowed relative slowdown over the baseline (0.2 = 20%)
+        perf_fail_on_regression: Fail the run on a regression instead of warning
+        screenshot_format: Failure screenshot image format
+        screenshot_quality: JPEG quality of failure screenshots (ignored for PNG)
+        screenshot_clip_grid: Clip failure screenshots to the results grid
+        trace_on_failure: Record a Playwright trace chunk per test, kept only for failing/xfail tests
+        trace_screenshots: Include screencast frames in traces (DOM snapshots already show each step)
+        trace_snapshots: Include DOM snapshots in traces
+        trace_baseline_sample: Fraction of tests run untraced as the baseline the overhead is measured against
+        trace_overhead_budget: Estimated tracing overhead (fraction of untraced test time) flagged in the summary
+        test_history: Record every test outcome in a SQLite history and retry only tests with a flaky history
+        test_history_db: SQLite database holding the test history
+        flaky_window: Recent runs per test used to score flakiness
+        flaky_threshold: Flakiness score (share of runs with a transient failure) from which a test is retried
+        flaky_min_runs: Runs a test needs before it can be judged flaky
+        flaky_reruns: Reruns given to flaky tests (requires pytest-rerunfailures)
+        log_mode: Session log to file ("full") or only failing tests' records ("failures")
+        log_buffer_size: Records kept per test for the failure log
+        response_cache: Share TMDB API responses between all contexts of a session (live mode only)
+        response_cache_max_bytes: Byte budget of the response cache (least recently used entries are evicted)
+        response_cache_ttl: Seconds a cached response stays fresh (configuration and genres: a day)
+        warm_start: Seed new contexts from a stored storage state and serve the SPA bundle from a disk cache
+        warm_start_dir: Directory holding the warm-start storage state and response cache
+        impact_call_map: Per-test call map used to select tests affected by a diff
+        impact_max_age_hours: Force a full run (re-recording the call map) once it is older than this
     """
 
     base_url: str = "https://tmdb-discover.surge.sh"
     browser: Literal["chromium", "firefox", "webkit"] = "chromium"
     headless: bool = True
     timeout: int = 30000  # 30 seconds
+    action_timeout: int = 30000  # Same budget as the networkidle waits it replaced
     slow_mo: int = 0  # No slowdown by default
     expected_results_per_page: int = 20  # TMDB shows 20 results per page
+    tmdb_api_host: str = "api.themoviedb.org"
+    tmdb_mode: Literal["live", "record", "replay"] = "live"
+    cassette_dir: str = "tests/cassettes"
+    use_stand_in: bool = False
+    spa_snapshot_dir: str = "tests/fixtures/discover-spa"
+    browser_ws_endpoint: str = ""
+    browser_prelaunch: bool = True
+    resource_block: str = ""
+    resource_stub: str = ""
+    resource_block_hosts: str = ""
+    context_pool_size: int = 0
+    perf_metrics: bool = False
+    perf_history_file: str = "artifacts/perf/history.jsonl"
+    perf_history_runs: int = 50
+    perf_baseline_file: str = "tests/perf-baseline.json"
+    perf_threshold: float = 0.2
+    perf_fail_on_regression: bool = False
+    screenshot_format: Literal["png", "jpeg"] = "png"
+    screenshot_quality: int = 80
+    screenshot_clip_grid: bool = False
+    trace_on_failure: bool = True
+    trace_screenshots: bool = False
+    trace_snapshots: bool = True
+    trace_baseline_sample: float = 0.1
+    trace_overhead_budget: float = 0.05
+    test_history: bool = True
+    test_history_db: str = "artifacts/history/test-history.sqlite"
+    flaky_window: int = 20
+    flaky_threshold: float = 0.1
+    flaky_min_runs: int = 3
+    flaky_reruns: int = 2
+    log_mode: Literal["full", "failures"] = "full"
+    log_buffer_size: int = 5000
+    response_cache: bool = False
+    response_cache_max_bytes: int = 32_000_000
+    response_cache_ttl: float = 300.0
+    warm_start: bool = False
+    warm_start_dir: str = "artifacts/warm-start"
+    impact_call_map: str = "artifacts/impact/call-map.json"
+    impact_max_age_hours: float = 24.0
 
     @classmethod
     def from_env(cls) -> "TestConfig":
         """Create config from environment variables.
 
+        Each scalar field can be overridden with ``MOVIE_DB_QA_<FIELD>``
+        (e.g. ``MOVIE_DB_QA_HEADLESS=false``).
+
         Returns:
             TestConfig instance with values from env vars or defaults
+
+        Raises:
+            ValueError: If a value is not one of a ``Literal`` field's choices
         """
-        return cls()
+        overrides: dict[str, object] = {}
+        for field in fields(cls):
+            raw = os.environ.get(f"{ENV_PREFIX}{field.name.upper()}")
+            if raw is None:
+                continue
+            default = field.default
+            if isinstance(default, bool):
+                overrides[field.name] = raw.strip().lower() in ("1", "true", "yes", "on")
+            elif isinstance(default, int):
+                overrides[field.name] = int(raw)
+            elif isinstance(default, float):
+                overrides[field.name] = float(raw)
+            elif isinstance(default, str):
+                choices = get_args(field.type) if get_origin(field.type) is Literal else ()
+                if choices and raw not in choices:
+                    raise ValueError(
+                        f"{ENV_PREFIX}{field.name.upper()}={raw!r} is not one of {', '.join(map(repr, choices))}"
+                    )
+                overrides[field.name] = raw
+        return cls(**overrides)  # type: ignore[arg-type]
 
 
 # Global config instance
-config = TestConfig()
+config = TestConfig.from_env()
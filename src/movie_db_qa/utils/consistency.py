@@ -0,0 +1,195 @@
+"""DOM-vs-API consistency of rendered result pages.
+
+Joins the TMDB results payload that served a page with a one-shot grid
+snapshot (``DiscoverPage.snapshot_grid``). Cards carry no movie IDs, so they
+are matched to results by poster path (the file name TMDB image URLs end
+with), falling back to the title for results without a poster. Results
+sharing a key (same title, no poster) are matched to cards in rank order. The
+join is a single pass over each side through dict lookups, so checking a page
+costs one grid evaluation plus one payload read, cheap enough for every page
+of a crawl.
+
+Reported per page: results with no card (missing), cards matching no result
+(unexpected), cards repeating a movie (duplicates), cards at another rank than
+their result, and cards whose title differs from the payload.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from movie_db_qa.pages.discover_page import DiscoverPage
+    from movie_db_qa.pages.grid import GridSnapshot, MovieCard
+    from movie_db_qa.utils.api_log import ApiCallLog
+
+
+@dataclass(frozen=True, slots=True)
+class ExpectedMovie:
+    """One result of a TMDB page payload.
+
+    Attributes:
+        rank: Zero-based position in the payload's results
+        id: TMDB movie ID
+        title: Title (``name`` for TV results of the trending endpoints)
+        poster_path: Poster file path (e.g. "/abc.jpg"; "" if none)
+    """
+
+    rank: int
+    id: int
+    title: str
+    poster_path: str
+
+    @property
+    def key(self) -> str:
+        """Join key shared with rendered cards."""
+        return self.poster_path or self.title
+
+
+def poster_path(url: str) -> str:
+    """Reduce a rendered poster URL to TMDB's poster path.
+
+    Args:
+        url: Image URL (e.g. https://image.tmdb.org/t/p/w500/abc.jpg)
+
+    Returns:
+        Poster path ("/abc.jpg"), or "" if the card shows no poster
+    """
+    name = urlsplit(url).path.rsplit("/", 1)[-1]
+    return f"/{name}" if name else ""
+
+
+def expected_movies(payload: dict[str, Any]) -> list[ExpectedMovie]:
+    """Read the results of a TMDB list payload.
+
+    Args:
+        payload: Decoded JSON of a paged TMDB list endpoint
+
+    Returns:
+        Results in rank order
+    """
+    return [
+        ExpectedMovie(
+            rank=rank,
+            id=int(result["id"]),
+            title=result.get("title") or result.get("name") or "",
+            poster_path=result.get("poster_path") or "",
+        )
+        for rank, result in enumerate(payload.get("results", []))
+    ]
+
+
+def _card_key(card: MovieCard) -> str:
+    return poster_path(card.poster_url) or card.title
+
+
+@dataclass
+class ConsistencyReport:
+    """Outcome of comparing one rendered page with its payload.
+
+    Attributes:
+        page: Result page number (None if unknown)
+        ids: Movie ID per card in grid order (None for unmatched cards)
+        missing: Results with no rendered card
+        unexpected: Cards matching no result
+        duplicates: Cards repeating a movie already shown
+        misranked: (result, card) pairs at different positions
+        mistitled: (result, card) pairs whose titles differ
+    """
+
+    page: int | None
+    ids: list[int | None] = field(default_factory=list)
+    missing: list[ExpectedMovie] = field(default_factory=list)
+    unexpected: list[MovieCard] = field(default_factory=list)
+    duplicates: list[MovieCard] = field(default_factory=list)
+    misranked: list[tuple[ExpectedMovie, MovieCard]] = field(default_factory=list)
+    mistitled: list[tuple[ExpectedMovie, MovieCard]] = field(default_factory=list)
+
+    @property
+    def consistent(self) -> bool:
+        """True if the grid shows exactly the payload's results, in order."""
+        return not (self.missing or self.unexpected or self.duplicates or self.misranked or self.mistitled)
+
+    def describe(self) -> str:
+        """Summarize the differences in one line.
+
+        Returns:
+            Human readable summary
+        """
+        label = f"page {self.page}" if self.page is not None else "page"
+        if self.consistent:
+            return f"{label}: {len(self.ids)} cards match the API payload"
+        problems = [
+            f"{len(items)} {name}"
+            for name, items in (
+                ("missing", self.missing),
+                ("unexpected", self.unexpected),
+                ("duplicate", self.duplicates),
+                ("misranked", self.misranked),
+                ("mistitled", self.mistitled),
+            )
+            if items
+        ]
+        return f"{label}: {', '.join(problems)} (cards vs API payload)"
+
+
+def check_consistency(payload: dict[str, Any], grid: GridSnapshot, page: int | None = None) -> ConsistencyReport:
+    """Compare a rendered grid with the payload that served it.
+
+    Args:
+        payload: Decoded TMDB results payload
+        grid: Grid snapshot of the same page
+        page: Page number for the report (defaults to the payload's ``page``)
+
+    Returns:
+        Consistency report
+    """
+    # Results not yet matched to a card, per key in rank order
+    expected: dict[str, deque[ExpectedMovie]] = {}
+    for movie in expected_movies(payload):
+        expected.setdefault(movie.key, deque()).append(movie)
+    matched: dict[str, ExpectedMovie] = {}  # Last result matched per key
+    report = ConsistencyReport(page if page is not None else payload.get("page"))
+    for card in grid:
+        key = _card_key(card)
+        if key not in expected:
+            report.ids.append(None)
+            report.unexpected.append(card)
+            continue
+        if not expected[key]:
+            # Every result with this key already has its card
+            report.ids.append(matched[key].id)
+            report.duplicates.append(card)
+            continue
+        movie = matched[key] = expected[key].popleft()
+        report.ids.append(movie.id)
+        if movie.rank != card.position:
+            report.misranked.append((movie, card))
+        if movie.title != card.title:
+            report.mistitled.append((movie, card))
+    report.missing = sorted((movie for movies in expected.values() for movie in movies), key=lambda movie: movie.rank)
+    return report
+
+
+def check_page(discover: DiscoverPage, api_calls: ApiCallLog) -> ConsistencyReport:
+    """Check the page currently shown against its captured TMDB response.
+
+    Args:
+        discover: Page object showing a results page
+        api_calls: Call log of the same page
+
+    Returns:
+        Consistency report
+
+    Raises:
+        LookupError: If no successful results call was captured for the page
+    """
+    page_number = discover.get_current_page()
+    # The first page may be requested without a page parameter
+    calls = [call for call in api_calls if call.category and call.status == 200 and (call.page or 1) == page_number]
+    if not calls:
+        raise LookupError(f"No TMDB results response captured for page {page_number}")
+    return check_consistency(calls[-1].payload(), discover.snapshot_grid(), page_number)
@@ -0,0 +1,172 @@
+"""Pool of pre-warmed browser contexts reused across tests.
+
+Creating and closing a context per test sits on the critical path. The pool
+creates contexts ahead of time, resets them when a test releases them
+(pages, routes, cookies, permissions, offline mode, geolocation, HTTP cache)
+and hands them out again. A context that still holds origin storage after
+reset, or whose HTTP cache cannot be cleared, is discarded rather than reused,
+so isolation is the same as a fresh ``browser.new_context()``. Discarded
+contexts are not replaced on release; the next ``acquire`` that finds the pool
+empty creates one, and its release refills the pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext
+
+
+@dataclass
+class PoolStats:
+    """Context pool counters.
+
+    Attributes:
+        hits: Acquisitions served from a pre-warmed context
+        misses: Acquisitions that had to create a context
+        resets: Contexts reset and returned to the pool
+        discards: Contexts closed instead of reused (dirty storage, uncleared cache or reset error)
+        reset_seconds: Total time spent resetting contexts
+    """
+
+    hits: int = 0
+    misses: int = 0
+    resets: int = 0
+    discards: int = 0
+    reset_seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Format counters for the terminal summary.
+
+        Returns:
+            One-line human readable summary
+        """
+        mean_ms = self.reset_seconds * 1000 / self.resets if self.resets else 0.0
+        return (
+            f"context pool: {self.hits} hits, {self.misses} misses, {self.resets} resets "
+            f"({mean_ms:.1f} ms avg), {self.discards} discards"
+        )
+
+
+class ContextPool:
+    """Pre-warmed pool of browser contexts with reset-on-release."""
+
+    def __init__(self, browser: Browser, size: int, **context_options: Any) -> None:
+        """Initialize context pool.
+
+        Args:
+            browser: Browser that owns the pooled contexts
+            size: Number of idle contexts to keep warm
+            **context_options: Options passed to ``browser.new_context``
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.browser = browser
+        self.size = size
+        self.context_options = context_options
+        self.stats = PoolStats()
+        self._idle: list[BrowserContext] = []
+
+    def prewarm(self) -> None:
+        """Create contexts until the pool holds ``size`` idle contexts."""
+        while len(self._idle) < self.size:
+            self._idle.append(self.browser.new_context(**self.context_options))
+        self.logger.info("Context pool pre-warmed with %d contexts", len(self._idle))
+
+    def acquire(self) -> BrowserContext:
+        """Hand out a clean context.
+
+        Returns:
+            Pre-warmed context, or a newly created one if the pool is empty
+            (e.g. after a discard)
+        """
+        if self._idle:
+            self.stats.hits += 1
+            return self._idle.pop()
+        self.stats.misses += 1
+        return self.browser.new_context(**self.context_options)
+
+    def release(self, context: BrowserContext) -> None:
+        """Reset a context and return it to the pool, or close it if it cannot be reused.
+
+        Args:
+            context: Context previously returned by ``acquire``
+        """
+        if len(self._idle) >= self.size:
+            context.close()
+            return
+
+        started = time.perf_counter()
+        try:
+            clean = self._reset(context)
+        except Exception:
+            self.logger.warning("Context reset failed, discarding context", exc_info=True)
+            clean = False
+        self.stats.reset_seconds += time.perf_counter() - started
+
+        if clean:
+            self.stats.resets += 1
+            self._idle.append(context)
+        else:
+            self.stats.discards += 1
+            context.close()
+
+    def close(self) -> None:
+        """Close every idle context."""
+        for context in self._idle:
+            context.close()
+        self._idle.clear()
+
+    @staticmethod
+    def _reset(context: BrowserContext) -> bool:
+        """Clear per-test state from a context.
+
+        Closing pages also drops their event listeners and sessionStorage.
+
+        Args:
+            context: Context to reset
+
+        Returns:
+            True if the context is clean enough to reuse
+        """
+        cache_cleared = _clear_http_cache(context)
+        for page in list(context.pages):
+            page.close()
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers({})
+        context.set_offline(False)
+        context.set_geolocation(None)
+        if not cache_cleared:
+            return False
+        # localStorage/IndexedDB can only be cleared from a page on the origin,
+        # so a context that picked any up is replaced instead of reused
+        return not context.storage_state()["origins"]
+
+
+def _clear_http_cache(context: BrowserContext) -> bool:
+    """Clear a context's HTTP cache through the Chrome DevTools Protocol.
+
+    The cache is only reachable through a page's CDP session, so a page is
+    opened when the test already closed its own (the caller closes it).
+
+    Args:
+        context: Context whose cache is cleared
+
+    Returns:
+        False if the browser has no CDP (Firefox, WebKit)
+    """
+    browser = context.browser
+    if browser is None or browser.browser_type.name != "chromium":
+        return False
+    page = context.pages[0] if context.pages else context.new_page()
+    session = context.new_cdp_session(page)
+    try:
+        session.send("Network.clearBrowserCache")
+    finally:
+        session.detach()
+    return True
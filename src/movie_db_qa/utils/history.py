@@ -0,0 +1,230 @@
+"""Persistent test history with flakiness scores.
+
+Every test's outcome, duration, xfail state and linked defect is appended to a
+local SQLite database (one row per attempt). Rows are buffered during the run
+and written in one transaction at session end; xdist workers write their own
+rows, serialized by SQLite's file lock.
+
+A test's flakiness score is the share of its recent runs that failed
+transiently: a failed attempt that passed on retry in the same run, or a
+single failed run that the next run recovered from (pass -> fail -> pass).
+Failure streaks of two or more runs never score, whether they end in a fix
+(fail, fail, ..., pass) or are still going, and a test that failed its last
+``min_runs`` runs is a confirmed failure even with flips earlier in the
+window: a real regression is never retried and fails fast; only tests whose
+history shows flakiness get reruns.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+from collections import defaultdict
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Defect ids referenced by xfail reasons and test docstrings
+DEFECT = re.compile(r"\bDEF-\d+\b")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    xfail INTEGER NOT NULL,
+    defect TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_node ON results (node_id, recorded_at);
+"""
+
+
+def find_defect(*texts: str | None) -> str | None:
+    """Find the first defect id in xfail reasons or docstrings.
+
+    Args:
+        *texts: Texts to search in order
+
+    Returns:
+        Defect id (e.g. "DEF-007"), or None
+    """
+    for text in texts:
+        match = DEFECT.search(text or "")
+        if match:
+            return match.group()
+    return None
+
+
+@dataclass(frozen=True)
+class ResultRecord:
+    """One attempt of one test.
+
+    Attributes:
+        run_id: Run the attempt belongs to
+        node_id: Test node id
+        attempt: Attempt number within the run (1 unless retried)
+        outcome: "passed", "failed" or "skipped"
+        duration: Call phase duration in seconds
+        xfail: Whether the test is an expected failure (xfailed or xpassed)
+        defect: Linked defect id, if any
+        recorded_at: Unix time of the attempt
+    """
+
+    run_id: str
+    node_id: str
+    attempt: int
+    outcome: str
+    duration: float
+    xfail: bool
+    defect: str | None
+    recorded_at: float
+
+
+@dataclass(frozen=True)
+class FlakinessScore:
+    """Flakiness of one test over its recent runs.
+
+    Attributes:
+        node_id: Test node id
+        runs: Runs considered (xfail and skipped runs excluded)
+        failures: Runs whose final attempt failed
+        retry_passes: Runs that failed an attempt and then passed
+        transient_failures: Single failed runs between two passing runs
+        failing_streak: Consecutive failed runs up to the most recent one
+    """
+
+    node_id: str
+    runs: int
+    failures: int
+    retry_passes: int
+    transient_failures: int
+    failing_streak: int = 0
+
+    @property
+    def score(self) -> float:
+        """Share of runs with a transient failure (0 = never flaked)."""
+        return (self.retry_passes + self.transient_failures) / self.runs if self.runs else 0.0
+
+    def flaky(self, threshold: float, min_runs: int) -> bool:
+        """Whether the history justifies retrying the test.
+
+        Args:
+            threshold: Minimum score
+            min_runs: Minimum number of runs before a test can be judged
+
+        Returns:
+            True if the test is flaky (never for a test that failed its last ``min_runs`` runs)
+        """
+        return self.runs >= min_runs and self.score >= threshold and not self.failing(min_runs)
+
+    def failing(self, min_runs: int) -> bool:
+        """Whether the test is a confirmed failure.
+
+        Args:
+            min_runs: Consecutive failed runs that confirm it
+
+        Returns:
+            True if the most recent ``min_runs`` runs all failed
+        """
+        return self.failing_streak >= min_runs
+
+
+def score_runs(node_id: str, runs: list[list[str]]) -> FlakinessScore:
+    """Score a test from its attempts per run.
+
+    Args:
+        node_id: Test node id
+        runs: Attempt outcomes per run, oldest run first
+
+    Returns:
+        Flakiness score
+    """
+    finals = [attempts[-1] for attempts in runs]
+    retry_passes = sum(1 for attempts in runs if attempts[-1] == "passed" and "failed" in attempts)
+    # Only a failed run between two passes counts: the window may cut a longer streak at either end
+    transient = sum(
+        1 for index in range(1, len(finals) - 1) if finals[index - 1 : index + 2] == ["passed", "failed", "passed"]
+    )
+    streak = next((count for count, final in enumerate(reversed(finals)) if final != "failed"), len(finals))
+    return FlakinessScore(node_id, len(runs), finals.count("failed"), retry_passes, transient, streak)
+
+
+class HistoryStore:
+    """SQLite store of test results."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize store (the database is created on first write).
+
+        Args:
+            path: Database file
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        self.pending: list[ResultRecord] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def record(self, result: ResultRecord) -> None:
+        """Buffer a result until ``flush``.
+
+        Args:
+            result: Attempt to store
+        """
+        self.pending.append(result)
+
+    def flush(self) -> int:
+        """Write buffered results in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        if not self.pending:
+            return 0
+        columns = ", ".join(field.name for field in fields(ResultRecord))
+        placeholders = ", ".join("?" for _ in fields(ResultRecord))
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    f"INSERT INTO results ({columns}) VALUES ({placeholders})",
+                    [astuple(result) for result in self.pending],
+                )
+        finally:
+            connection.close()
+        written = len(self.pending)
+        self.pending.clear()
+        self.logger.info("Recorded %d test results in %s", written, self.path)
+        return written
+
+    def scores(self, window: int) -> dict[str, FlakinessScore]:
+        """Score every test from its most recent runs.
+
+        Args:
+            window: Runs per test to consider
+
+        Returns:
+            Node id -> flakiness score (tests with no scorable runs omitted)
+        """
+        if not self.path.exists():
+            return {}
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT node_id, run_id, outcome FROM results"
+                " WHERE xfail = 0 AND outcome != 'skipped' ORDER BY recorded_at, attempt"
+            ).fetchall()
+        finally:
+            connection.close()
+        attempts: dict[str, dict[str, list[str]]] = defaultdict(dict)
+        for node_id, run_id, outcome in rows:
+            attempts[node_id].setdefault(run_id, []).append(outcome)
+        return {node_id: score_runs(node_id, list(runs.values())[-window:]) for node_id, runs in attempts.items()}
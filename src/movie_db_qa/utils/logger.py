@@ -1,14 +1,172 @@
 """Logging configuration for test framework."""
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from collections import deque
 from pathlib import Path
 
+# Listeners started by ``start_queue_logging`` -> (logger, queue handler) they serve
+_listeners: dict[logging.handlers.QueueListener, tuple[logging.Logger, logging.Handler]] = {}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a record.
+
+        Args:
+            record: Log record
+
+        Returns:
+            JSON line with timestamp, level, logger, message and traceback
+        """
+        entry = {
+            "ts": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RingBufferHandler(logging.Handler):
+    """Keep the most recent records in memory until asked to flush them.
+
+    Copies of the records are frozen on arrival (message merged, traceback
+    rendered) so they stay correct if their arguments change later, while
+    the originals reach the other handlers untouched.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of records kept (oldest are dropped)
+        """
+        super().__init__()
+        self.buffer: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record.
+
+        Args:
+            record: Log record
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.buffer.append(record)
+
+    def clear(self) -> None:
+        """Drop all buffered records."""
+        self.buffer.clear()
+
+    def flush_to(self, path: str | Path, formatter: logging.Formatter | None = None) -> int:
+        """Write buffered records to a file and clear the buffer.
+
+        Args:
+            path: Destination file (JSONL by default)
+            formatter: Formatter per record (defaults to ``JsonLinesFormatter``)
+
+        Returns:
+            Number of records written
+        """
+        formatter = formatter or JsonLinesFormatter()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        count = len(self.buffer)
+        path.write_text("".join(formatter.format(record) + "\n" for record in self.buffer), encoding="utf-8")
+        self.clear()
+        return count
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the traceback apart from the message.
+
+    ``QueueHandler.prepare`` formats the record, folding the traceback into
+    ``message``; here the message is only merged with its arguments and the
+    traceback is rendered into ``exc_text``, so formatters on the listener
+    side still see it as a traceback.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make a copy of the record that is safe to hand to another thread.
+
+        Args:
+            record: Log record
+
+        Returns:
+            Copy with the message merged and the traceback rendered
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.message = record.msg
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def start_queue_logging(logger: logging.Logger, *handlers: logging.Handler) -> logging.handlers.QueueListener:
+    """Move handler I/O off the calling thread.
+
+    The logger gets a ``StructuredQueueHandler``; a listener thread drains
+    the queue into ``handlers``.
+
+    Args:
+        logger: Logger to attach the queue handler to
+        *handlers: Handlers doing the actual writes
+
+    Returns:
+        Running listener (stop it with ``stop_queue_logging``)
+    """
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(records)
+    logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[listener] = (logger, queue_handler)
+    return listener
+
+
+def stop_queue_logging(listener: logging.handlers.QueueListener | None = None) -> None:
+    """Drain and stop queue listeners, then detach and close their handlers.
+
+    Args:
+        listener: Listener to stop (all running listeners if None)
+    """
+    for running in [listener] if listener is not None else list(_listeners):
+        if running not in _listeners:
+            continue
+        logger, queue_handler = _listeners.pop(running)
+        logger.removeHandler(queue_handler)
+        running.stop()
+        for handler in running.handlers:
+            handler.close()
+
+
+atexit.register(stop_queue_logging)
+
 
 def setup_logger(
     name: str,
     level: int = logging.WARNING,
     log_file: str | None = None,
+    async_mode: bool = False,
 ) -> logging.Logger:
     """Configure and return a logger instance.
 
@@ -16,6 +174,8 @@ def setup_logger(
         name: Logger name (usually __name__)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs
+        async_mode: Write through a queue on a background thread; the log
+            file gets structured JSONL instead of text
 
     Returns:
         Configured logger instance
@@ -37,7 +197,7 @@ def setup_logger(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (optional)
     if log_file:
@@ -46,8 +206,14 @@ def setup_logger(
 
         file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(JsonLinesFormatter() if async_mode else formatter)
+        handlers.append(file_handler)
+
+    if async_mode:
+        start_queue_logging(logger, *handlers)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
@@ -0,0 +1,350 @@
+"""Web performance metrics capture and baseline regression checks.
+
+When enabled, every test page records Navigation Timing, first/largest
+contentful paint, JS heap size and the duration of each page object action
+(e.g. filter click until the grid re-rendered). Samples are appended to a
+JSONL time series; at the end of a run the p50/p95 of each metric are
+compared against a stored baseline.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from movie_db_qa.pages.waits import ActionTiming
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Init script: buffer paint and LCP entries from the first paint onwards
+PERF_OBSERVER_JS = """
+(() => {
+    window.__mdqPerf = {fcp: null, lcp: null};
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                if (entry.name === 'first-contentful-paint') window.__mdqPerf.fcp = entry.startTime;
+            }
+        }).observe({type: 'paint', buffered: true});
+        new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            window.__mdqPerf.lcp = entries[entries.length - 1].startTime;
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+    } catch (e) {
+        // Entry type not supported by this browser: leave metrics unset
+    }
+})();
+"""
+
+# Navigation timing, paint and heap in one evaluation (null when unavailable)
+READ_PERF_JS = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const perf = window.__mdqPerf || {};
+    return {
+        'nav.ttfb': nav ? nav.responseStart - nav.requestStart : null,
+        'nav.dom_content_loaded': nav ? nav.domContentLoadedEventEnd : null,
+        'nav.load': nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : null,
+        'paint.fcp': perf.fcp ?? null,
+        'paint.lcp': perf.lcp ?? null,
+        'memory.js_heap_used': performance.memory ? performance.memory.usedJSHeapSize : null,
+    };
+}
+"""
+
+# Statistics compared against the baseline
+STATS = ("p50", "p95")
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Compute a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value
+
+    Raises:
+        ValueError: If ``values`` is empty
+    """
+    if not values:
+        raise ValueError("percentile of empty sequence")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def metric_unit(metric: str) -> str:
+    """Get the unit of a metric from its name.
+
+    Args:
+        metric: Metric name
+
+    Returns:
+        "bytes" for memory metrics, "ms" otherwise
+    """
+    return "bytes" if metric.startswith("memory.") else "ms"
+
+
+@dataclass
+class PerfSample:
+    """One metric value measured during a test.
+
+    Attributes:
+        run_id: Identifier shared by every sample of one test run
+        timestamp: Unix time the sample was taken
+        test: Test node id
+        metric: Metric name (e.g. "paint.lcp", "action.select_trend_filter")
+        value: Metric value (milliseconds or bytes, see ``metric_unit``)
+    """
+
+    run_id: str
+    timestamp: float
+    test: str
+    metric: str
+    value: float
+
+
+@dataclass
+class Regression:
+    """A metric statistic that exceeds its baseline by more than the threshold.
+
+    Attributes:
+        metric: Metric name
+        stat: Statistic name (p50, p95)
+        baseline: Baseline value
+        current: Value in this run
+    """
+
+    metric: str
+    stat: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to the baseline."""
+        return self.current / self.baseline if self.baseline else math.inf
+
+    def describe(self) -> str:
+        """Describe the regression for reports.
+
+        Returns:
+            Single line description
+        """
+        unit = metric_unit(self.metric)
+        return (
+            f"{self.metric} {self.stat}: {self.current:.1f} {unit} "
+            f"vs baseline {self.baseline:.1f} {unit} (+{(self.ratio - 1) * 100:.0f}%)"
+        )
+
+
+class PerfRecorder:
+    """Collect performance samples for the tests of one process."""
+
+    def __init__(self, run_id: str) -> None:
+        """Initialize recorder.
+
+        Args:
+            run_id: Identifier shared by every sample of this run
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.run_id = run_id
+        self.samples: list[PerfSample] = []
+
+    @staticmethod
+    def install(page: Page) -> None:
+        """Start buffering paint and LCP entries on a page.
+
+        Must run before the first navigation of the page.
+
+        Args:
+            page: Page to observe
+        """
+        page.add_init_script(PERF_OBSERVER_JS)
+
+    def add(self, test: str, metric: str, value: float) -> None:
+        """Record one sample.
+
+        Args:
+            test: Test node id
+            metric: Metric name
+            value: Metric value
+        """
+        self.samples.append(PerfSample(self.run_id, time.time(), test, metric, value))
+
+    def collect(self, page: Page, test: str, timings: Iterable[ActionTiming] = ()) -> None:
+        """Record page metrics and page object action timings of a test.
+
+        Timed-out actions are skipped: their duration is the timeout, not the app.
+
+        Args:
+            page: Page the test used
+            test: Test node id
+            timings: Action timings of the test's page objects
+        """
+        for timing in timings:
+            if not timing.timed_out:
+                self.add(test, f"action.{timing.action}", timing.elapsed_ms)
+        if page.url in ("", "about:blank"):
+            return
+        for metric, value in page.evaluate(READ_PERF_JS).items():
+            if value is not None:
+                self.add(test, metric, float(value))
+
+    def write(self, path: str | Path) -> int:
+        """Append the recorded samples to a JSONL time series.
+
+        Args:
+            path: Time series file
+
+        Returns:
+            Number of samples written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One write per process keeps lines from parallel workers intact
+        lines = "".join(json.dumps(asdict(sample), separators=(",", ":")) + "\n" for sample in self.samples)
+        with path.open("a", encoding="utf-8") as history:
+            history.write(lines)
+        self.logger.info("Appended %d performance samples to %s", len(self.samples), path)
+        return len(self.samples)
+
+
+def load_samples(path: str | Path, run_id: str | None = None) -> list[PerfSample]:
+    """Read samples from a JSONL time series.
+
+    Args:
+        path: Time series file
+        run_id: Only return samples of this run
+
+    Returns:
+        Samples in file order (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    samples = []
+    with path.open(encoding="utf-8") as history:
+        for line in history:
+            if line.strip():
+                sample = PerfSample(**json.loads(line))
+                if run_id is None or sample.run_id == run_id:
+                    samples.append(sample)
+    return samples
+
+
+def prune_history(path: str | Path, keep_runs: int) -> int:
+    """Drop all but the most recent runs from a JSONL time series.
+
+    Runs are ordered by their first line in the file; the file is replaced
+    atomically, so a reader never sees a half-written series.
+
+    Args:
+        path: Time series file
+        keep_runs: Number of runs to keep (0 keeps every run)
+
+    Returns:
+        Number of runs dropped
+    """
+    path = Path(path)
+    if keep_runs <= 0 or not path.exists():
+        return 0
+    lines = [line for line in path.read_text(encoding="utf-8").splitlines(keepends=True) if line.strip()]
+    run_ids = [json.loads(line)["run_id"] for line in lines]
+    runs = list(dict.fromkeys(run_ids))
+    if len(runs) <= keep_runs:
+        return 0
+    kept = set(runs[-keep_runs:])
+    pruned = path.with_suffix(f"{path.suffix}.tmp")
+    recent = "".join(line for line, run_id in zip(lines, run_ids, strict=True) if run_id in kept)
+    pruned.write_text(recent, encoding="utf-8")
+    pruned.replace(path)
+    return len(runs) - keep_runs
+
+
+def summarize(samples: Iterable[PerfSample]) -> dict[str, dict[str, float]]:
+    """Summarize samples per metric.
+
+    Args:
+        samples: Samples to summarize
+
+    Returns:
+        Metric -> {n, p50, p95}
+    """
+    values: dict[str, list[float]] = defaultdict(list)
+    for sample in samples:
+        values[sample.metric].append(sample.value)
+    return {
+        metric: {"n": len(series), "p50": percentile(series, 50), "p95": percentile(series, 95)}
+        for metric, series in sorted(values.items())
+    }
+
+
+def load_baseline(path: str | Path) -> dict[str, dict[str, float]]:
+    """Read a stored baseline.
+
+    Args:
+        path: Baseline JSON file
+
+    Returns:
+        Metric -> {n, p50, p95} (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    baseline: dict[str, dict[str, float]] = json.loads(path.read_text(encoding="utf-8"))
+    return baseline
+
+
+def save_baseline(summary: dict[str, dict[str, float]], path: str | Path) -> None:
+    """Store a run summary as the new baseline.
+
+    Args:
+        summary: Output of ``summarize``
+        path: Baseline JSON file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(
+    summary: dict[str, dict[str, float]],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[Regression]:
+    """Find statistics that exceed their baseline by more than the threshold.
+
+    Metrics missing from either side are ignored.
+
+    Args:
+        summary: Output of ``summarize`` for the current run
+        baseline: Stored baseline
+        threshold: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        Regressions, ordered by metric
+    """
+    regressions = []
+    for metric, current in summary.items():
+        reference = baseline.get(metric)
+        if reference is None:
+            continue
+        for stat in STATS:
+            if stat in reference and current[stat] > reference[stat] * (1 + threshold):
+                regressions.append(Regression(metric, stat, reference[stat], current[stat]))
+    return regressions
@@ -0,0 +1,248 @@
+"""Resource-blocking policy for browser contexts.
+
+Images, media and fonts are intercepted by file extension, so only those
+requests (and requests to blocked third-party hosts) reach Python; everything
+else never leaves the browser. A matched request is aborted ("block") or
+answered with a tiny placeholder ("stub") - a stubbed poster still fires its
+``load`` event, so layouts that wait for images keep working.
+
+Blocked responses are never downloaded, so the bytes saved are estimated from
+typical sizes per resource type.
+
+Config (``TestConfig``):
+    resource_block=font,media       # resource types aborted
+    resource_stub=image             # resource types served a placeholder
+    resource_block_hosts=a.com,b.io # third-party hosts aborted
+
+Tests override the configured policy with ``@pytest.mark.resources(...)``
+(``block``, ``stub`` and ``hosts`` keywords); a bare ``resources`` marker lets
+everything through.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import BrowserContext, Route
+
+    from movie_db_qa.utils.config import TestConfig
+
+logger = logging.getLogger(__name__)
+
+# File extensions identifying each blockable resource type
+RESOURCE_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+}
+
+# Typical transfer sizes used to estimate bytes saved (a w500 TMDB poster is ~40 KB)
+ESTIMATED_BYTES: dict[str, int] = {"image": 40_000, "media": 500_000, "font": 30_000, "host": 20_000}
+
+# 1x1 transparent GIF
+_PIXEL = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+# Placeholder responses for stubbed resource types
+STUBS: dict[str, tuple[str, bytes]] = {
+    "image": ("image/gif", _PIXEL),
+    "media": ("video/mp4", b""),
+    "font": ("font/woff2", b""),
+}
+
+
+def _split(value: str | tuple[str, ...] | list[str]) -> frozenset[str]:
+    """Parse a comma-separated config value (or a marker's sequence)."""
+    items = value.split(",") if isinstance(value, str) else value
+    return frozenset(item.strip().lower() for item in items if item.strip())
+
+
+@dataclass
+class ResourceStats:
+    """Resource policy counters.
+
+    Attributes:
+        blocked: Aborted requests per resource type ("host" for blocked hosts)
+        stubbed: Placeholder responses per resource type
+        bytes_saved: Estimated transfer avoided
+    """
+
+    blocked: Counter[str] = field(default_factory=Counter)
+    stubbed: Counter[str] = field(default_factory=Counter)
+    bytes_saved: int = 0
+
+    def record(self, kind: str, stubbed: bool) -> None:
+        """Count one intercepted request.
+
+        Args:
+            kind: Resource type, or "host" for a blocked third-party host
+            stubbed: Whether a placeholder was served instead of aborting
+        """
+        (self.stubbed if stubbed else self.blocked)[kind] += 1
+        self.bytes_saved += ESTIMATED_BYTES.get(kind, 0) - (len(STUBS[kind][1]) if stubbed else 0)
+
+    def summary(self) -> str:
+        """Summarize the counters in one line.
+
+        Returns:
+            Human readable summary
+        """
+        parts = [f"{kind} {count}" for kind, count in sorted((self.blocked + self.stubbed).items())]
+        total = sum(self.blocked.values()) + sum(self.stubbed.values())
+        return (
+            f"Resource policy: {total} requests intercepted ({', '.join(parts) or 'none'}; "
+            f"{sum(self.stubbed.values())} stubbed), ~{self.bytes_saved / 1_000_000:.1f} MB saved (estimated)"
+        )
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Which requests a context aborts or stubs.
+
+    Attributes:
+        block: Resource types to abort ("image", "media", "font")
+        stub: Resource types to answer with a placeholder
+        hosts: Third-party hosts to abort (subdomains included)
+    """
+
+    block: frozenset[str] = frozenset()
+    stub: frozenset[str] = frozenset()
+    hosts: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        """Reject resource types that have no extension route."""
+        unknown = (self.block | self.stub) - RESOURCE_EXTENSIONS.keys()
+        if unknown:
+            raise ValueError(f"Unknown resource types {sorted(unknown)}; expected {sorted(RESOURCE_EXTENSIONS)}")
+
+    @classmethod
+    def from_config(cls, config: TestConfig) -> ResourcePolicy:
+        """Build the policy configured on ``TestConfig``.
+
+        Args:
+            config: Framework configuration
+
+        Returns:
+            Configured policy
+        """
+        return cls(_split(config.resource_block), _split(config.resource_stub), _split(config.resource_block_hosts))
+
+    @classmethod
+    def from_marker(cls, **kwargs: str | tuple[str, ...] | list[str]) -> ResourcePolicy:
+        """Build a test's policy from its ``resources`` marker keywords.
+
+        Args:
+            **kwargs: ``block``, ``stub`` and ``hosts`` (comma-separated or sequences)
+
+        Returns:
+            Policy for the test (a bare marker allows everything)
+        """
+        return cls(
+            _split(kwargs.get("block", ())),
+            _split(kwargs.get("stub", ())),
+            _split(kwargs.get("hosts", ())),
+        )
+
+    @property
+    def active(self) -> bool:
+        """Whether the policy intercepts anything."""
+        return bool(self.block or self.stub or self.hosts)
+
+    def routes(self) -> dict[str, str]:
+        """URL globs to intercept.
+
+        Returns:
+            Glob -> resource type ("host" for blocked hosts)
+        """
+        patterns = {f"**/*.{{{','.join(RESOURCE_EXTENSIONS[kind])}}}*": kind for kind in sorted(self.block | self.stub)}
+        for host in sorted(self.hosts):
+            patterns[f"**://{host}/**"] = "host"
+            patterns[f"**://*.{host}/**"] = "host"
+        return patterns
+
+    def action(self, kind: str, resource_type: str) -> str | None:
+        """Decide what to do with an intercepted request.
+
+        Args:
+            kind: Resource type the matching route was installed for
+            resource_type: Playwright's resource type of the request
+
+        Returns:
+            "block", "stub", or None to let the request through (an extension
+            match the browser does not load as that type, e.g. an image fetched
+            by a script)
+        """
+        if kind == "host":
+            return "block"
+        if resource_type != kind:
+            return None
+        return "stub" if kind in self.stub else "block"
+
+
+def install_resource_policy(
+    context: BrowserContext,
+    policy: ResourcePolicy,
+    stats: ResourceStats | None = None,
+) -> None:
+    """Route a context's requests through the resource policy.
+
+    Register after the TMDB routes: routes registered last are consulted
+    first, and requests the policy lets through fall back to earlier ones.
+
+    Args:
+        context: Browser context to install the routes on
+        policy: Policy to apply
+        stats: Counters to update (optional)
+    """
+    for pattern, kind in policy.routes().items():
+
+        def handle(route: Route, kind: str = kind) -> None:
+            action = policy.action(kind, route.request.resource_type)
+            if action is None:
+                route.fallback()
+                return
+            if stats is not None:
+                stats.record(kind, action == "stub")
+            if action == "stub":
+                content_type, body = STUBS[kind]
+                route.fulfill(status=200, content_type=content_type, body=body)
+            else:
+                route.abort("blockedbyclient")
+
+        context.route(pattern, handle)
+
+
+async def install_resource_policy_async(
+    context: AsyncBrowserContext,
+    policy: ResourcePolicy,
+    stats: ResourceStats | None = None,
+) -> None:
+    """Async twin of ``install_resource_policy``.
+
+    Args:
+        context: Async browser context to install the routes on
+        policy: Policy to apply
+        stats: Counters to update (optional)
+    """
+    for pattern, kind in policy.routes().items():
+
+        async def handle(route: AsyncRoute, kind: str = kind) -> None:
+            action = policy.action(kind, route.request.resource_type)
+            if action is None:
+                await route.fallback()
+                return
+            if stats is not None:
+                stats.record(kind, action == "stub")
+            if action == "stub":
+                content_type, body = STUBS[kind]
+                await route.fulfill(status=200, content_type=content_type, body=body)
+            else:
+                await route.abort("blockedbyclient")
+
+        await context.route(pattern, handle)
@@ -0,0 +1,233 @@
+"""Session-wide in-memory cache of TMDB API responses.
+
+Every context gets fresh cookies and storage, but ``DiscoverPage.load()``
+fetches the same ``/movie/popular``, configuration and genre payloads in
+each of them. The cache is shared by all contexts of a session (one per
+xdist worker) and installed as a TMDB-host route, so isolation of browser
+state is unchanged while duplicate API traffic is served from memory.
+
+Entries are keyed by normalized URL (``cassette.normalize_url``), expire
+after a per-endpoint TTL and are evicted least recently used first once the
+cached bodies exceed the byte budget.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from movie_db_qa.utils.cassette import PERSISTED_HEADERS, normalize_url
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import BrowserContext, Route
+
+logger = logging.getLogger(__name__)
+
+# TTL in seconds per endpoint path prefix (first match wins); other endpoints use the default TTL
+ENDPOINT_TTLS: tuple[tuple[str, float], ...] = (
+    ("/3/configuration", 24 * 3600.0),
+    ("/3/genre/", 24 * 3600.0),
+)
+
+
+@dataclass
+class CachedResponse:
+    """A cached TMDB response.
+
+    Attributes:
+        status: HTTP status
+        headers: Persisted response headers
+        body: Response body
+        expires_at: Clock time after which the entry is stale
+    """
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    expires_at: float
+
+
+@dataclass
+class ResponseCacheStats:
+    """Response cache counters.
+
+    Attributes:
+        hits: Requests served from the cache
+        misses: Requests fetched from the network (expired entries included)
+        expired: Entries dropped because their TTL ran out
+        evictions: Entries dropped to stay within the byte budget
+        bytes_served: Body bytes served from the cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """Summarize the counters in one line.
+
+        Returns:
+            Human readable summary
+        """
+        return (
+            f"Response cache: {self.hits} hits, {self.misses} misses ({self.hit_ratio:.0%} hit ratio), "
+            f"{self.expired} expired, {self.evictions} evicted, {self.bytes_served / 1_000_000:.1f} MB served"
+        )
+
+
+class ResponseCache:
+    """Byte-bounded LRU cache of TMDB responses with per-endpoint TTLs."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        default_ttl: float,
+        ttls: tuple[tuple[str, float], ...] = ENDPOINT_TTLS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            max_bytes: Budget for the cached bodies
+            default_ttl: TTL in seconds for endpoints not listed in ``ttls``
+            ttls: (path prefix, TTL in seconds) pairs
+            clock: Time source (monotonic seconds)
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = ttls
+        self.clock = clock
+        self.stats = ResponseCacheStats()
+        self.size = 0
+        # Least recently used first
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+    def ttl(self, url: str) -> float:
+        """TTL of a URL's endpoint.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            TTL in seconds
+        """
+        path = urlsplit(url).path
+        return next((ttl for prefix, ttl in self.ttls if path.startswith(prefix)), self.default_ttl)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Look up a fresh response, marking it most recently used.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = normalize_url(url)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self.clock():
+            self._drop(key)
+            self.stats.expired += 1
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        self.stats.bytes_served += len(entry.body)
+        return entry
+
+    def put(self, url: str, status: int, headers: dict[str, str], body: bytes) -> bool:
+        """Store a response, evicting least recently used entries as needed.
+
+        Args:
+            url: Request URL
+            status: HTTP status
+            headers: Response headers (only persisted ones are kept)
+            body: Response body
+
+        Returns:
+            False if the body alone exceeds the byte budget (not cached)
+        """
+        if len(body) > self.max_bytes:
+            return False
+        key = normalize_url(url)
+        if key in self._entries:
+            self._drop(key)
+        while self._entries and self.size + len(body) > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.stats.evictions += 1
+        kept = {name: value for name, value in headers.items() if name.lower() in PERSISTED_HEADERS}
+        self._entries[key] = CachedResponse(status, kept, body, self.clock() + self.ttl(url))
+        self.size += len(body)
+        return True
+
+    def _drop(self, key: str) -> None:
+        self.size -= len(self._entries.pop(key).body)
+
+    def install(self, context: BrowserContext, api_host: str) -> None:
+        """Serve a context's TMDB GET requests from the cache.
+
+        Args:
+            context: Context to install the route on
+            api_host: TMDB API host
+        """
+
+        def handle(route: Route) -> None:
+            request = route.request
+            if request.method != "GET":
+                route.fallback()
+                return
+            entry = self.get(request.url)
+            if entry is not None:
+                route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+                return
+            response = route.fetch()
+            if response.ok:
+                self.put(request.url, response.status, response.headers, response.body())
+            route.fulfill(response=response)
+
+        context.route(f"**://{api_host}/**", handle)
+
+    async def install_async(self, context: AsyncBrowserContext, api_host: str) -> None:
+        """Async twin of ``install``.
+
+        Args:
+            context: Async browser context to install the route on
+            api_host: TMDB API host
+        """
+
+        async def handle(route: AsyncRoute) -> None:
+            request = route.request
+            if request.method != "GET":
+                await route.fallback()
+                return
+            entry = self.get(request.url)
+            if entry is not None:
+                await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+                return
+            response = await route.fetch()
+            if response.ok:
+                self.put(request.url, response.status, response.headers, await response.body())
+            await route.fulfill(response=response)
+
+        await context.route(f"**://{api_host}/**", handle)
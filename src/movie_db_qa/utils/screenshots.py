@@ -0,0 +1,127 @@
+"""Failure screenshot capture with a background, deduplicating writer.
+
+Teardown only captures the image bytes (optionally clipped to the results
+grid and as JPEG, both cheaper to encode than a full viewport PNG). The
+comparison with the file on disk and the write happen on a background
+thread, and files whose content is unchanged are left untouched, so
+re-running known xfail tests does not rewrite (or churn in git) identical
+screenshots.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+
+logger = logging.getLogger(__name__)
+
+# File extension per screenshot format
+EXTENSIONS = {"png": ".png", "jpeg": ".jpg"}
+
+
+def capture(page: Page, image_format: str = "png", quality: int = 80, clip_grid: bool = False) -> bytes:
+    """Capture a screenshot of the page as bytes.
+
+    Animations are frozen and the caret hidden so an unchanged page yields
+    byte-identical images.
+
+    Args:
+        page: Page to capture
+        image_format: "png" or "jpeg"
+        quality: JPEG quality (ignored for PNG)
+        clip_grid: Clip to the results grid when it is present
+
+    Returns:
+        Encoded image
+    """
+    options: dict[str, Any] = {"type": image_format, "animations": "disabled", "caret": "hide"}
+    if image_format == "jpeg":
+        options["quality"] = quality
+    if clip_grid:
+        grid = page.locator(".grid").first
+        # count() does not wait, so a missing grid falls back to the viewport
+        box = grid.bounding_box() if grid.count() else None
+        if box is not None:
+            options["clip"] = box
+    return page.screenshot(**options)
+
+
+@dataclass
+class WriterStats:
+    """Screenshot writer counters.
+
+    Attributes:
+        written: Files created or replaced
+        unchanged: Captures identical to the file on disk (not rewritten)
+        failed: Writes that raised
+    """
+
+    written: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+    def summary(self) -> str:
+        """Summarize the counters in one line.
+
+        Returns:
+            Human readable summary
+        """
+        return f"Screenshots: {self.written} written, {self.unchanged} unchanged, {self.failed} failed"
+
+
+class ScreenshotWriter:
+    """Write screenshots on a background thread, skipping unchanged content."""
+
+    def __init__(self) -> None:
+        """Initialize writer and start its thread."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stats = WriterStats()
+        self._queue: queue.Queue[tuple[Path, bytes] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str | Path, data: bytes) -> None:
+        """Queue an image for writing and return immediately.
+
+        Args:
+            path: Destination file
+            data: Encoded image
+        """
+        self._queue.put((Path(path), data))
+
+    def close(self) -> None:
+        """Write everything still queued and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self.logger.info(self.stats.summary())
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            path, data = item
+            try:
+                self._write(path, data)
+            except OSError:
+                self.stats.failed += 1
+                self.logger.exception("Could not write screenshot %s", path)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        # A size mismatch (the common case for a changed image) needs no read at all
+        if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+            self.stats.unchanged += 1
+            self.logger.debug("Screenshot unchanged: %s", path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a half-written image
+        partial = path.with_name(f".{path.name}.partial")
+        partial.write_bytes(data)
+        partial.replace(path)
+        self.stats.written += 1
+        self.logger.debug("Screenshot written: %s (%d bytes)", path, len(data))
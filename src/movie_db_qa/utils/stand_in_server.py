@@ -0,0 +1,352 @@
+"""Local stand-in server for the Discover SPA and the TMDB API.
+
+Serves a snapshot of the SPA bundle with history-API fallback (unknown paths
+return ``index.html`` so deep links like ``/popular/2`` work) and a fake TMDB
+backend under ``/3/`` that answers from the recorded cassette store.
+
+Usage:
+    python -m movie_db_qa.utils.stand_in_server snapshot   # capture SPA bundle
+    python -m movie_db_qa.utils.stand_in_server serve      # serve it locally
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import logging
+import re
+import threading
+from html.parser import HTMLParser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import urlopen
+
+from movie_db_qa.utils.cassette import CassetteStore
+from movie_db_qa.utils.config import config
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import BrowserContext, Page, Route
+
+logger = logging.getLogger(__name__)
+
+# TMDB API version prefix served by the fake backend
+API_PREFIX = "/3/"
+
+# Body TMDB returns for unknown resources
+NOT_FOUND_BODY = {
+    "success": False,
+    "status_code": 34,
+    "status_message": "The resource you requested could not be found.",
+}
+
+
+class _StandInHandler(SimpleHTTPRequestHandler):
+    """Request handler serving SPA files, history fallback and fake API."""
+
+    store: CassetteStore
+    api_host: str
+
+    def do_GET(self) -> None:
+        """Serve API cassette, static file or SPA index."""
+        if self.path.startswith(API_PREFIX):
+            self._serve_api()
+            return
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            # History-API fallback: let the SPA router resolve the path
+            self.path = "/index.html"
+        super().do_GET()
+
+    def _serve_api(self) -> None:
+        entry = self.store.get("GET", f"https://{self.api_host}{self.path}")
+        if entry is None:
+            status, headers, body = 404, {"content-type": "application/json"}, json.dumps(NOT_FOUND_BODY)
+        else:
+            status, headers, body = entry.status, entry.headers, entry.body
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() != "access-control-allow-origin":
+                self.send_header(name, value)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Route access logs to the framework logger instead of stderr."""
+        logger.debug("stand-in: " + format, *args)
+
+
+class StandInServer:
+    """Threaded local server standing in for surge.sh and api.themoviedb.org.
+
+    Listens on an ephemeral port by default; read ``url`` after ``start()``.
+    """
+
+    def __init__(
+        self,
+        spa_dir: str | Path,
+        cassette_dir: str | Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize stand-in server.
+
+        Args:
+            spa_dir: Directory holding the SPA snapshot (must contain index.html)
+            cassette_dir: Directory holding recorded TMDB cassettes
+            host: Interface to bind
+            port: Port to bind (0 picks a free ephemeral port)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.spa_dir = Path(spa_dir)
+        self.cassette_dir = Path(cassette_dir)
+        self.host = host
+        self.port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server (no trailing slash)."""
+        if self._server is None:
+            raise RuntimeError("Stand-in server is not running")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self) -> str:
+        """Start serving in a daemon thread.
+
+        Returns:
+            Base URL of the running server
+
+        Raises:
+            FileNotFoundError: If the SPA snapshot is missing
+        """
+        if not (self.spa_dir / "index.html").is_file():
+            raise FileNotFoundError(
+                f"No SPA snapshot in {self.spa_dir} - run 'make snapshot-spa' while online to capture one"
+            )
+        handler = type(
+            "StandInHandler",
+            (_StandInHandler,),
+            {"store": CassetteStore(self.cassette_dir), "api_host": config.tmdb_api_host},
+        )
+        self._server = ThreadingHTTPServer(
+            (self.host, self.port), functools.partial(handler, directory=str(self.spa_dir))
+        )
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        self.logger.info("Stand-in server listening on %s", self.url)
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+        self.logger.info("Stand-in server stopped")
+
+    def __enter__(self) -> StandInServer:
+        """Start server on context entry."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop server on context exit."""
+        self.stop()
+
+
+def install_api_redirect(target: Page | BrowserContext, api_host: str, backend_url: str) -> None:
+    """Serve TMDB API requests from the stand-in backend.
+
+    The SPA bundle hard-codes the TMDB host, so requests are fetched from the
+    local backend and fulfilled in place.
+
+    Args:
+        target: Page or context to install the route on
+        api_host: TMDB API host to intercept
+        backend_url: Base URL of the stand-in server
+    """
+
+    def handle(route: Route) -> None:
+        route.fulfill(response=route.fetch(url=_local_api_url(route.request.url, backend_url)))
+
+    target.route(f"**://{api_host}/**", handle)
+
+
+def _local_api_url(url: str, backend_url: str) -> str:
+    """Rewrite a TMDB API URL onto the stand-in backend."""
+    parts = urlsplit(url)
+    return f"{backend_url}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+async def install_api_redirect_async(context: AsyncBrowserContext, api_host: str, backend_url: str) -> None:
+    """Async twin of ``install_api_redirect``.
+
+    Args:
+        context: Async browser context to install the route on
+        api_host: TMDB API host to intercept
+        backend_url: Base URL of the stand-in server
+    """
+
+    async def handle(route: AsyncRoute) -> None:
+        await route.fulfill(response=await route.fetch(url=_local_api_url(route.request.url, backend_url)))
+
+    await context.route(f"**://{api_host}/**", handle)
+
+
+class _AssetCollector(HTMLParser):
+    """Collect same-origin asset references from index.html."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.assets: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        for name, value in attrs:
+            if name in ("src", "href") and value and tag in ("script", "link", "img"):
+                self.assets.append(value)
+
+
+# Asset file extensions worth following from script string literals
+ASSET_EXTENSIONS = "js|css|json|woff2?|ttf|otf|eot|svg|png|jpe?g|gif|webp|ico"
+
+# url(...) and @import references in stylesheets
+CSS_REFERENCE = re.compile(r"""url\(\s*['"]?([^'")\s]+)['"]?\s*\)|@import\s+['"]([^'"]+)['"]""")
+
+# Quoted asset paths in scripts (e.g. "static/media/logo.5d5d9eef.svg")
+SCRIPT_REFERENCE = re.compile(rf"""["'`]((?:\.{{0,2}}/)?[\w@.~/-]+\.(?:{ASSET_EXTENSIONS}))["'`]""")
+
+# Webpack lazy-chunk URL builders: "static/js/" + id + "." + {12: "3f9a", ...}[id] + ".chunk.js"
+CHUNK_MAP = re.compile(
+    r"""["']([\w./-]*)["']\s*\+\s*\w+\s*\+\s*["']([.\w-]*)["']\s*\+\s*(\{[^{}]*\})\[\w+\]\s*\+\s*["']([.\w-]+)["']"""
+)
+CHUNK_ENTRY = re.compile(r"""["']?([\w-]+)["']?\s*:\s*["']([\w-]+)["']""")
+
+
+def asset_references(path: str, text: str) -> list[str]:
+    """List the asset references in one file of the bundle.
+
+    HTML contributes its script/link/img URLs, stylesheets their ``url()``
+    and ``@import`` targets, and scripts their quoted asset paths plus the
+    lazily loaded chunks of webpack's chunk-URL map.
+
+    Args:
+        path: URL path of the file (its extension selects the parser)
+        text: File contents
+
+    Returns:
+        References as written in the file (relative or absolute)
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in ("", ".html", ".htm"):
+        collector = _AssetCollector()
+        collector.feed(text)
+        return collector.assets
+    if suffix == ".css":
+        return [match.group(1) or match.group(2) for match in CSS_REFERENCE.finditer(text)]
+    if suffix == ".js":
+        references = [match.group(1) for match in SCRIPT_REFERENCE.finditer(text)]
+        for prefix, separator, mapping, ending in CHUNK_MAP.findall(text):
+            references.extend(
+                f"/{prefix.lstrip('/')}{chunk}{separator}{digest}{ending}"
+                for chunk, digest in CHUNK_ENTRY.findall(mapping)
+            )
+        return references
+    return []
+
+
+def snapshot_spa(base_url: str, dest: str | Path) -> list[Path]:
+    """Capture the SPA bundle: index.html and every same-origin asset it reaches.
+
+    References are followed transitively (index -> scripts and stylesheets ->
+    lazy chunks, fonts and images). Stylesheet references resolve against the
+    stylesheet; script references against the site root, where webpack's
+    public path points. References that do not resolve to a file (404, or the
+    host's HTML fallback page) are skipped.
+
+    Args:
+        base_url: URL of the deployed SPA
+        dest: Directory to write the snapshot into
+
+    Returns:
+        Paths of the files written
+    """
+    dest_dir = Path(dest)
+    origin = urlsplit(base_url).netloc
+    root = f"{urlsplit(base_url).scheme}://{origin}/"
+    with urlopen(base_url) as response:
+        index = response.read()
+
+    written = [dest_dir / "index.html"]
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    written[0].write_bytes(index)
+
+    pending = [(base_url + "/", "/index.html", index)]
+    seen = {"/", "/index.html"}
+    while pending:
+        file_url, file_path, body = pending.pop()
+        resolve_against = file_url if file_path.endswith((".css", ".html")) else root
+        for ref in dict.fromkeys(asset_references(file_path, body.decode("utf-8", errors="replace"))):
+            if ref.startswith(("data:", "#")):
+                continue
+            asset_url = urljoin(resolve_against, ref)
+            parts = urlsplit(asset_url)
+            if parts.netloc != origin or parts.path in seen or not parts.path.strip("/"):
+                continue
+            seen.add(parts.path)
+            try:
+                with urlopen(asset_url.split("#", 1)[0]) as response:
+                    asset = response.read()
+                    content_type = response.headers.get_content_type()
+            except HTTPError as error:
+                logger.debug("Skipping %s (HTTP %d)", parts.path, error.code)
+                continue
+            # The host's own history fallback answers unknown paths with index.html
+            if content_type == "text/html" and not parts.path.endswith((".html", ".htm")):
+                logger.debug("Skipping %s (not a bundle file)", parts.path)
+                continue
+            path = dest_dir / parts.path.lstrip("/")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(asset)
+            written.append(path)
+            pending.append((asset_url, parts.path, asset))
+            logger.info("Captured %s (%d bytes)", parts.path, len(asset))
+    return written
+
+
+def main() -> None:
+    """Command line entry point for snapshotting and serving."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["snapshot", "serve"])
+    parser.add_argument("--port", type=int, default=8000, help="Port for 'serve'")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if args.command == "snapshot":
+        files = snapshot_spa(config.base_url, config.spa_snapshot_dir)
+        logger.info("Snapshot written: %d files in %s", len(files), config.spa_snapshot_dir)
+        return
+
+    server = StandInServer(config.spa_snapshot_dir, config.cassette_dir, port=args.port)
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
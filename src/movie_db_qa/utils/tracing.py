@@ -0,0 +1,180 @@
+"""Failure-only Playwright tracing built on trace chunks.
+
+Tracing is started once per browser context; every test then records into its
+own chunk. A passing test's chunk is stopped without a path, so Playwright
+discards it; a failing (or xfail) test's chunk is written as a trace zip next
+to its screenshot (``playwright show-trace <file>``).
+
+Most of the cost of tracing is paid inside every action (DOM snapshots,
+screencast frames), where it is indistinguishable from test time. To measure
+it, a deterministic sample of tests runs untraced as a baseline; the overhead
+is the traced tests' mean run time (plus chunk start/stop) over the baseline
+mean. Tests differ in length, so this is an estimate that needs a few
+baseline tests before it is reported.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext
+
+# File name suffix of persisted traces
+TRACE_SUFFIX = ".trace.zip"
+
+# Untraced tests needed before the overhead is estimated
+MIN_BASELINE_TESTS = 3
+
+
+@dataclass
+class TraceStats:
+    """Tracing counters.
+
+    Attributes:
+        kept: Chunks written for failing tests
+        discarded: Chunks dropped for passing tests
+        chunk_seconds: Time spent starting and stopping tracing
+        traced_tests: Tests run with tracing
+        traced_seconds: Run time of the traced tests
+        baseline_tests: Tests run without tracing (the baseline sample)
+        baseline_seconds: Run time of the baseline tests
+    """
+
+    kept: int = 0
+    discarded: int = 0
+    chunk_seconds: float = 0.0
+    traced_tests: int = 0
+    traced_seconds: float = 0.0
+    baseline_tests: int = 0
+    baseline_seconds: float = 0.0
+
+    @property
+    def overhead_ratio(self) -> float | None:
+        """Estimated tracing overhead as a fraction of untraced test time.
+
+        None until enough baseline tests ran.
+        """
+        if self.baseline_tests < MIN_BASELINE_TESTS or not self.traced_tests or not self.baseline_seconds:
+            return None
+        baseline_mean = self.baseline_seconds / self.baseline_tests
+        traced_mean = (self.traced_seconds + self.chunk_seconds) / self.traced_tests
+        return traced_mean / baseline_mean - 1
+
+    def summary(self, budget: float | None = None) -> str:
+        """Summarize the counters in one line.
+
+        Args:
+            budget: Allowed overhead ratio, flagged when the estimate exceeds it
+
+        Returns:
+            Human readable summary
+        """
+        line = f"Tracing: {self.kept} traces kept, {self.discarded} discarded, {self.baseline_tests} untraced baseline"
+        ratio = self.overhead_ratio
+        if ratio is None:
+            return f"{line}; overhead not estimated (needs {MIN_BASELINE_TESTS} baseline tests)"
+        traced_mean = self.traced_seconds / self.traced_tests
+        baseline_mean = self.baseline_seconds / self.baseline_tests
+        line += (
+            f"; estimated overhead {ratio:+.1%} (mean {traced_mean:.2f} s traced vs {baseline_mean:.2f} s untraced, "
+            f"{self.chunk_seconds:.2f} s in chunk start/stop)"
+        )
+        if budget is not None and ratio > budget:
+            line += f" - over the {budget:.0%} budget"
+        return line
+
+
+class TraceRecorder:
+    """Record one trace chunk per test and keep only the failing ones."""
+
+    def __init__(
+        self,
+        screenshots: bool = False,
+        snapshots: bool = True,
+        baseline_sample: float = 0.0,
+        run_id: str = "",
+    ) -> None:
+        """Initialize recorder.
+
+        Args:
+            screenshots: Record screencast frames
+            snapshots: Record DOM snapshots for every action
+            baseline_sample: Fraction of tests run untraced to measure the overhead
+            run_id: Varies which tests form the baseline from run to run
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.screenshots = screenshots
+        self.snapshots = snapshots
+        self.baseline_sample = baseline_sample
+        self.run_id = run_id
+        self.stats = TraceStats()
+        # Contexts with tracing started (pooled contexts keep it across tests)
+        self._tracing: weakref.WeakSet[BrowserContext] = weakref.WeakSet()
+        # Context -> (test start, traced)
+        self._started_at: dict[int, tuple[float, bool]] = {}
+
+    def in_baseline(self, title: str) -> bool:
+        """Whether a test belongs to this run's untraced baseline sample.
+
+        Args:
+            title: Test node id
+
+        Returns:
+            True if the test should run without tracing
+        """
+        digest = hashlib.sha256(f"{self.run_id}:{title}".encode()).digest()
+        return int.from_bytes(digest[:4], "big") / 2**32 < self.baseline_sample
+
+    def begin(self, context: BrowserContext, title: str, traced: bool = True) -> None:
+        """Start a test's chunk.
+
+        Args:
+            context: Context the test runs in
+            title: Chunk title (the test node id)
+            traced: False times the test as a baseline without recording a chunk
+        """
+        started = time.perf_counter()
+        if traced:
+            if context not in self._tracing:
+                context.tracing.start(screenshots=self.screenshots, snapshots=self.snapshots)
+                self._tracing.add(context)
+            context.tracing.start_chunk(title=title)
+        now = time.perf_counter()
+        self.stats.chunk_seconds += now - started
+        self._started_at[id(context)] = (now, traced)
+
+    def end(self, context: BrowserContext, path: Path | None) -> Path | None:
+        """Stop a test's chunk, keeping it only when a path is given.
+
+        Args:
+            context: Context the test ran in
+            path: Trace file for a failing test (None discards the chunk)
+
+        Returns:
+            Written trace file, or None if the chunk was discarded (or never recorded)
+        """
+        started = time.perf_counter()
+        test_started, traced = self._started_at.pop(id(context), (started, True))
+        if not traced:
+            self.stats.baseline_tests += 1
+            self.stats.baseline_seconds += started - test_started
+            return None
+        self.stats.traced_tests += 1
+        self.stats.traced_seconds += started - test_started
+        if path is None:
+            context.tracing.stop_chunk()
+            self.stats.discarded += 1
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            context.tracing.stop_chunk(path=path)
+            self.stats.kept += 1
+            self.logger.info("Trace saved: %s", path)
+        self.stats.chunk_seconds += time.perf_counter() - started
+        return path
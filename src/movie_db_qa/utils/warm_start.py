@@ -0,0 +1,212 @@
+"""Warm-start contexts: persisted storage state plus an SPA asset cache.
+
+A cold context downloads the SPA bundle and TMDB metadata (configuration,
+genre lists) on every ``DiscoverPage.load()``. In warm-start mode a session
+fixture loads the app once, saves the context's storage state and keeps the
+same-origin bundle (HTML, JS, CSS) and TMDB metadata responses on disk. New
+contexts are created from that storage state and served those responses from
+the cache instead of the network.
+
+The cache is keyed by a hash of the asset references in the live
+``index.html``: a redeploy changes the hashed bundle file names, which
+discards the cache and re-seeds it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+from movie_db_qa.utils.cassette import PERSISTED_HEADERS, CassetteEntry, CassetteStore
+from movie_db_qa.utils.stand_in_server import asset_references
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Route
+
+logger = logging.getLogger(__name__)
+
+# Same-origin resource types served from the cache (text only: the store keeps bodies as text)
+CACHED_RESOURCE_TYPES = frozenset({"document", "script", "stylesheet"})
+
+# TMDB endpoints whose responses do not change between tests
+METADATA_PATHS = ("/3/configuration", "/3/genre/")
+
+
+def bundle_hash(index_html: str) -> str:
+    """Fingerprint an SPA build by the assets its index references.
+
+    Bundlers put content hashes in asset file names, so the list of
+    references changes whenever the deployed bundle does.
+
+    Args:
+        index_html: Served ``index.html``
+
+    Returns:
+        Short hex digest (of the whole document if it references no assets)
+    """
+    basis = "\n".join(sorted(set(asset_references("index.html", index_html)))) or index_html
+    return hashlib.sha256(basis.encode()).hexdigest()[:16]
+
+
+@dataclass
+class WarmStartStats:
+    """Asset cache counters.
+
+    Attributes:
+        hits: Requests served from the cache
+        misses: Requests fetched from the network (and stored)
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    def summary(self) -> str:
+        """Summarize the counters in one line.
+
+        Returns:
+            Human readable summary
+        """
+        return f"Warm start: {self.hits} cached responses served, {self.misses} fetched"
+
+
+class WarmStartCache:
+    """On-disk storage state and response cache for one SPA build."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize cache.
+
+        Args:
+            directory: Directory holding the manifest, storage state and responses
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / "manifest.json"
+        self.storage_state_path = self.directory / "storage-state.json"
+        self.responses = CassetteStore(self.directory / "responses")
+        self.stats = WarmStartStats()
+
+    def validate(self, bundle: str) -> bool:
+        """Discard the cache if it was built for another bundle.
+
+        Args:
+            bundle: Current ``bundle_hash``
+
+        Returns:
+            True if the existing cache matches the bundle
+        """
+        if self.manifest_path.exists():
+            if json.loads(self.manifest_path.read_text(encoding="utf-8")).get("bundle") == bundle:
+                return True
+            self.logger.info("SPA bundle changed, discarding warm-start cache %s", self.directory)
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps({"bundle": bundle}), encoding="utf-8")
+        return False
+
+    @property
+    def seeded(self) -> bool:
+        """Whether the storage state has been captured."""
+        return self.storage_state_path.exists()
+
+    def context_options(self) -> dict[str, Any]:
+        """Extra ``new_context`` options that restore the captured state.
+
+        Returns:
+            ``storage_state`` option, or nothing before seeding
+        """
+        return {"storage_state": str(self.storage_state_path)} if self.seeded else {}
+
+    def install(self, context: BrowserContext, base_url: str, api_host: str | None) -> None:
+        """Serve the SPA bundle and TMDB metadata from the cache.
+
+        Registered after the cassette/stand-in routes so it is consulted
+        first; requests it does not cache fall back to them.
+
+        Args:
+            context: Context to install the routes on
+            base_url: Origin of the SPA
+            api_host: TMDB API host whose metadata is cached (None when TMDB
+                traffic is already served by cassettes or the stand-in)
+        """
+        origin = urlsplit(base_url).netloc
+
+        def handle(route: Route) -> None:
+            request = route.request
+            parts = urlsplit(request.url)
+            if request.method != "GET":
+                route.fallback()
+                return
+            if parts.netloc == origin:
+                cacheable = request.resource_type in CACHED_RESOURCE_TYPES
+            else:
+                cacheable = parts.path.startswith(METADATA_PATHS)
+            if not cacheable:
+                route.fallback()
+                return
+            entry = self.responses.get(request.method, request.url)
+            if entry is not None:
+                self.stats.hits += 1
+                route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+                return
+            self.stats.misses += 1
+            response = route.fetch()
+            if response.ok:
+                headers = {k: v for k, v in response.headers.items() if k.lower() in PERSISTED_HEADERS}
+                self.responses.put(
+                    CassetteEntry(request.method, request.url, response.status, headers, response.text())
+                )
+            route.fulfill(response=response)
+
+        context.route(f"**://{origin}/**", handle)
+        if api_host is not None:
+            context.route(f"**://{api_host}/**", handle)
+
+    def seed(
+        self,
+        browser: Browser,
+        base_url: str,
+        api_host: str | None,
+        prepare: Callable[[BrowserContext], None] | None = None,
+        **context_options: Any,
+    ) -> None:
+        """Load the app once to fill the cache and capture the storage state.
+
+        Args:
+            browser: Browser to open the seeding context in
+            base_url: URL of the SPA
+            api_host: TMDB API host whose metadata is cached (see ``install``)
+            prepare: Installs the test contexts' TMDB routes (cassette or stand-in)
+            **context_options: Options for the seeding context
+        """
+        context = browser.new_context(**context_options)
+        try:
+            if prepare is not None:
+                prepare(context)
+            self.install(context, base_url, api_host)
+            page = context.new_page()
+            page.goto(base_url, wait_until="load")
+            context.storage_state(path=self.storage_state_path)
+        finally:
+            context.close()
+        self.logger.info("Warm-start cache seeded (%d responses)", self.stats.misses)
+
+
+def fetch_bundle_hash(base_url: str) -> str:
+    """Fetch the SPA index and fingerprint its bundle.
+
+    Args:
+        base_url: URL of the SPA
+
+    Returns:
+        ``bundle_hash`` of the served index
+    """
+    with urlopen(base_url) as response:
+        return bundle_hash(response.read().decode("utf-8", errors="replace"))
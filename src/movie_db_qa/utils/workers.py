@@ -0,0 +1,133 @@
+"""Helpers for running the suite under pytest-xdist workers.
+
+Each worker gets its own log file and screenshot namespace so concurrent
+workers never write to the same artifact; the controller merges them into the
+usual single-run layout when the session ends.
+"""
+
+import heapq
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+# Default worker id when running without xdist
+MAIN_WORKER = "main"
+
+# Log records start with "%Y-%m-%d %H:%M:%S"; other lines continue the previous record
+_RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def worker_id() -> str:
+    """Get the current xdist worker id.
+
+    Returns:
+        Worker id such as "gw0", or "main" outside xdist
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", MAIN_WORKER)
+
+
+def is_worker() -> bool:
+    """Check whether this process is an xdist worker.
+
+    Returns:
+        True inside an xdist worker process
+    """
+    return worker_id() != MAIN_WORKER
+
+
+def worker_log_file(log_dir: Path, name: str = "test_execution") -> Path:
+    """Get the log file path for this process.
+
+    Args:
+        log_dir: Directory holding logs
+        name: Log file stem
+
+    Returns:
+        ``<name>.log`` for the main process, ``<name>.<worker>.log`` for workers
+    """
+    suffix = f".{worker_id()}" if is_worker() else ""
+    return log_dir / f"{name}{suffix}.log"
+
+
+def worker_artifact_dir(base_dir: Path) -> Path:
+    """Get this process's namespace inside an artifact directory.
+
+    Args:
+        base_dir: Shared artifact directory
+
+    Returns:
+        ``base_dir/<worker>`` for workers, ``base_dir`` otherwise
+    """
+    return base_dir / worker_id() if is_worker() else base_dir
+
+
+def clean_worker_logs(log_dir: Path, name: str = "test_execution") -> None:
+    """Remove per-worker logs left over from a previous run.
+
+    Args:
+        log_dir: Directory holding logs
+        name: Log file stem
+    """
+    for path in log_dir.glob(f"{name}.gw*.log"):
+        path.unlink()
+
+
+def _records(path: Path) -> Iterator[str]:
+    """Yield complete (possibly multi-line) log records from a file."""
+    record = ""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if _RECORD_START.match(line) and record:
+                yield record
+                record = ""
+            record += line
+    if record:
+        yield record
+
+
+def merge_worker_logs(log_dir: Path, name: str = "test_execution") -> Path | None:
+    """Merge per-worker logs into one chronologically ordered log.
+
+    Args:
+        log_dir: Directory holding logs
+        name: Log file stem
+
+    Returns:
+        Path of the merged log, or None if there were no worker logs
+    """
+    worker_logs = sorted(log_dir.glob(f"{name}.gw*.log"))
+    if not worker_logs:
+        return None
+    merged = log_dir / f"{name}.log"
+    # Records share one timestamp format, so string order is chronological order
+    streams = [_records(path) for path in worker_logs]
+    with merged.open("w", encoding="utf-8") as out:
+        for record in heapq.merge(*streams, key=lambda rec: rec[:19]):
+            out.write(record)
+    for path in worker_logs:
+        path.unlink()
+    return merged
+
+
+def merge_worker_artifacts(base_dir: Path) -> int:
+    """Move per-worker artifacts back into the shared directory.
+
+    Artifact names are derived from unique test node names, so files from
+    different workers never clash; a file from a previous run is replaced.
+
+    Args:
+        base_dir: Shared artifact directory
+
+    Returns:
+        Number of files moved
+    """
+    moved = 0
+    for worker_dir in sorted(base_dir.glob("gw*")):
+        if not worker_dir.is_dir():
+            continue
+        for path in sorted(worker_dir.iterdir()):
+            path.replace(base_dir / path.name)
+            moved += 1
+        worker_dir.rmdir()
+    return moved
@@ -0,0 +1,443 @@
+"""Model-based walk of the Discover UI on one loaded page.
+
+The UI is modeled as a state machine: states are (category, page) pairs and
+transitions are the category filter clicks and the Next, Previous and
+page-number controls. ``postman_tour`` orders the transitions into one walk
+that takes every transition at least once in the fewest steps (a directed
+Chinese postman tour): unbalanced states are paired up by a min-cost flow over
+shortest paths, those paths are added to the graph, and Hierholzer's
+algorithm reads an Eulerian circuit off the result.
+
+``ModelWalker`` replays the tour on a single loaded page, checking the UI
+invariants after every step, so one page load covers every transition instead
+of one reload per assertion. A step that lands in the wrong state is recorded
+and the walk resynchronizes through the SPA router (avoiding DEF-001).
+
+Usage:
+    python -m movie_db_qa.walker             # walk pages 1-3 of every category
+    python -m movie_db_qa.walker --pages 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from movie_db_qa.pages.discover_page import CATEGORIES, DiscoverPage, category_from_url
+from movie_db_qa.pages.ui_state import FILTER_LABELS
+from movie_db_qa.utils.config import config
+
+if TYPE_CHECKING:
+    from movie_db_qa.pages.ui_state import UIState
+
+logger = logging.getLogger(__name__)
+
+# The app auto-forwards its root URL to this category
+LANDING_CATEGORY = "popular"
+
+
+@dataclass(frozen=True, order=True)
+class State:
+    """UI state: the category shown and its result page."""
+
+    category: str
+    page: int
+
+    def __str__(self) -> str:
+        """Path the app shows for this state."""
+        return f"/{self.category}/{self.page}"
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One user action and the state it should lead to.
+
+    Attributes:
+        source: State the action is taken in
+        action: "select:<slug>", "next", "previous" or "page:<n>"
+        target: Expected state afterwards
+    """
+
+    source: State
+    action: str
+    target: State
+
+    def __str__(self) -> str:
+        """Readable transition."""
+        return f"{self.source} --{self.action}--> {self.target}"
+
+
+class DiscoverModel:
+    """State machine of the Discover filters and pagination."""
+
+    def __init__(self, categories: Iterable[str] = CATEGORIES, pages: int = 3) -> None:
+        """Initialize model.
+
+        Args:
+            categories: Category slugs to model
+            pages: Result pages modeled per category
+        """
+        self.categories = tuple(categories)
+        self.pages = pages
+        self.initial = State(LANDING_CATEGORY if LANDING_CATEGORY in self.categories else self.categories[0], 1)
+
+    def states(self) -> list[State]:
+        """Every modeled state."""
+        return [State(category, page) for category in self.categories for page in range(1, self.pages + 1)]
+
+    def transitions(self) -> list[Transition]:
+        """Every modeled transition.
+
+        Selecting a category lands on its first page; re-selecting the shown
+        category is not modeled (the app ignores it).
+
+        Returns:
+            Transitions in a stable order
+        """
+        transitions: list[Transition] = []
+        for state in self.states():
+            for category in self.categories:
+                if category != state.category:
+                    transitions.append(Transition(state, f"select:{category}", State(category, 1)))
+            if state.page < self.pages:
+                transitions.append(Transition(state, "next", State(state.category, state.page + 1)))
+            if state.page > 1:
+                transitions.append(Transition(state, "previous", State(state.category, state.page - 1)))
+            for page in range(1, self.pages + 1):
+                if page != state.page:
+                    transitions.append(Transition(state, f"page:{page}", State(state.category, page)))
+        return transitions
+
+
+def _shortest_paths(outgoing: dict[State, list[Transition]], source: State) -> dict[State, list[Transition]]:
+    """Breadth-first shortest paths from one state.
+
+    Args:
+        outgoing: State -> transitions leaving it
+        source: Start state
+
+    Returns:
+        Reachable state -> transitions leading there
+    """
+    paths: dict[State, list[Transition]] = {source: []}
+    queue = deque([source])
+    while queue:
+        state = queue.popleft()
+        for transition in outgoing.get(state, ()):
+            if transition.target not in paths:
+                paths[transition.target] = [*paths[state], transition]
+                queue.append(transition.target)
+    return paths
+
+
+def _min_cost_pairs(
+    supply: dict[State, int],
+    demand: dict[State, int],
+    cost: Callable[[State, State], int],
+) -> list[tuple[State, State]]:
+    """Pair supply units with demand units at minimum total cost.
+
+    Successive shortest paths (Bellman-Ford, since residual edges carry
+    negative costs) on the bipartite flow network source -> supply ->
+    demand -> sink, one unit per augmentation.
+
+    Args:
+        supply: State -> units it provides
+        demand: State -> units it needs (same total as supply)
+        cost: Cost of pairing two states
+
+    Returns:
+        (supply state, demand state) per unit
+    """
+    left, right = sorted(supply), sorted(demand)
+    size = len(left) + len(right) + 2
+    source, sink = size - 2, size - 1
+    # [head, capacity, cost]; edge i ^ 1 is the reverse of edge i
+    edges: list[list[int]] = []
+    adjacency: list[list[int]] = [[] for _ in range(size)]
+
+    def add(tail: int, head: int, capacity: int, weight: int) -> None:
+        adjacency[tail].append(len(edges))
+        edges.append([head, capacity, weight])
+        adjacency[head].append(len(edges))
+        edges.append([tail, 0, -weight])
+
+    for i, state in enumerate(left):
+        add(source, i, supply[state], 0)
+        for j, other in enumerate(right):
+            add(i, len(left) + j, supply[state], cost(state, other))
+    for j, state in enumerate(right):
+        add(len(left) + j, sink, demand[state], 0)
+
+    while True:
+        distance = [math.inf] * size
+        via = [-1] * size
+        distance[source] = 0
+        for _ in range(size - 1):
+            changed = False
+            for tail in range(size):
+                if distance[tail] == math.inf:
+                    continue
+                for index in adjacency[tail]:
+                    head, capacity, weight = edges[index]
+                    if capacity and distance[tail] + weight < distance[head]:
+                        distance[head] = distance[tail] + weight
+                        via[head] = index
+                        changed = True
+            if not changed:
+                break
+        if distance[sink] == math.inf:
+            break
+        node = sink
+        while node != source:
+            index = via[node]
+            edges[index][1] -= 1
+            edges[index ^ 1][1] += 1
+            node = edges[index ^ 1][0]
+
+    pairs: list[tuple[State, State]] = []
+    for i, state in enumerate(left):
+        for index in adjacency[i]:
+            head = edges[index][0]
+            if index % 2 == 0 and len(left) <= head < source:
+                # Flow on a forward edge is the capacity of its reverse
+                pairs.extend([(state, right[head - len(left)])] * edges[index ^ 1][1])
+    return pairs
+
+
+def _eulerian_circuit(transitions: list[Transition], start: State) -> list[Transition]:
+    """Hierholzer's algorithm on a balanced, connected multigraph.
+
+    Args:
+        transitions: Edges (duplicates are traversed once each)
+        start: First and last state of the circuit
+
+    Returns:
+        Every transition exactly once, in walking order
+    """
+    remaining: dict[State, list[Transition]] = defaultdict(list)
+    # Reversed so pop() takes a state's transitions in model order
+    for transition in reversed(transitions):
+        remaining[transition.source].append(transition)
+    trail: list[Transition] = []
+    circuit: list[Transition] = []
+    state = start
+    while True:
+        if remaining[state]:
+            transition = remaining[state].pop()
+            trail.append(transition)
+            state = transition.target
+        elif trail:
+            transition = trail.pop()
+            circuit.append(transition)
+            state = transition.source
+        else:
+            break
+    circuit.reverse()
+    return circuit
+
+
+def postman_tour(transitions: list[Transition], start: State) -> list[Transition]:
+    """Shortest walk from ``start`` back to it that takes every transition.
+
+    Args:
+        transitions: Model transitions
+        start: State the walk begins in
+
+    Returns:
+        Transitions in walking order (some repeated to reach the rest)
+
+    Raises:
+        ValueError: If some state cannot be reached from, or cannot return to, ``start``
+    """
+    outgoing: dict[State, list[Transition]] = defaultdict(list)
+    balance: Counter[State] = Counter()
+    for transition in transitions:
+        outgoing[transition.source].append(transition)
+        balance[transition.source] += 1
+        balance[transition.target] -= 1
+    states = {start, *balance}
+    paths = {state: _shortest_paths(outgoing, state) for state in states}
+    stranded = sorted(state for state in states if state not in paths[start] or start not in paths[state])
+    if stranded:
+        raise ValueError(f"Model is not strongly connected from {start}: {', '.join(map(str, stranded))}")
+
+    # States entered more often than left need extra exits, and vice versa
+    supply = {state: -count for state, count in balance.items() if count < 0}
+    demand = {state: count for state, count in balance.items() if count > 0}
+    extra = [
+        transition
+        for tail, head in _min_cost_pairs(supply, demand, lambda tail, head: len(paths[tail][head]))
+        for transition in paths[tail][head]
+    ]
+    return _eulerian_circuit(transitions + extra, start)
+
+
+def check_invariants(state: UIState, url: str, expected: State) -> list[str]:
+    """Compare the UI with the state the model expects.
+
+    Args:
+        state: UI snapshot after a step
+        url: Page URL after the step
+        expected: Expected model state
+
+    Returns:
+        Violated invariants (empty if the UI matches)
+    """
+    violations: list[str] = []
+    if category_from_url(url) != expected.category:
+        violations.append(f"URL shows {category_from_url(url)!r}, expected {expected.category!r}")
+    if state.active_filters != (FILTER_LABELS[expected.category],):
+        violations.append(f"active filters {list(state.active_filters)}, expected {FILTER_LABELS[expected.category]!r}")
+    if state.current_page != expected.page:
+        violations.append(f"on page {state.current_page}, expected {expected.page}")
+    if state.error_visible:
+        violations.append("error banner shown")
+    if state.results != config.expected_results_per_page:
+        violations.append(f"{state.results} results, expected {config.expected_results_per_page}")
+    return violations
+
+
+@dataclass
+class Step:
+    """One walked transition.
+
+    Attributes:
+        transition: Transition taken
+        violations: Invariants violated afterwards
+        seconds: Time for the action and the checks
+    """
+
+    transition: Transition
+    violations: list[str]
+    seconds: float
+
+
+@dataclass
+class WalkReport:
+    """Outcome of a model walk.
+
+    Attributes:
+        transitions: Number of transitions in the model
+        steps: Walked steps in order
+        seconds: Total walk time, including the initial load
+    """
+
+    transitions: int
+    steps: list[Step] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def covered(self) -> int:
+        """Distinct transitions taken."""
+        return len({step.transition for step in self.steps})
+
+    @property
+    def failures(self) -> list[Step]:
+        """Steps that violated an invariant."""
+        return [step for step in self.steps if step.violations]
+
+    def summary(self) -> str:
+        """Summarize the walk in one line.
+
+        Returns:
+            Human readable summary
+        """
+        rate = len(self.steps) / self.seconds if self.seconds else 0.0
+        return (
+            f"Model walk: {len(self.steps)} steps covering {self.covered}/{self.transitions} transitions "
+            f"in {self.seconds:.1f} s ({rate:.1f} steps/s), {len(self.failures)} with invariant violations"
+        )
+
+
+class ModelWalker:
+    """Replay a model tour on one live page."""
+
+    def __init__(self, discover: DiscoverPage, model: DiscoverModel) -> None:
+        """Initialize walker.
+
+        Args:
+            discover: Page object driving the (not yet loaded) page
+            model: UI model to walk
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.discover = discover
+        self.model = model
+
+    def apply(self, transition: Transition) -> None:
+        """Perform a transition's user action.
+
+        Args:
+            transition: Transition to take
+        """
+        kind, _, argument = transition.action.partition(":")
+        if kind == "select":
+            self.discover.select_category(argument)
+        elif kind == "next":
+            self.discover.click_next_page()
+        elif kind == "previous":
+            self.discover.click_previous_page()
+        elif kind == "page":
+            self.discover.navigate_to_page(int(argument))
+        else:
+            raise ValueError(f"Unknown action {transition.action!r}")
+
+    def walk(self, tour: list[Transition] | None = None) -> WalkReport:
+        """Load the app once and take every transition of the tour.
+
+        Args:
+            tour: Transitions to take (default: the model's postman tour)
+
+        Returns:
+            Walk report
+        """
+        transitions = self.model.transitions()
+        tour = tour if tour is not None else postman_tour(transitions, self.model.initial)
+        report = WalkReport(len(transitions))
+        started = time.perf_counter()
+        self.discover.load()
+        if self.model.initial.category != LANDING_CATEGORY:
+            self.discover.select_category(self.model.initial.category)
+        for transition in tour:
+            step_started = time.perf_counter()
+            try:
+                self.apply(transition)
+            except TimeoutError as error:
+                # The action never completed (e.g. a dead control); the checks below show where it left the UI
+                self.logger.warning("%s: %s", transition, error)
+            violations = check_invariants(self.discover.ui_state(), self.discover.page.url, transition.target)
+            if violations:
+                self.logger.warning("%s: %s", transition, "; ".join(violations))
+                # Continue the tour from where the model expected to be
+                self.discover.open_page(transition.target.category, transition.target.page)
+            report.steps.append(Step(transition, violations, time.perf_counter() - step_started))
+        report.seconds = time.perf_counter() - started
+        self.logger.info(report.summary())
+        return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=3, help="Result pages modeled per category")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=config.headless)
+        report = ModelWalker(DiscoverPage(browser.new_page()), DiscoverModel(pages=args.pages)).walk()
+        browser.close()
+    print(report.summary())
+    for step in report.failures:
+        print(f"  {step.transition}: {'; '.join(step.violations)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Watch mode: re-run the tests affected by page object edits.
+
+Polls the watched directories, diffs each changed file against its previous
+content and maps the changed lines to tests through the impact call map (see
+``movie_db_qa.impact``). Runs connect to a long-lived browser server, started
+here unless one is already running, so each re-run skips the browser launch.
+
+Usage:
+    python -m movie_db_qa.watch                  # watch src/movie_db_qa/pages
+    python -m movie_db_qa.watch -- -x --tb=line  # extra pytest arguments
+"""
+
+import argparse
+import difflib
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from movie_db_qa.impact import (
+    CallMap,
+    analyze_changes,
+    config_reference_index,
+    docstring_test_cases,
+    requirement_test_cases,
+    select_tests,
+)
+from movie_db_qa.utils.browser_server import BrowserServer, running_endpoint
+from movie_db_qa.utils.config import ENV_PREFIX, config
+
+logger = logging.getLogger(__name__)
+
+# Directories watched by default
+WATCHED_DIRS = ("src/movie_db_qa/pages",)
+
+
+def snapshot(root: Path, directories: tuple[str, ...]) -> dict[str, str]:
+    """Read every Python file under the watched directories.
+
+    Args:
+        root: Repository root
+        directories: Directories relative to root
+
+    Returns:
+        Relative path -> source
+    """
+    return {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8")
+        for directory in directories
+        for path in sorted((root / directory).rglob("*.py"))
+    }
+
+
+def changed_lines(old: str, new: str) -> set[int]:
+    """Find the new-side line numbers that differ between two versions.
+
+    Args:
+        old: Previous content
+        new: Current content
+
+    Returns:
+        Changed line numbers (deletions mark the line after them)
+    """
+    lines: set[int] = set()
+    matcher = difflib.SequenceMatcher(a=old.splitlines(), b=new.splitlines(), autojunk=False)
+    for tag, _, _, start, end in matcher.get_opcodes():
+        if tag != "equal":
+            lines.update(range(start + 1, end + 1) if end > start else {start + 1})
+    return lines
+
+
+def affected_tests(root: Path, changes: dict[str, set[int]]) -> list[str] | None:
+    """Select the recorded tests a set of changed lines can affect.
+
+    Args:
+        root: Repository root
+        changes: Relative path -> changed line numbers
+
+    Returns:
+        Test node ids, or None if every test must run (no call map, or an untraceable change)
+    """
+    call_map = CallMap.load(root / config.impact_call_map)
+    change_set = analyze_changes(changes, root)
+    if call_map is None or change_set.full_run_reason is not None:
+        return None
+    # Only recorded tests whose file still exists can be passed to pytest
+    node_ids = [node_id for node_id in call_map.tests if (root / node_id.split("::", 1)[0]).exists()]
+    selection = select_tests(
+        node_ids,
+        change_set,
+        call_map,
+        config_reference_index(root),
+        requirement_test_cases(root),
+        docstring_test_cases(root),
+    )
+    for node_id, reason in selection.reasons.items():
+        logger.info("%s: %s", node_id, reason)
+    return selection.selected
+
+
+def watch(root: Path, directories: tuple[str, ...], pytest_args: list[str], interval: float = 1.0) -> None:
+    """Re-run affected tests whenever a watched file changes (until Ctrl+C).
+
+    Args:
+        root: Repository root
+        directories: Directories relative to root
+        pytest_args: Extra pytest arguments for every run
+        interval: Polling interval in seconds
+    """
+    env = dict(os.environ)
+    server = None
+    endpoint = config.browser_ws_endpoint or running_endpoint()
+    if endpoint is None:
+        server = BrowserServer("chromium", headless=config.headless)
+        server.start()
+        endpoint = server.endpoint(timeout=config.timeout / 1000)
+    if endpoint is not None:
+        env[f"{ENV_PREFIX}BROWSER_WS_ENDPOINT"] = endpoint
+
+    previous = snapshot(root, directories)
+    logger.info("Watching %s (%d files)", ", ".join(directories), len(previous))
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(root, directories)
+            if current == previous:
+                continue
+            changes = {
+                path: changed_lines(previous.get(path, ""), source)
+                for path, source in current.items()
+                if previous.get(path) != source
+            }
+            # Deleted files are reported with no lines, which forces a full run
+            changes.update({path: set() for path in previous.keys() - current.keys()})
+            previous = current
+            logger.info("Changed: %s", ", ".join(sorted(changes)))
+            tests = affected_tests(root, changes)
+            if tests == []:
+                logger.info("No recorded test is affected")
+                continue
+            command = [sys.executable, "-m", "pytest", *pytest_args, *(tests or [])]
+            logger.info("Running %s", "all tests" if tests is None else f"{len(tests)} affected tests")
+            subprocess.run(command, cwd=root, env=env)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", action="append", dest="dirs", help="Directory to watch (repeatable)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Polling interval in seconds")
+    parser.add_argument("pytest_args", nargs="*", help="Extra pytest arguments (after --)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    watch(Path.cwd(), tuple(args.dirs or WATCHED_DIRS), args.pytest_args, args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,582 @@
 """Pytest configuration and fixtures."""
 
+from __future__ import annotations
+
 import logging
-from collections.abc import Generator
+import os
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+import pytest_asyncio
 
+from movie_db_qa.utils.api_log import ApiCallLog
+from movie_db_qa.utils.cassette import CassetteStore, install_cassette, install_cassette_async
 from movie_db_qa.utils.config import config
+from movie_db_qa.utils.context_pool import ContextPool
+from movie_db_qa.utils.logger import RingBufferHandler, start_queue_logging, stop_queue_logging
+from movie_db_qa.utils.resource_policy import (
+    ResourcePolicy,
+    ResourceStats,
+    install_resource_policy,
+    install_resource_policy_async,
+)
+from movie_db_qa.utils.response_cache import ResponseCache
+from movie_db_qa.utils.screenshots import EXTENSIONS, ScreenshotWriter, capture
+from movie_db_qa.utils.tracing import TRACE_SUFFIX, TraceRecorder
+from movie_db_qa.utils.workers import (
+    clean_worker_logs,
+    is_worker,
+    merge_worker_artifacts,
+    merge_worker_logs,
+    worker_artifact_dir,
+    worker_id,
+    worker_log_file,
+)
+
+# Playwright is only imported once a browser fixture runs, and opt-in features
+# (impact selection, history, perf, benchmarks, warm start, stand-in server,
+# browser server) only when a hook or fixture uses them, so collection and
+# non-browser tests do not pay for them
+if TYPE_CHECKING:
+    from playwright.async_api import Browser as AsyncBrowser
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.sync_api import Browser, BrowserContext, Page, Playwright
 
-# Screenshot directory
+    from movie_db_qa.impact import CallMap
+    from movie_db_qa.utils.benchmark import BenchmarkResult
+    from movie_db_qa.utils.browser_server import BrowserServer
+    from movie_db_qa.utils.history import FlakinessScore, HistoryStore
+    from movie_db_qa.utils.perf import PerfRecorder
+    from movie_db_qa.utils.stand_in_server import StandInServer
+    from movie_db_qa.utils.warm_start import WarmStartCache
+
+# Screenshot directory (created by the screenshot writer on first write)
 SCREENSHOT_DIR = Path("artifacts/bug-screenshots")
-SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
 
-# Log directory
+# Log directory (created when the first log file is opened)
 LOG_DIR = Path("artifacts/logs")
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+# Options shared by every test context
+CONTEXT_OPTIONS: dict[str, Any] = {"viewport": {"width": 1920, "height": 1080}}
+
+# Session-wide objects reported in the terminal summary
+CONTEXT_POOL_KEY: pytest.StashKey[ContextPool] = pytest.StashKey()
+PERF_RECORDER_KEY: pytest.StashKey[PerfRecorder] = pytest.StashKey()
+PERF_REPORT_KEY: pytest.StashKey[list[str]] = pytest.StashKey()
+BENCHMARK_RESULTS_KEY: pytest.StashKey[list[BenchmarkResult]] = pytest.StashKey()
+SCREENSHOT_WRITER_KEY: pytest.StashKey[ScreenshotWriter] = pytest.StashKey()
+WARM_START_KEY: pytest.StashKey[WarmStartCache] = pytest.StashKey()
+BROWSER_SERVER_KEY: pytest.StashKey[BrowserServer] = pytest.StashKey()
+TRACE_RECORDER_KEY: pytest.StashKey[TraceRecorder] = pytest.StashKey()
+RESOURCE_STATS_KEY: pytest.StashKey[ResourceStats] = pytest.StashKey()
+RESPONSE_CACHE_KEY: pytest.StashKey[ResponseCache] = pytest.StashKey()
+CALL_MAP_KEY: pytest.StashKey[CallMap] = pytest.StashKey()
+IMPACT_REPORT_KEY: pytest.StashKey[list[str]] = pytest.StashKey()
+HISTORY_KEY: pytest.StashKey[HistoryStore] = pytest.StashKey()
+HISTORY_REPORT_KEY: pytest.StashKey[list[str]] = pytest.StashKey()
+
+# Run id of performance samples and test history, exported by the controller so xdist workers share it
+RUN_ID_ENV = "MOVIE_DB_QA_RUN_ID"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options for the test framework.
+
+    Args:
+        parser: Pytest argument parser
+    """
+    parser.addoption(
+        "--tmdb-mode",
+        choices=["live", "record", "replay"],
+        default=None,
+        help="TMDB API traffic mode: live network, record cassettes or replay cassettes",
+    )
+    parser.addoption(
+        "--perf",
+        action="store_true",
+        default=False,
+        help="Collect web performance metrics and compare them against the stored baseline",
+    )
+    parser.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        default=False,
+        help="Store this run's p50/p95 performance metrics as the new baseline",
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run only the page object micro-benchmarks (against the local stand-in backend)",
+    )
+    parser.addoption(
+        "--benchmark-json",
+        default="artifacts/benchmarks/results.json",
+        help="File the benchmark results are saved to",
+    )
+    parser.addoption(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="Run only tests affected by changes since a git ref (full run if the call map is missing or stale)",
+    )
+    parser.addoption(
+        "--record-call-map",
+        action="store_true",
+        default=False,
+        help="Record which framework functions each test calls (for --changed-since)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Apply command line options to the framework config.
+
+    Args:
+        config: Pytest config object
+    """
+    # Hook argument shadows the framework config, so import it under an alias
+    from movie_db_qa.utils.config import config as framework_config
+
+    tmdb_mode = config.getoption("--tmdb-mode")
+    if tmdb_mode:
+        framework_config.tmdb_mode = tmdb_mode
+
+    # Controller (or serial run): drop worker logs from a previous parallel run
+    if not is_worker():
+        clean_worker_logs(LOG_DIR)
+
+    if config.getoption("--perf") or config.getoption("--perf-update-baseline"):
+        framework_config.perf_metrics = True
+    run_id = os.environ.setdefault(RUN_ID_ENV, time.strftime("%Y%m%dT%H%M%S"))
+    if framework_config.perf_metrics:
+        from movie_db_qa.utils.perf import PerfRecorder
+
+        config.stash[PERF_RECORDER_KEY] = PerfRecorder(run_id)
+    # Benchmark runs are not the functional suite: keep them out of its history
+    if framework_config.test_history and not config.getoption("--benchmark"):
+        from movie_db_qa.utils.history import HistoryStore
+
+        config.stash[HISTORY_KEY] = HistoryStore(config.rootpath / framework_config.test_history_db)
+
+    # Benchmarks measure the page objects, not TMDB: serve everything locally
+    if config.getoption("--benchmark"):
+        framework_config.use_stand_in = True
+        config.stash[BENCHMARK_RESULTS_KEY] = []
+
+    # Tracing would skew benchmark timings
+    if framework_config.trace_on_failure and not config.getoption("--benchmark"):
+        config.stash[TRACE_RECORDER_KEY] = TraceRecorder(
+            screenshots=framework_config.trace_screenshots,
+            snapshots=framework_config.trace_snapshots,
+            baseline_sample=framework_config.trace_baseline_sample,
+            run_id=run_id,
+        )
+
+    if config.getoption("--record-call-map"):
+        from movie_db_qa.impact import CallMap
+
+        config.stash[CALL_MAP_KEY] = CallMap()
+
+    from movie_db_qa.utils.browser_server import BrowserServer, running_endpoint
+
+    # Reuse a long-lived browser server (make browser-server) when one is running
+    if not framework_config.browser_ws_endpoint:
+        framework_config.browser_ws_endpoint = running_endpoint() or ""
+    # Otherwise boot the browser while tests are collected (the xdist controller runs no tests)
+    prelaunch = framework_config.browser_prelaunch and not framework_config.browser_ws_endpoint
+    if (
+        prelaunch
+        and not config.getoption("collectonly")
+        and (is_worker() or not getattr(config.option, "numprocesses", None))
+    ):
+        server = BrowserServer("chromium", headless=framework_config.headless)
+        server.start()
+        config.stash[BROWSER_SERVER_KEY] = server
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """Stop the pre-launched browser if no selected test needs one.
+
+    Args:
+        session: Pytest session
+    """
+    server = session.config.stash.get(BROWSER_SERVER_KEY, None)
+    if server is not None and not any("browser" in getattr(item, "fixturenames", ()) for item in session.items):
+        server.stop()
+        del session.config.stash[BROWSER_SERVER_KEY]
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Shut down the pre-launched browser server.
+
+    Args:
+        config: Pytest config object
+    """
+    server = config.stash.get(BROWSER_SERVER_KEY, None)
+    if server is not None:
+        server.stop()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Split benchmarks from the functional suite, apply impact selection and adaptive retries.
+
+    Args:
+        config: Pytest config object
+        items: Collected test items (modified in place)
+    """
+    benchmark_mode = config.getoption("--benchmark")
+    selected = [item for item in items if (item.get_closest_marker("benchmark") is not None) == benchmark_mode]
+    if benchmark_mode:
+        _skip_without_snapshot(selected)
+    base = config.getoption("--changed-since")
+    if base and not benchmark_mode:
+        selected = _select_impacted(config, base, selected)
+    deselected = [item for item in items if item not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    history = config.stash.get(HISTORY_KEY, None)
+    if history is not None:
+        _apply_adaptive_retries(config, history, items)
+
+
+def _skip_without_snapshot(items: list[pytest.Item]) -> None:
+    """Skip benchmarks when the stand-in server has no SPA snapshot to serve."""
+    from movie_db_qa.utils.config import config as framework_config
+
+    snapshot = Path(framework_config.spa_snapshot_dir) / "index.html"
+    if snapshot.is_file():
+        return
+    skip = pytest.mark.skip(
+        reason=f"Benchmarks run against the stand-in server, but {snapshot} is missing - "
+        "run 'make snapshot-spa' while online first"
+    )
+    for item in items:
+        item.add_marker(skip)
+
+
+def _apply_adaptive_retries(config: pytest.Config, history: HistoryStore, items: list[pytest.Item]) -> None:
+    """Mark tests with a flaky history for reruns; every other test fails on its first failure.
+
+    Reruns use pytest-rerunfailures' ``flaky`` marker; tests that already
+    carry one keep it. Under xdist the controller reports the retries
+    (see ``pytest_xdist_node_collection_finished``), so workers only mark.
+    """
+    from movie_db_qa.utils.config import config as framework_config
+
+    scores = history.scores(framework_config.flaky_window)
+    flaky = [
+        item
+        for item in items
+        if item.nodeid in scores
+        and scores[item.nodeid].flaky(framework_config.flaky_threshold, framework_config.flaky_min_runs)
+        and item.get_closest_marker("flaky") is None
+    ]
+    if not is_worker():
+        _report_history(config, scores, [item.nodeid for item in items], [item.nodeid for item in flaky])
+    if not config.pluginmanager.hasplugin("rerunfailures"):
+        return
+    for item in flaky:
+        item.add_marker(pytest.mark.flaky(reruns=framework_config.flaky_reruns))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_node_collection_finished(node: Any, ids: list[str]) -> None:
+    """Report adaptive retries on the xdist controller, which collects no items itself.
+
+    Args:
+        node: Worker controller that finished collecting
+        ids: Node ids the worker collected (identical on every worker)
+    """
+    from movie_db_qa.utils.config import config as framework_config
+
+    config = node.config
+    history = config.stash.get(HISTORY_KEY, None)
+    if history is None or HISTORY_REPORT_KEY in config.stash:
+        return
+    scores = history.scores(framework_config.flaky_window)
+    flaky = [
+        node_id
+        for node_id in ids
+        if node_id in scores
+        and scores[node_id].flaky(framework_config.flaky_threshold, framework_config.flaky_min_runs)
+    ]
+    _report_history(config, scores, ids, flaky)
+
+
+def _report_history(
+    config: pytest.Config, scores: dict[str, FlakinessScore], node_ids: list[str], flaky: list[str]
+) -> None:
+    """Build the "test history" terminal section from the flakiness scores."""
+    from movie_db_qa.utils.config import config as framework_config
+
+    report = config.stash.setdefault(HISTORY_REPORT_KEY, [])
+    # Confirmed failures: failed every recent run, however they flaked before
+    min_runs = framework_config.flaky_min_runs
+    failing = [node_id for node_id in node_ids if node_id in scores and scores[node_id].failing(min_runs)]
+    if failing:
+        report.append(f"Failing in the last {min_runs}+ runs (no retries): {', '.join(failing)}")
+    if not flaky:
+        return
+    if not config.pluginmanager.hasplugin("rerunfailures"):
+        report.append(f"{len(flaky)} flaky tests not retried: pytest-rerunfailures is not installed")
+        return
+    for node_id in flaky:
+        report.append(
+            f"Retrying up to {framework_config.flaky_reruns}x: {node_id} "
+            f"(flakiness {scores[node_id].score:.0%} over {scores[node_id].runs} runs)"
+        )
+
+
+def _select_impacted(config: pytest.Config, base: str, items: list[pytest.Item]) -> list[pytest.Item]:
+    """Keep the tests a diff against ``base`` can affect.
+
+    Falls back to every test (and records a fresh call map) when the call map
+    is missing, the entry of any collected test is older than
+    ``impact_max_age_hours``, git cannot diff against ``base``, or the diff
+    touches files the call map cannot trace.
+    """
+    from movie_db_qa.impact import (
+        CallMap,
+        analyze_changes,
+        changed_lines,
+        config_reference_index,
+        docstring_test_cases,
+        requirement_test_cases,
+        select_tests,
+    )
+    from movie_db_qa.utils.config import config as framework_config
+
+    root = Path(str(config.rootpath))
+    report = config.stash.setdefault(IMPACT_REPORT_KEY, [])
+    call_map = CallMap.load(root / framework_config.impact_call_map)
+    try:
+        change_set = analyze_changes(changed_lines(base, root), root)
+    except ValueError as error:
+        report.append(f"Full run: {error}")
+        config.stash.setdefault(CALL_MAP_KEY, CallMap())
+        return items
+    full_run_reason = change_set.full_run_reason
+    if call_map is None:
+        full_run_reason = "no call map recorded"
+    elif (age := call_map.age_hours(item.nodeid for item in items)) > framework_config.impact_max_age_hours:
+        full_run_reason = f"call map is {age:.0f}h old (max {framework_config.impact_max_age_hours:g}h)"
+    if call_map is None or full_run_reason is not None:
+        report.append(f"Full run: {full_run_reason}")
+        config.stash.setdefault(CALL_MAP_KEY, CallMap())
+        return items
+
+    selection = select_tests(
+        [item.nodeid for item in items],
+        change_set,
+        call_map,
+        config_reference_index(root),
+        requirement_test_cases(root),
+        docstring_test_cases(root),
+    )
+    report.append(f"Changes since {base}: {change_set.describe()}")
+    report.extend(f"{node_id}: {reason}" for node_id, reason in selection.reasons.items())
+    report.append(f"Selected {len(selection.selected)} of {len(items)} tests")
+    selected = set(selection.selected)
+    return [item for item in items if item.nodeid in selected]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None) -> Generator[None, Any, None]:
+    """Record the functions each test executes (setup, call and teardown) into the call map.
+
+    Args:
+        item: Test item
+        nextitem: Next test item
+
+    Yields:
+        Test run
+    """
+    call_map = item.config.stash.get(CALL_MAP_KEY, None)
+    if call_map is None:
+        yield
+        return
+    from movie_db_qa.impact import CallRecorder
+
+    recorder = CallRecorder(Path(str(item.config.rootpath)))
+    recorder.start()
+    try:
+        yield
+    finally:
+        call_map.record(item.nodeid, recorder.stop())
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Write performance samples and merge per-worker artifacts after a run.
+
+    Args:
+        session: Pytest session
+        exitstatus: Session exit status
+    """
+    recorder = session.config.stash.get(PERF_RECORDER_KEY, None)
+    if recorder is not None:
+        recorder.write(config.perf_history_file)
+    history = session.config.stash.get(HISTORY_KEY, None)
+    if history is not None:
+        history.flush()
+    call_map = session.config.stash.get(CALL_MAP_KEY, None)
+    call_map_file = session.config.rootpath / config.impact_call_map
+    if is_worker():
+        # Workers have no terminal summary: log their tracing overhead instead
+        tracer = session.config.stash.get(TRACE_RECORDER_KEY, None)
+        if tracer is not None and tracer.stats.traced_tests + tracer.stats.baseline_tests:
+            logger.info(tracer.stats.summary(config.trace_overhead_budget))
+        resource_stats = session.config.stash.get(RESOURCE_STATS_KEY, None)
+        if resource_stats is not None:
+            logger.info(resource_stats.summary())
+        if call_map is not None and call_map.tests:
+            call_map.save(call_map_file.with_suffix(f".{worker_id()}.json"))
+        return
+    worker_maps = call_map_file.parent.glob(f"{call_map_file.stem}.gw*{call_map_file.suffix}")
+    if call_map is not None or any(worker_maps):
+        from movie_db_qa.impact import merge_call_maps
+
+        if merge_call_maps(call_map_file, call_map) is not None:
+            logger.info("Updated test impact call map %s", call_map_file)
+    merged_log = merge_worker_logs(LOG_DIR)
+    if merged_log is not None:
+        moved = merge_worker_artifacts(SCREENSHOT_DIR)
+        logger.info("Merged worker logs into %s (%d worker screenshots)", merged_log, moved)
+    if recorder is not None:
+        _check_perf_regressions(session, recorder.run_id)
+    benchmark_results = session.config.stash.get(BENCHMARK_RESULTS_KEY, None)
+    if benchmark_results:
+        from movie_db_qa.utils.benchmark import save_results
+
+        path = save_results(benchmark_results, session.config.getoption("--benchmark-json"))
+        logger.info("Saved %d benchmark results to %s", len(benchmark_results), path)
+
+
+def _check_perf_regressions(session: pytest.Session, run_id: str) -> None:
+    """Compare this run's p50/p95 against the baseline (all workers' samples).
+
+    Args:
+        session: Pytest session
+        run_id: Performance run id
+    """
+    from movie_db_qa.utils.perf import compare, load_baseline, load_samples, prune_history, save_baseline, summarize
+
+    # Every worker has appended its samples by now: trim the series before reading it back
+    if dropped := prune_history(config.perf_history_file, config.perf_history_runs):
+        logger.info("Dropped %d old runs from %s", dropped, config.perf_history_file)
+    summary = summarize(load_samples(config.perf_history_file, run_id))
+    if not summary:
+        return
+    report = [
+        f"{metric}: n={stats['n']} p50={stats['p50']:.1f} p95={stats['p95']:.1f}" for metric, stats in summary.items()
+    ]
+    if session.config.getoption("--perf-update-baseline"):
+        save_baseline(summary, config.perf_baseline_file)
+        report.append(f"Baseline updated: {config.perf_baseline_file}")
+    else:
+        regressions = compare(summary, load_baseline(config.perf_baseline_file), config.perf_threshold)
+        for regression in regressions:
+            logger.warning("Performance regression: %s", regression.describe())
+            report.append(f"REGRESSION {regression.describe()}")
+        if regressions and config.perf_fail_on_regression:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    session.config.stash[PERF_REPORT_KEY] = report
 
 
 @pytest.fixture(scope="session", autouse=True)
-def configure_logging() -> Generator[None, None, None]:
-    """Configure root logger to capture all test logs to file.
+def configure_logging() -> Generator[RingBufferHandler, None, None]:
+    """Configure root logger to capture all test logs.
+
+    This runs once per test session and captures logs from all modules. File
+    writes go through a queue to a background thread, so logging never blocks
+    the driver thread; with ``config.log_mode == "failures"`` there is no
+    session log at all, only the per-test ring buffer.
 
-    This runs once per test session and captures logs from all modules.
+    Yields:
+        Ring buffer holding the current test's records
     """
-    # Configure root logger with both console and file handlers
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
-    # File handler
-    log_file = LOG_DIR / "test_execution.log"
-    file_handler = logging.FileHandler(log_file, mode="w")  # Overwrite each run
-    file_handler.setLevel(logging.INFO)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    listener = None
+    if config.log_mode == "full":
+        # File handler (one file per xdist worker, merged at session end)
+        log_file = worker_log_file(LOG_DIR)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, mode="w")  # Overwrite each run
+        file_handler.setLevel(logging.INFO)
+        file_formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        file_handler.setFormatter(file_formatter)
+        listener = start_queue_logging(root_logger, file_handler)
 
-    yield
+    ring_buffer = RingBufferHandler(config.log_buffer_size)
+    root_logger.addHandler(ring_buffer)
+
+    yield ring_buffer
+
+    # Cleanup (stopping the listener drains queued records first)
+    root_logger.removeHandler(ring_buffer)
+    if listener is not None:
+        stop_queue_logging(listener)
 
-    # Cleanup
-    file_handler.close()
-    root_logger.removeHandler(file_handler)
+
+@pytest.fixture(autouse=True)
+def failure_log_buffer(
+    configure_logging: RingBufferHandler, request: pytest.FixtureRequest
+) -> Generator[None, None, None]:
+    """Write a test's log records to ``artifacts/logs/failures/`` only if it fails.
+
+    Args:
+        configure_logging: Session ring buffer handler
+        request: Pytest request fixture for test metadata
+
+    Yields:
+        Control to the test
+    """
+    configure_logging.clear()
+    yield
+    reports = [getattr(request.node, f"rep_{when}", None) for when in ("setup", "call")]
+    if any(report is not None and report.failed for report in reports):
+        path = LOG_DIR / "failures" / f"{request.node.name}.jsonl"
+        count = configure_logging.flush_to(path)
+        logger.info("Test failed - wrote %d buffered log records to %s", count, path)
+    else:
+        configure_logging.clear()
 
 
 # Module logger
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def stand_in_server() -> Generator[StandInServer | None, None, None]:
+    """Serve the SPA snapshot and fake TMDB API locally when enabled.
+
+    Starts once per session on an ephemeral port and points ``config.base_url``
+    at it, so every ``DiscoverPage`` loads from localhost.
+
+    Yields:
+        Running stand-in server, or None when ``config.use_stand_in`` is off
+    """
+    if not config.use_stand_in:
+        yield None
+        return
+
+    from movie_db_qa.utils.stand_in_server import StandInServer
+
+    server = StandInServer(config.spa_snapshot_dir, config.cassette_dir)
+    original_base_url = config.base_url
+    config.base_url = server.start()
+    yield server
+    config.base_url = original_base_url
+    server.stop()
+
+
 @pytest.fixture(scope="session")
 def playwright_instance() -> Generator[Playwright, None, None]:
     """Create Playwright instance for session.
@@ -57,53 +584,355 @@ def playwright_instance() -> Generator[Playwright, None, None]:
     Yields:
         Playwright instance
     """
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as playwright:
         yield playwright
 
 
 @pytest.fixture(scope="session")
-def browser(playwright_instance: Playwright) -> Generator[Browser, None, None]:
-    """Launch browser for session.
+def browser(playwright_instance: Playwright, request: pytest.FixtureRequest) -> Generator[Browser, None, None]:
+    """Connect to a running browser server, or launch a browser for the session.
+
+    A long-lived server (``config.browser_ws_endpoint``) is tried first, then
+    the one pre-launched during collection. Closing a connected browser only
+    disconnects, so a long-lived server keeps running for the next run.
 
     Args:
         playwright_instance: Playwright instance from fixture
+        request: Pytest request fixture (for the pre-launched server)
 
     Yields:
         Browser instance
     """
-    logger.info("Launching %s browser (headless=%s)", config.browser, config.headless)
-    browser = playwright_instance.chromium.launch(
-        headless=config.headless,
-        slow_mo=config.slow_mo,
-    )
+    from playwright.sync_api import Error as PlaywrightError
+
+    server = request.config.stash.get(BROWSER_SERVER_KEY, None)
+    endpoint = config.browser_ws_endpoint or None
+    if endpoint is None and server is not None:
+        endpoint = server.endpoint(timeout=config.timeout / 1000)
+    browser = None
+    if endpoint is not None:
+        logger.info("Connecting to %s browser server at %s", config.browser, endpoint)
+        try:
+            browser = playwright_instance.chromium.connect(endpoint, slow_mo=config.slow_mo)
+        except PlaywrightError:
+            logger.warning("Could not connect to browser server at %s", endpoint, exc_info=True)
+    if browser is None:
+        logger.info("Launching %s browser (headless=%s)", config.browser, config.headless)
+        browser = playwright_instance.chromium.launch(
+            headless=config.headless,
+            slow_mo=config.slow_mo,
+        )
     yield browser
     logger.info("Closing browser")
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, request: pytest.FixtureRequest) -> Generator[ContextPool | None, None, None]:
+    """Keep pre-warmed contexts when ``config.context_pool_size`` > 0.
+
+    Warm-start contexts are created from the cached storage state and never
+    pooled, so with ``config.warm_start`` the pool only serves ``cold_start``
+    tests and is filled on demand instead of pre-warmed.
+
+    Args:
+        browser: Browser instance from fixture
+        request: Pytest request fixture (used to expose pool stats)
+
+    Yields:
+        Context pool, or None when pooling is disabled
+    """
+    if config.context_pool_size <= 0:
+        yield None
+        return
+
+    pool = ContextPool(browser, config.context_pool_size, **CONTEXT_OPTIONS)
+    if config.warm_start:
+        logger.warning(
+            "Warm start is on: contexts start from the cached storage state and bypass the context pool, "
+            "which only serves cold_start tests (MOVIE_DB_QA_CONTEXT_POOL_SIZE=%d)",
+            config.context_pool_size,
+        )
+    else:
+        pool.prewarm()
+    request.config.stash[CONTEXT_POOL_KEY] = pool
+    yield pool
+    logger.info(pool.stats.summary())
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def response_cache(
+    stand_in_server: StandInServer | None,
+    request: pytest.FixtureRequest,
+) -> Generator[ResponseCache | None, None, None]:
+    """Share TMDB responses between contexts when ``config.response_cache`` is on.
+
+    Only live TMDB traffic is cached: cassettes and the stand-in server are
+    local already, and record mode must see the network.
+
+    Args:
+        stand_in_server: Local stand-in server (None when disabled)
+        request: Pytest request fixture (used to expose cache stats)
+
+    Yields:
+        Response cache, or None when disabled
+    """
+    if not config.response_cache or stand_in_server is not None or config.tmdb_mode != "live":
+        yield None
+        return
+
+    cache = ResponseCache(config.response_cache_max_bytes, config.response_cache_ttl)
+    request.config.stash[RESPONSE_CACHE_KEY] = cache
+    yield cache
+    logger.info(cache.stats.summary())
+
+
+def _install_tmdb_routes(
+    context: BrowserContext,
+    stand_in_server: StandInServer | None,
+    response_cache: ResponseCache | None = None,
+) -> None:
+    """Point a context's TMDB traffic at the stand-in server, the cassette store or the response cache."""
+    if stand_in_server is not None:
+        from movie_db_qa.utils.stand_in_server import install_api_redirect
+
+        install_api_redirect(context, config.tmdb_api_host, stand_in_server.url)
+    elif response_cache is not None:
+        response_cache.install(context, config.tmdb_api_host)
+    else:
+        # Record/replay TMDB traffic (no-op in live mode)
+        install_cassette(context, CassetteStore(config.cassette_dir), config.tmdb_mode, config.tmdb_api_host)
+
+
+@pytest.fixture(scope="session")
+def warm_start_cache(
+    browser: Browser,
+    stand_in_server: StandInServer | None,
+    response_cache: ResponseCache | None,
+    request: pytest.FixtureRequest,
+) -> Generator[WarmStartCache | None, None, None]:
+    """Seed the warm-start cache once per session when ``config.warm_start`` is on.
+
+    The cache is discarded and re-seeded when the served SPA bundle changes.
+
+    Args:
+        browser: Browser instance from fixture
+        stand_in_server: Local stand-in server (None when disabled)
+        response_cache: Shared TMDB response cache (None when disabled)
+        request: Pytest request fixture (used to expose cache stats)
+
+    Yields:
+        Seeded cache, or None when warm start is disabled
+    """
+    if not config.warm_start:
+        yield None
+        return
+
+    from movie_db_qa.utils.warm_start import WarmStartCache, fetch_bundle_hash
+
+    cache = WarmStartCache(worker_artifact_dir(Path(config.warm_start_dir)))
+    if not cache.validate(fetch_bundle_hash(config.base_url)) or not cache.seeded:
+        cache.seed(
+            browser,
+            config.base_url,
+            _cached_api_host(stand_in_server),
+            lambda context: _install_tmdb_routes(context, stand_in_server, response_cache),
+            **CONTEXT_OPTIONS,
+        )
+    request.config.stash[WARM_START_KEY] = cache
+    yield cache
+    logger.info(cache.stats.summary())
+
+
+def _cached_api_host(stand_in_server: StandInServer | None) -> str | None:
+    """TMDB host whose metadata the warm-start cache may fetch (live network only)."""
+    return config.tmdb_api_host if stand_in_server is None and config.tmdb_mode == "live" else None
+
+
+def _resource_policy(node: pytest.Item) -> ResourcePolicy:
+    """Resource policy for a test: its ``resources`` marker, else the configured one."""
+    marker = node.get_closest_marker("resources")
+    return ResourcePolicy.from_config(config) if marker is None else ResourcePolicy.from_marker(**marker.kwargs)
+
+
+def _failed_or_xfailed(node: pytest.Item) -> bool:
+    """Whether a test failed in setup or call, or failed as expected (xfail)."""
+    setup, call = getattr(node, "rep_setup", None), getattr(node, "rep_call", None)
+    return bool(
+        (setup is not None and setup.failed) or (call is not None and (call.failed or hasattr(call, "wasxfail")))
+    )
+
+
 @pytest.fixture
-def context(browser: Browser) -> Generator[BrowserContext, None, None]:
-    """Create new browser context for each test.
+def context(
+    browser: Browser,
+    context_pool: ContextPool | None,
+    stand_in_server: StandInServer | None,
+    response_cache: ResponseCache | None,
+    warm_start_cache: WarmStartCache | None,
+    request: pytest.FixtureRequest,
+) -> Generator[BrowserContext, None, None]:
+    """Create (or borrow from the pool) a clean browser context for each test.
+
+    With warm start enabled, contexts are created from the cached storage
+    state instead (pooled contexts are reset to a blank state); tests marked
+    ``cold_start`` always get a cold context. With ``config.trace_on_failure``
+    each test records a trace chunk that is kept only if the test fails (a
+    small sample runs untraced to measure the tracing overhead).
+    Images, media, fonts and third-party hosts are blocked or stubbed per the
+    configured resource policy, or the test's ``resources`` marker.
 
     Args:
         browser: Browser instance from fixture
+        context_pool: Pre-warmed context pool (None when disabled)
+        stand_in_server: Local stand-in server (None when disabled)
+        response_cache: Shared TMDB response cache (None when disabled)
+        warm_start_cache: Warm-start cache (None when disabled)
+        request: Pytest request fixture (for the ``cold_start`` and ``resources`` markers)
 
     Yields:
         Browser context
     """
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-    )
+    warm = warm_start_cache if request.node.get_closest_marker("cold_start") is None else None
+    pooled = warm is None and context_pool is not None
+    if warm is not None:
+        context = browser.new_context(**CONTEXT_OPTIONS, **warm.context_options())
+    elif context_pool is not None:
+        context = context_pool.acquire()
+    else:
+        context = browser.new_context(**CONTEXT_OPTIONS)
+    _install_tmdb_routes(context, stand_in_server, response_cache)
+    if warm is not None:
+        # Registered last so it is consulted first, falling back to the TMDB routes
+        warm.install(context, config.base_url, _cached_api_host(stand_in_server))
+    policy = _resource_policy(request.node)
+    if policy.active:
+        install_resource_policy(context, policy, request.config.stash.setdefault(RESOURCE_STATS_KEY, ResourceStats()))
+    tracer = request.config.stash.get(TRACE_RECORDER_KEY, None)
+    if tracer is not None:
+        # Expected failures are always traced: their trace is defect evidence
+        baseline = request.node.get_closest_marker("xfail") is None and tracer.in_baseline(request.node.nodeid)
+        tracer.begin(context, request.node.nodeid, traced=not baseline)
     yield context
-    context.close()
+    if tracer is not None:
+        keep = _failed_or_xfailed(request.node)
+        tracer.end(context, SCREENSHOT_DIR / f"{request.node.name}_call{TRACE_SUFFIX}" if keep else None)
+    if pooled and context_pool is not None:
+        context_pool.release(context)
+    else:
+        context.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_browser() -> AsyncGenerator[AsyncBrowser, None]:
+    """Launch an async-API browser for concurrent multi-tab tests.
+
+    Yields:
+        Async browser instance
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        logger.info("Launching async %s browser (headless=%s)", config.browser, config.headless)
+        browser = await playwright.chromium.launch(headless=config.headless, slow_mo=config.slow_mo)
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_context(
+    async_browser: AsyncBrowser,
+    stand_in_server: StandInServer | None,
+    response_cache: ResponseCache | None,
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[AsyncBrowserContext, None]:
+    """Create an async browser context; tests open as many tabs as they need.
+
+    Args:
+        async_browser: Async browser instance from fixture
+        stand_in_server: Local stand-in server (None when disabled)
+        response_cache: Shared TMDB response cache (None when disabled)
+        request: Pytest request fixture (for the ``resources`` marker)
+
+    Yields:
+        Async browser context
+    """
+    context = await async_browser.new_context(**CONTEXT_OPTIONS)
+    if stand_in_server is not None:
+        from movie_db_qa.utils.stand_in_server import install_api_redirect_async
+
+        await install_api_redirect_async(context, config.tmdb_api_host, stand_in_server.url)
+    elif response_cache is not None:
+        await response_cache.install_async(context, config.tmdb_api_host)
+    else:
+        await install_cassette_async(
+            context, CassetteStore(config.cassette_dir), config.tmdb_mode, config.tmdb_api_host
+        )
+    policy = _resource_policy(request.node)
+    if policy.active:
+        stats = request.config.stash.setdefault(RESOURCE_STATS_KEY, ResourceStats())
+        await install_resource_policy_async(context, policy, stats)
+    yield context
+    await context.close()
+
+
+@pytest.fixture
+def bench(page: Page, request: pytest.FixtureRequest) -> Callable[..., BenchmarkResult]:
+    """Run a micro-benchmark and collect its result for the session report.
+
+    Rounds whose page action timed out fail the benchmark, so a result is
+    only reported when every round measured the operation itself.
+
+    Args:
+        page: Page the benchmarked page objects act on (its action timings are checked)
+        request: Pytest request fixture (used to reach the session results)
+
+    Returns:
+        ``run_benchmark`` bound to the session result list
+    """
+    from movie_db_qa.utils.benchmark import run_benchmark
+
+    results = request.config.stash.get(BENCHMARK_RESULTS_KEY, [])
+
+    def run(name: str, operation: Callable[[], object], setup: Callable[[], object] | None = None) -> BenchmarkResult:
+        # Page objects attach the shared timing list when they are created
+        result = run_benchmark(name, operation, setup, timings=getattr(page, "action_timings", None))
+        results.append(result)
+        return result
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def screenshot_writer(request: pytest.FixtureRequest) -> Generator[ScreenshotWriter, None, None]:
+    """Background writer for failure screenshots (flushed at session end).
+
+    Args:
+        request: Pytest request fixture (used to expose writer stats)
+
+    Yields:
+        Screenshot writer
+    """
+    writer = ScreenshotWriter()
+    request.config.stash[SCREENSHOT_WRITER_KEY] = writer
+    yield writer
+    writer.close()
 
 
 @pytest.fixture
-def page(context: BrowserContext, request: pytest.FixtureRequest) -> Generator[Page, None, None]:
+def page(
+    context: BrowserContext,
+    screenshot_writer: ScreenshotWriter,
+    request: pytest.FixtureRequest,
+) -> Generator[Page, None, None]:
     """Create new page for each test.
 
     Args:
         context: Browser context from fixture
+        screenshot_writer: Background writer for failure screenshots
         request: Pytest request fixture for test metadata
 
     Yields:
@@ -112,29 +941,15 @@ def page(context: BrowserContext, request: pytest.FixtureRequest) -> Generator[P
     page = context.new_page()
     page.set_default_timeout(config.timeout)
 
-    # Store API calls for validation (attached to page for test access)
-    api_calls: list[dict[str, Any]] = []
-    page.api_calls = api_calls  # type: ignore[attr-defined]
+    perf_recorder = request.config.stash.get(PERF_RECORDER_KEY, None)
+    if perf_recorder is not None:
+        perf_recorder.install(page)
 
-    def handle_request(request: Any) -> None:
-        """Capture API requests for validation.
-
-        Args:
-            request: Playwright request object
-        """
-        # Filter for TMDB API calls
-        if "api.themoviedb.org" in request.url:
-            api_calls.append(
-                {
-                    "url": request.url,
-                    "method": request.method,
-                    "resource_type": request.resource_type,
-                }
-            )
-            logger.info("API call captured: %s %s", request.method, request.url)
-
-    # Attach request listener
-    page.on("request", handle_request)
+    # Indexed, timed TMDB call log (attached to page for test access); captured
+    # by a TMDB-host route so images and fonts never reach Python
+    api_calls = ApiCallLog()
+    api_calls.install(page, config.tmdb_api_host)
+    page.api_calls = api_calls  # type: ignore[attr-defined]
 
     yield page
 
@@ -145,18 +960,89 @@ def page(context: BrowserContext, request: pytest.FixtureRequest) -> Generator[P
         if request.node.rep_call.failed or (
             hasattr(request.node.rep_call, "wasxfail") and request.node.rep_call.wasxfail
         ):
-            screenshot_name = f"{request.node.name}_{request.node.rep_call.when}.png"
+            extension = EXTENSIONS[config.screenshot_format]
+            screenshot_name = f"{request.node.name}_{request.node.rep_call.when}{extension}"
+            # Shared directory even under xdist: names are unique per test, writes are
+            # atomic, and the writer must see the previous run's file to skip it
             screenshot_path = SCREENSHOT_DIR / screenshot_name
             status = "xfail" if hasattr(request.node.rep_call, "wasxfail") else "failed"
             logger.info("Test %s - capturing screenshot: %s", status, screenshot_path)
-            page.screenshot(path=str(screenshot_path))
+            # Only the capture runs here; comparing and writing happen in the background
+            image = capture(page, config.screenshot_format, config.screenshot_quality, config.screenshot_clip_grid)
+            screenshot_writer.submit(screenshot_path, image)
 
+    if perf_recorder is not None:
+        perf_recorder.collect(page, request.node.nodeid, getattr(page, "action_timings", ()))
+
+    # Summarizing resolves every call's timing over IPC: only pay for it when the lines are logged
+    latency_level = logging.INFO if perf_recorder is not None else logging.DEBUG
+    if logger.isEnabledFor(latency_level):
+        for endpoint, stats in api_calls.latency_summary().items():
+            logger.log(
+                latency_level,
+                "API latency %s: n=%d median=%.1f ms ttfb=%.1f ms bytes=%d",
+                endpoint,
+                stats["count"],
+                stats["median_ms"],
+                stats["median_ttfb_ms"],
+                stats["bytes"],
+            )
     page.close()
 
 
+def pytest_terminal_summary(terminalreporter: Any, exitstatus: int, config: pytest.Config) -> None:
+    """Report framework counters at the end of the run.
+
+    Args:
+        terminalreporter: Pytest terminal reporter
+        exitstatus: Session exit status
+        config: Pytest config object
+    """
+    pool = config.stash.get(CONTEXT_POOL_KEY, None)
+    if pool is not None:
+        terminalreporter.write_line(pool.stats.summary())
+    writer = config.stash.get(SCREENSHOT_WRITER_KEY, None)
+    if writer is not None:
+        terminalreporter.write_line(writer.stats.summary())
+    warm_start = config.stash.get(WARM_START_KEY, None)
+    if warm_start is not None:
+        terminalreporter.write_line(warm_start.stats.summary())
+    tracer = config.stash.get(TRACE_RECORDER_KEY, None)
+    if tracer is not None and tracer.stats.traced_tests + tracer.stats.baseline_tests:
+        from movie_db_qa.utils.config import config as framework_config
+
+        terminalreporter.write_line(tracer.stats.summary(framework_config.trace_overhead_budget))
+    resource_stats = config.stash.get(RESOURCE_STATS_KEY, None)
+    if resource_stats is not None:
+        terminalreporter.write_line(resource_stats.summary())
+    response_cache = config.stash.get(RESPONSE_CACHE_KEY, None)
+    if response_cache is not None:
+        terminalreporter.write_line(response_cache.stats.summary())
+    perf_report = config.stash.get(PERF_REPORT_KEY, None)
+    if perf_report:
+        terminalreporter.section("performance")
+        for line in perf_report:
+            terminalreporter.write_line(line)
+    history_report = config.stash.get(HISTORY_REPORT_KEY, None)
+    if history_report:
+        terminalreporter.section("test history")
+        for line in history_report:
+            terminalreporter.write_line(line)
+    impact_report = config.stash.get(IMPACT_REPORT_KEY, None)
+    if impact_report:
+        terminalreporter.section("test impact")
+        for line in impact_report:
+            terminalreporter.write_line(line)
+    benchmark_results = config.stash.get(BENCHMARK_RESULTS_KEY, None)
+    if benchmark_results:
+        terminalreporter.section("benchmarks")
+        for result in benchmark_results:
+            terminalreporter.write_line(result.describe())
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, Any, None]:
-    """Pytest hook to capture test results for screenshot on failure.
+    """Pytest hook to capture test results for screenshots and the test history.
 
     NOTE: xfail tests in this project document EXPECTED application failures
     (known bugs DEF-001, DEF-002, DEF-003, DEF-007), not test implementation issues.
@@ -175,3 +1061,25 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) ->
 
     # Store test results on item for access in fixtures
     setattr(item, f"rep_{rep.when}", rep)
+
+    # One history row per attempt: the call phase, or a setup that did not pass
+    history = item.config.stash.get(HISTORY_KEY, None)
+    if history is not None and (rep.when == "call" or (rep.when == "setup" and not rep.passed)):
+        from movie_db_qa.utils.history import ResultRecord, find_defect
+
+        xfail = item.get_closest_marker("xfail")
+        history.record(
+            ResultRecord(
+                run_id=os.environ[RUN_ID_ENV],
+                node_id=item.nodeid,
+                attempt=getattr(item, "execution_count", 1),
+                outcome=rep.outcome,
+                duration=rep.duration,
+                xfail=hasattr(rep, "wasxfail"),
+                defect=find_defect(
+                    xfail.kwargs.get("reason") if xfail is not None else None,
+                    getattr(getattr(item, "obj", None), "__doc__", None),
+                ),
+                recorded_at=time.time(),
+            )
+        )
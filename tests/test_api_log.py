@@ -0,0 +1,53 @@
+"""Unit tests for the TMDB API call log (no browser required)."""
+
+from typing import Any
+
+from movie_db_qa.utils.api_log import ApiCallLog, endpoint_category, parse_endpoint
+
+
+class FakeRequest:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.method = "GET"
+        self.resource_type = "fetch"
+
+    def response(self) -> Any:
+        return type("FakeResponse", (), {"status": 200})()
+
+    @property
+    def timing(self) -> dict[str, float]:
+        return {"requestStart": 5.0, "responseStart": 45.0, "responseEnd": 60.0}
+
+    def sizes(self) -> dict[str, int]:
+        return {"responseBodySize": 1024}
+
+
+def test_parse_endpoint_strips_version_prefix() -> None:
+    endpoint, params = parse_endpoint("https://api.themoviedb.org/3/movie/popular?api_key=k&page=2")
+
+    assert endpoint == "/movie/popular"
+    assert params == {"api_key": "k", "page": "2"}
+    assert endpoint_category(endpoint) == "popular"
+    assert endpoint_category("/trending/movie/week") == "trend"
+    assert endpoint_category("/genre/movie/list") == ""
+
+
+def test_calls_are_indexed_and_timed() -> None:
+    log = ApiCallLog()
+    for url in (
+        "https://api.themoviedb.org/3/genre/movie/list",
+        "https://api.themoviedb.org/3/movie/popular?page=1",
+        "https://api.themoviedb.org/3/movie/popular?page=2",
+        "https://api.themoviedb.org/3/trending/movie/week?page=2",
+    ):
+        log.record(FakeRequest(url))  # type: ignore[arg-type]
+
+    assert len(log.by_endpoint("/movie/popular")) == 2
+    assert [call.endpoint for call in log.by_page(2)] == ["/movie/popular", "/trending/movie/week"]
+    assert len(log.by_page(2, path="/movie/popular")) == 1
+    assert len(log.with_path("/movie/")) == 4
+    assert len(log.by_category("trend")) == 1
+
+    call = log.by_endpoint("/movie/popular")[0]
+    assert (call.status, call.ttfb_ms, call.duration_ms, call.response_bytes) == (200, 40.0, 60.0, 1024)
+    assert log.latency_summary()["/movie/popular"]["count"] == 2
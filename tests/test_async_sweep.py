@@ -0,0 +1,34 @@
+"""Concurrent read-only sweeps using the async page objects.
+
+One event loop drives one tab per category, so the sweep takes roughly as
+long as the slowest category instead of the sum of all of them.
+"""
+
+import asyncio
+import logging
+
+import pytest
+from playwright.async_api import BrowserContext
+
+from movie_db_qa.pages.async_discover_page import AsyncDiscoverPage
+from movie_db_qa.pages.discover_page import CATEGORIES
+from movie_db_qa.utils.config import config
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_all_categories_render_full_grid(async_context: BrowserContext) -> None:
+    """Every category shows a full first page, checked in parallel tabs."""
+
+    async def visit(slug: str) -> tuple[str, int]:
+        discover = AsyncDiscoverPage(await async_context.new_page())
+        await discover.load()
+        await discover.select_category(slug)
+        return slug, await discover.get_results_count()
+
+    results = dict(await asyncio.gather(*(visit(slug) for slug in CATEGORIES)))
+    logger.info("Results per category: %s", results)
+
+    assert results == dict.fromkeys(CATEGORIES, config.expected_results_per_page)
@@ -0,0 +1,99 @@
+"""Unit tests for the traceability audit (no browser required)."""
+
+from pathlib import Path
+
+from movie_db_qa.audit import TraceabilityAudit, index_markdown, index_python
+
+REQUIREMENTS = """
+FLT-1:
+  desc: "Popular filter"
+  rubric: ["R-1"]
+  design: ["DD-4.1"]
+  tests: ["TC-FLT-CAT-001"]
+  artifacts:
+    - "tests/test_demo.py::test_popular"
+    - "docs/test-cases.md#TC-FLT-CAT-001"
+FLT-2:
+  desc: "Broken links"
+  rubric: ["R-9"]
+  tests: ["TC-FLT-CAT-404"]
+  artifacts:
+    - "tests/test_demo.py::test_missing"
+    - "docs/test-cases.md#No Such Heading"
+    - "docs/missing.md"
+"""
+
+TEST_CASES = """# Test Cases
+## 🔄 Category Filters
+### TC-FLT-CAT-001: Popular Filter Works
+### TC-FLT-CAT-002: Trending Filter Works
+```bash
+# TC-FLT-CAT-003: not a heading inside a code block
+```
+"""
+
+TESTS = '''
+class TestFilters:
+    def test_popular(self):
+        """TC-FLT-CAT-001: Popular."""
+
+    def test_trending(self):
+        """TC-FLT-CAT-002: Trending."""
+'''
+
+
+def make_repo(root: Path) -> None:
+    for relative, text in {
+        "rubric/requirements.yml": REQUIREMENTS,
+        "rubric/eval-rubric.md": "# Rubric\n### 1. Test Design\n",
+        "docs/design-decisions.md": "# Design\n## 4. Code Architecture\n",
+        "docs/test-cases.md": TEST_CASES,
+        "tests/test_demo.py": TESTS,
+    }.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def test_indexes_resolve_headings_and_symbols() -> None:
+    markdown = index_markdown(TEST_CASES)
+    python = index_python(TESTS)
+
+    assert markdown["test_cases"] == ["TC-FLT-CAT-001", "TC-FLT-CAT-002"]
+    assert {"tc-flt-cat-001", "category filters", "tc-flt-cat-001-popular-filter-works"} <= set(markdown["anchors"])
+    assert {"TestFilters", "test_popular", "TestFilters::test_popular"} <= set(python["symbols"])
+    assert python["test_cases"] == {"test_popular": ["TC-FLT-CAT-001"], "test_trending": ["TC-FLT-CAT-002"]}
+
+
+def test_audit_reports_dangling_links_and_orphans(tmp_path: Path) -> None:
+    make_repo(tmp_path)
+
+    report = TraceabilityAudit(tmp_path).run()
+
+    errors = {finding.message.split(": ")[0] for finding in report.errors}
+    assert errors == {
+        "R-9",
+        "TC-FLT-CAT-404",
+        "tests/test_demo.py::test_missing",
+        "docs/test-cases.md#No Such Heading",
+        "docs/missing.md",
+    }
+    warnings = {(finding.subject, finding.message.split(": ")[0]) for finding in report.warnings}
+    assert warnings == {
+        ("FLT-1", "DD-4.1"),
+        ("TC-FLT-CAT-002", "orphan test case"),
+        ("tests/test_demo.py::test_trending", "orphan test"),
+    }
+
+
+def test_cache_reuses_unchanged_indexes(tmp_path: Path) -> None:
+    make_repo(tmp_path)
+    cache = tmp_path / ".audit-cache.json"
+
+    first = TraceabilityAudit(tmp_path, cache=cache).run()
+    (tmp_path / "docs/test-cases.md").write_text(TEST_CASES + "### TC-FLT-CAT-404: Added\n", encoding="utf-8")
+    second = TraceabilityAudit(tmp_path, cache=cache).run()
+
+    assert (first.cache_hits, second.cache_misses) == (0, 1)
+    assert second.cache_hits == first.cache_misses - 1
+    assert len(second.errors) == len(first.errors) - 1
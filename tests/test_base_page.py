@@ -0,0 +1,37 @@
+"""Unit tests for BasePage.perform timeout handling (no browser required)."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from movie_db_qa.pages.base_page import BasePage
+from movie_db_qa.pages.waits import WaitCondition
+
+
+class NeverMet(WaitCondition):
+    @contextmanager
+    def expect(self, page: Any, timeout: float) -> Iterator[None]:
+        yield
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+
+
+def test_unmet_condition_raises_with_action_and_condition() -> None:
+    base = BasePage(SimpleNamespace())  # type: ignore[arg-type]
+
+    with pytest.raises(TimeoutError, match=r"click_next_page: 'NeverMet' not met within \d+ ms"):
+        base.perform("click_next_page", lambda: None, NeverMet())
+
+    assert [(timing.action, timing.timed_out) for timing in base.action_timings] == [("click_next_page", True)]
+
+
+def test_probes_can_tolerate_an_unmet_condition() -> None:
+    base = BasePage(SimpleNamespace())  # type: ignore[arg-type]
+
+    timing = base.perform("open_page", lambda: None, NeverMet(), tolerate_timeout=True)
+
+    assert timing.timed_out
+    assert base.action_timings == [timing]
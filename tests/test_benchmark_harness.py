@@ -0,0 +1,51 @@
+"""Unit tests for the micro-benchmark harness (no browser required)."""
+
+from pathlib import Path
+
+import pytest
+
+from movie_db_qa.pages.waits import ActionTiming
+from movie_db_qa.utils.benchmark import compare_results, load_results, run_benchmark, save_results
+
+
+def test_benchmark_runs_setup_untimed_and_counts_allocations() -> None:
+    calls = {"setup": 0, "operation": 0}
+    kept: list[list[int]] = []
+
+    def setup() -> None:
+        calls["setup"] += 1
+
+    def operation() -> None:
+        calls["operation"] += 1
+        kept.append(list(range(100)))
+
+    result = run_benchmark("build_list", operation, setup, warmup=1, target_seconds=0.01, min_rounds=3, max_rounds=10)
+
+    assert 3 <= result.rounds <= 10
+    # warmup + calibration + timed rounds + traced round, each after a setup
+    assert calls["operation"] == calls["setup"] == result.rounds + 3
+    assert result.min_ms <= result.p50_ms <= result.p95_ms <= result.p99_ms
+    assert result.allocations > 0
+    assert result.peak_bytes > 0
+
+
+def test_benchmark_fails_when_a_round_times_out() -> None:
+    timings: list[ActionTiming] = []
+    rounds = iter([False, False, True])
+
+    def operation() -> None:
+        timings.append(ActionTiming("click_next_page", "api response * page=2", 5000.0, next(rounds, False)))
+
+    with pytest.raises(RuntimeError, match="click_next_page timed out"):
+        run_benchmark("next", operation, warmup=2, target_seconds=0.01, min_rounds=3, timings=timings)
+
+
+def test_results_round_trip_and_compare(tmp_path: Path) -> None:
+    old = run_benchmark("noop", lambda: None, warmup=0, target_seconds=0.001, min_rounds=2, max_rounds=2)
+    path = save_results([old], tmp_path / "old.json")
+
+    loaded = load_results(path)
+    rows = compare_results(loaded, loaded)
+
+    assert loaded["noop"] == old
+    assert [(name, change) for name, _, _, change in rows] == [("noop", 0.0)]
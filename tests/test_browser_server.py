@@ -0,0 +1,67 @@
+"""Unit tests for the background browser server and lazy imports (no browser required)."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from movie_db_qa.utils.browser_server import BrowserServer, running_endpoint
+
+
+class FakeServer(BrowserServer):
+    def __init__(self, script: str) -> None:
+        super().__init__("chromium", headless=True)
+        self.script = script
+
+    def command(self, config_path: Path) -> list[str]:
+        return [sys.executable, "-c", self.script, str(config_path)]
+
+
+def test_endpoint_is_read_from_server_output() -> None:
+    server = FakeServer(
+        "import json, sys, time\n"
+        "print('starting', flush=True)\n"
+        "print('ws://127.0.0.1:9/' + str(json.load(open(sys.argv[1]))['headless']), flush=True)\n"
+        "time.sleep(30)"
+    )
+    server.start()
+    try:
+        assert server.endpoint(timeout=10) == "ws://127.0.0.1:9/True"
+    finally:
+        server.stop()
+
+
+def test_failed_server_yields_no_endpoint() -> None:
+    server = FakeServer("import sys; print('Executable does not exist'); sys.exit(1)")
+    server.start()
+    try:
+        assert server.endpoint(timeout=10) is None
+    finally:
+        server.stop()
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["movie_db_qa.pages.discover_page", "movie_db_qa.crawler", "movie_db_qa.utils.stand_in_server"],
+)
+def test_package_imports_playwright_lazily(module: str) -> None:
+    code = f"import sys, {module}; print(any(name.startswith('playwright') for name in sys.modules))"
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[1] / "src")}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == "False"
+
+
+def test_running_endpoint_ignores_stale_state(tmp_path: Path) -> None:
+    state = tmp_path / "browser-server.json"
+    assert running_endpoint(state) is None
+
+    state.write_text(json.dumps({"endpoint": "ws://127.0.0.1:9/a", "pid": os.getpid()}), encoding="utf-8")
+    assert running_endpoint(state) == "ws://127.0.0.1:9/a"
+
+    finished = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    state.write_text(json.dumps({"endpoint": "ws://127.0.0.1:9/a", "pid": int(finished.stdout)}), encoding="utf-8")
+    assert running_endpoint(state) is None
+    assert not state.exists()
@@ -0,0 +1,32 @@
+"""Unit tests for the TMDB cassette store (no browser required)."""
+
+from pathlib import Path
+
+from movie_db_qa.utils.cassette import CassetteEntry, CassetteStore, normalize_url
+
+
+def test_normalize_url_sorts_params_and_drops_secrets() -> None:
+    url = "https://API.themoviedb.org/3/movie/popular/?page=2&api_key=secret&language=en-US#top"
+    assert normalize_url(url) == "https://api.themoviedb.org/3/movie/popular?language=en-US&page=2"
+
+
+def test_equivalent_urls_share_key() -> None:
+    a = "https://api.themoviedb.org/3/movie/popular?page=1&api_key=a"
+    b = "https://api.themoviedb.org/3/movie/popular?api_key=b&page=1"
+    assert CassetteStore.key("GET", a) == CassetteStore.key("get", b)
+    assert CassetteStore.key("GET", a) != CassetteStore.key("GET", a.replace("page=1", "page=2"))
+
+
+def test_store_round_trip(tmp_path: Path) -> None:
+    store = CassetteStore(tmp_path)
+    url = "https://api.themoviedb.org/3/movie/popular?page=1&api_key=secret"
+    path = store.put(CassetteEntry("GET", url, 200, {"content-type": "application/json"}, '{"page":1}'))
+
+    assert path.name.startswith("3_movie_popular-")
+    assert "secret" not in path.read_text(encoding="utf-8")
+
+    entry = store.get("GET", url)
+    assert entry is not None
+    assert entry.status == 200
+    assert entry.body == '{"page":1}'
+    assert store.get("GET", url.replace("page=1", "page=3")) is None
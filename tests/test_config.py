@@ -0,0 +1,23 @@
+"""Unit tests for environment overrides of the framework config (no browser required)."""
+
+import pytest
+
+# Imported as a module: pytest would try to collect a ``Test*`` class imported by name
+from movie_db_qa.utils import config as config_module
+
+
+def test_env_overrides_are_parsed_by_field_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MOVIE_DB_QA_HEADLESS", "false")
+    monkeypatch.setenv("MOVIE_DB_QA_CONTEXT_POOL_SIZE", "4")
+    monkeypatch.setenv("MOVIE_DB_QA_TMDB_MODE", "replay")
+
+    config = config_module.TestConfig.from_env()
+
+    assert (config.headless, config.context_pool_size, config.tmdb_mode) == (False, 4, "replay")
+
+
+def test_literal_fields_reject_unknown_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MOVIE_DB_QA_TMDB_MODE", "Replay")
+
+    with pytest.raises(ValueError, match="MOVIE_DB_QA_TMDB_MODE='Replay' is not one of 'live', 'record', 'replay'"):
+        config_module.TestConfig.from_env()
@@ -0,0 +1,89 @@
+"""Unit tests for the DOM-vs-API consistency checker (no browser required)."""
+
+from typing import Any
+
+from movie_db_qa.pages.grid import GridSnapshot, MovieCard
+from movie_db_qa.utils.consistency import check_consistency, poster_path
+
+IMAGES = "https://image.tmdb.org/t/p/w500"
+
+
+def _payload(*titles: str, page: int = 2) -> dict[str, Any]:
+    return {
+        "page": page,
+        "results": [
+            {"id": 100 + rank, "title": title, "poster_path": f"/{title.lower()}.jpg"}
+            for rank, title in enumerate(titles)
+        ],
+    }
+
+
+def _grid(*titles: str) -> GridSnapshot:
+    return GridSnapshot(
+        [MovieCard(position, title, f"{IMAGES}/{title.lower()}.jpg") for position, title in enumerate(titles)]
+    )
+
+
+def test_poster_path_is_the_image_file_name() -> None:
+    assert poster_path(f"{IMAGES}/abc.jpg?v=1") == "/abc.jpg"
+    assert poster_path("") == ""
+
+
+def test_matching_grid_is_consistent() -> None:
+    report = check_consistency(_payload("Alien", "Brazil", "Casablanca"), _grid("Alien", "Brazil", "Casablanca"))
+
+    assert report.consistent
+    assert (report.page, report.ids) == (2, [100, 101, 102])
+    assert report.describe() == "page 2: 3 cards match the API payload"
+
+
+def test_differences_are_classified() -> None:
+    payload = _payload("Alien", "Brazil", "Casablanca", "Dune")
+    cards = [*_grid("Brazil", "Alien", "Brazil"), MovieCard(3, "Unknown", f"{IMAGES}/unknown.jpg")]
+    # Same poster, different title text
+    cards[1] = MovieCard(1, "Alien (1979)", f"{IMAGES}/alien.jpg")
+
+    report = check_consistency(payload, GridSnapshot(cards))
+
+    assert [movie.title for movie in report.missing] == ["Casablanca", "Dune"]
+    assert [card.title for card in report.unexpected] == ["Unknown"]
+    assert [card.position for card in report.duplicates] == [2]
+    assert [(movie.rank, card.position) for movie, card in report.misranked] == [(1, 0), (0, 1)]
+    assert [card.title for _, card in report.mistitled] == ["Alien (1979)"]
+    assert report.ids == [101, 100, 101, None]
+    assert (
+        report.describe()
+        == "page 2: 2 missing, 1 unexpected, 1 duplicate, 2 misranked, 1 mistitled (cards vs API payload)"
+    )
+
+
+def test_results_without_poster_join_on_title() -> None:
+    payload = {"page": 1, "results": [{"id": 7, "name": "Show", "poster_path": None}]}
+
+    report = check_consistency(payload, GridSnapshot([MovieCard(0, "Show")]))
+
+    assert report.consistent and report.ids == [7]
+
+
+def test_results_sharing_a_key_match_cards_in_rank_order() -> None:
+    # Two results without a poster and the same title share the join key
+    payload = {
+        "page": 1,
+        "results": [
+            {"id": 7, "title": "Hamlet", "poster_path": None},
+            {"id": 8, "title": "Alien", "poster_path": "/alien.jpg"},
+            {"id": 9, "title": "Hamlet", "poster_path": None},
+        ],
+    }
+
+    cards = [MovieCard(0, "Hamlet"), MovieCard(1, "Alien", f"{IMAGES}/alien.jpg"), MovieCard(2, "Hamlet")]
+
+    report = check_consistency(payload, GridSnapshot(cards))
+
+    assert report.consistent and report.ids == [7, 8, 9]
+
+    # A third card with that key is a duplicate; a missing one leaves the later result missing
+    report = check_consistency(payload, GridSnapshot([*cards, MovieCard(3, "Hamlet")]))
+    assert [card.position for card in report.duplicates] == [3] and report.ids[3] == 9
+    report = check_consistency(payload, GridSnapshot(cards[:2]))
+    assert [movie.id for movie in report.missing] == [9]
@@ -0,0 +1,148 @@
+"""Unit tests for the context pool using stand-in browser objects."""
+
+from typing import Any
+
+from movie_db_qa.utils.context_pool import ContextPool
+
+
+class FakePage:
+    def __init__(self, context: "FakeContext") -> None:
+        self.context = context
+
+    def close(self) -> None:
+        self.context.pages.remove(self)
+
+
+class FakeCDPSession:
+    def __init__(self, context: "FakeContext") -> None:
+        self.context = context
+
+    def send(self, method: str) -> None:
+        self.context.cdp_calls.append(method)
+
+    def detach(self) -> None:
+        pass
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+        self.pages: list[Any] = []
+        self.closed = False
+        self.origins: list[dict[str, Any]] = []
+        self.offline = False
+        self.geolocation: dict[str, float] | None = None
+        self.cdp_calls: list[str] = []
+
+    def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    def new_cdp_session(self, page: FakePage) -> FakeCDPSession:
+        return FakeCDPSession(self)
+
+    def set_offline(self, offline: bool) -> None:
+        self.offline = offline
+
+    def set_geolocation(self, geolocation: dict[str, float] | None) -> None:
+        self.geolocation = geolocation
+
+    def unroute_all(self, behavior: str | None = None) -> None:
+        pass
+
+    def clear_cookies(self) -> None:
+        pass
+
+    def clear_permissions(self) -> None:
+        pass
+
+    def set_extra_http_headers(self, headers: dict[str, str]) -> None:
+        pass
+
+    def storage_state(self) -> dict[str, Any]:
+        return {"cookies": [], "origins": self.origins}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class FakeBrowser:
+    def __init__(self, name: str = "chromium") -> None:
+        self.browser_type = FakeBrowserType(name)
+        self.created = 0
+
+    def new_context(self, **options: Any) -> FakeContext:
+        self.created += 1
+        return FakeContext(self)
+
+
+def test_prewarmed_contexts_are_reused() -> None:
+    browser = FakeBrowser()
+    pool = ContextPool(browser, size=2)  # type: ignore[arg-type]
+    pool.prewarm()
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+
+    assert browser.created == 2
+    assert (pool.stats.hits, pool.stats.misses, pool.stats.resets) == (2, 0, 1)
+
+
+def test_exhausted_pool_counts_miss() -> None:
+    pool = ContextPool(FakeBrowser(), size=1)  # type: ignore[arg-type]
+    pool.prewarm()
+    pool.acquire()
+    pool.acquire()
+    assert (pool.stats.hits, pool.stats.misses) == (1, 1)
+
+
+def test_release_resets_network_emulation_and_cache() -> None:
+    pool = ContextPool(FakeBrowser(), size=1)  # type: ignore[arg-type]
+    pool.prewarm()
+    context: Any = pool.acquire()
+    context.new_page()
+    context.set_offline(True)
+    context.set_geolocation({"latitude": 52.5, "longitude": 13.4})
+
+    pool.release(context)
+
+    assert not context.offline
+    assert context.geolocation is None
+    assert context.cdp_calls == ["Network.clearBrowserCache"]
+    assert context.pages == []
+    assert pool.acquire() is context
+
+
+def test_context_with_origin_storage_is_replaced_on_next_acquire() -> None:
+    browser = FakeBrowser()
+    pool = ContextPool(browser, size=1)  # type: ignore[arg-type]
+    pool.prewarm()
+    dirty = pool.acquire()
+    dirty.origins.append({"origin": "https://tmdb-discover.surge.sh", "localStorage": []})  # type: ignore[attr-defined]
+
+    pool.release(dirty)
+
+    assert dirty.closed  # type: ignore[attr-defined]
+    assert pool.stats.discards == 1
+    # The replacement is created by the next acquire, not on the releasing test's teardown
+    assert browser.created == 1
+    assert pool.acquire() is not dirty
+    assert (browser.created, pool.stats.misses) == (2, 1)
+
+
+def test_context_without_cdp_is_discarded() -> None:
+    pool = ContextPool(FakeBrowser("firefox"), size=1)  # type: ignore[arg-type]
+    pool.prewarm()
+    context: Any = pool.acquire()
+
+    pool.release(context)
+
+    assert context.closed
+    assert pool.stats.discards == 1
@@ -0,0 +1,35 @@
+"""Unit tests for the pagination boundary search (no browser required)."""
+
+import math
+
+import pytest
+
+from movie_db_qa.crawler import PageProbe, find_boundary
+
+
+@pytest.mark.parametrize("last_valid", [1, 2, 7, 64, 288, 499, 500])
+def test_boundary_is_found_in_logarithmic_probes(last_valid: int) -> None:
+    boundary = find_boundary(lambda page: page <= last_valid, limit=1000)
+
+    assert (boundary.last_valid, boundary.first_invalid) == (last_valid, last_valid + 1)
+    assert len(boundary.probes) <= 2 * math.ceil(math.log2(last_valid + 1)) + 2
+    assert len(set(boundary.probes)) == len(boundary.probes)
+
+
+def test_broken_first_page_reports_zero_valid_pages() -> None:
+    boundary = find_boundary(lambda page: False)
+
+    assert (boundary.last_valid, boundary.first_invalid, boundary.probes) == (0, 1, [1])
+
+
+def test_all_pages_valid_within_limit_has_no_first_invalid() -> None:
+    boundary = find_boundary(lambda page: True, limit=40)
+
+    assert (boundary.last_valid, boundary.first_invalid) == (40, None)
+
+
+def test_probe_is_valid_only_with_results_and_no_error() -> None:
+    assert PageProbe("popular", 3, 200, 20, False).valid
+    assert not PageProbe("popular", 289, 200, 0, True).valid
+    assert not PageProbe("popular", 501, 422, 0, False).valid
+    assert not PageProbe("popular", 4, None, 20, False).valid
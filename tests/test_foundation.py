@@ -23,6 +23,7 @@ from playwright.sync_api import BrowserContext, Page, expect
 
 from movie_db_qa.pages.discover_page import DiscoverPage
 from movie_db_qa.utils.config import config
+from movie_db_qa.utils.consistency import check_page
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -50,6 +51,7 @@ class TestCategoryFilters:
         4. Verify movie results displayed
         5. Count results = 20
         6. Validate API call (discover/movie with sort_by=popularity.desc)
+        7. Verify rendered cards match the API payload (titles, ranks, no gaps or duplicates)
         """
         logger.info("Test started: TC-FLT-CAT-001")
 
@@ -80,13 +82,18 @@ class TestCategoryFilters:
 
         # Step 6: Validate API call
         api_calls = page.api_calls  # type: ignore[attr-defined]
-        movie_calls = [call for call in api_calls if "/movie/" in call["url"]]
+        movie_calls = api_calls.with_path("/movie/")
         assert len(movie_calls) > 0, "Should make API call to TMDB movie endpoint"
 
         # Verify Popular endpoint called
-        popular_call = [call for call in movie_calls if "/movie/popular" in call["url"]]
+        popular_call = api_calls.by_endpoint("/movie/popular")
         assert len(popular_call) > 0, "Should call /movie/popular endpoint"
-        logger.info("Verified API call: %s", popular_call[0]["url"])
+        logger.info("Verified API call: %s (%s ms)", popular_call[0].url, popular_call[0].duration_ms)
+
+        # Step 7: Verify rendered cards match the API payload
+        report = check_page(discover, api_calls)
+        assert report.consistent, report.describe()
+        logger.info("Verified grid against API payload: %s", report.describe())
         logger.info("Test passed: TC-FLT-CAT-001")
 
     def test_tc_flt_cat_002_trending_filter_works(self, page: Page) -> None:
@@ -118,9 +125,10 @@ class TestCategoryFilters:
         logger.info("Applying filter: Trending")
         discover.select_trending_filter()
 
-        # Step 3: Verify filter states
-        assert discover.is_trending_filter_active(), "Trending filter should be active"
-        assert not discover.is_popular_filter_active(), "Popular filter should be inactive"
+        # Step 3: Verify filter states (one batched read for all filters)
+        ui_state = discover.ui_state()
+        assert ui_state.is_active("Trend"), "Trending filter should be active"
+        assert not ui_state.is_active("Popular"), "Popular filter should be inactive"
         logger.info("Verified filter exclusivity (only Trending active)")
 
         # Step 4: Verify results displayed
@@ -131,13 +139,13 @@ class TestCategoryFilters:
 
         # Step 5: Validate API call for Trending
         api_calls = page.api_calls  # type: ignore[attr-defined]
-        movie_calls = [call for call in api_calls if "/movie/" in call["url"]]
+        movie_calls = api_calls.with_path("/movie/")
         assert len(movie_calls) >= 2, "Should make API calls (Popular + Trending)"
 
         # Log all movie API calls for visibility
         logger.info("API calls captured: %d movie endpoints", len(movie_calls))
         for call in movie_calls:
-            logger.info("  - %s", call["url"])
+            logger.info("  - %s", call.url)
         logger.info("Test passed: TC-FLT-CAT-002")
 
 
@@ -179,8 +187,8 @@ class TestPagination:
         assert initial_page == 1, "Should start on page 1"
         logger.info("Verified starting on page 1")
 
-        # Get page 1 movie titles for comparison
-        page1_titles = discover.get_movie_titles()
+        # Snapshot page 1 grid for comparison (one round-trip for all cards)
+        page1_grid = discover.snapshot_grid()
 
         # Step 3: Click Next button
         logger.info("Clicking Next button")
@@ -191,8 +199,8 @@ class TestPagination:
         logger.info("Verified URL changed to /popular/2")
 
         # Step 5: Verify different results
-        page2_titles = discover.get_movie_titles()
-        assert page1_titles != page2_titles, "Page 2 should have different movies"
+        grid_diff = page1_grid.diff(discover.snapshot_grid())
+        assert grid_diff.added, "Page 2 should have different movies"
         logger.info("Verified different movie results on page 2")
 
         # Step 6: Verify page indicator
@@ -201,10 +209,9 @@ class TestPagination:
 
         # Step 7: Validate API call with page=2
         api_calls = page.api_calls  # type: ignore[attr-defined]
-        movie_calls = [call for call in api_calls if "/movie/" in call["url"]]
-        page2_calls = [call for call in movie_calls if "page=2" in call["url"]]
+        page2_calls = api_calls.by_page(2, path="/movie/")
         assert len(page2_calls) > 0, "Should make API call with page=2 parameter"
-        logger.info("Verified API call with page=2: %s", page2_calls[0]["url"])
+        logger.info("Verified API call with page=2: %s", page2_calls[0].url)
         logger.info("Test passed: TC-PAG-001")
 
     @pytest.mark.xfail(reason="DEF-002: Known defect - last page pagination broken")
@@ -295,6 +302,7 @@ class TestPagination:
 class TestNegativeCases:
     """Test error handling and edge cases."""
 
+    @pytest.mark.cold_start
     @pytest.mark.xfail(reason="DEF-001: Known defect - direct URL access fails")
     def test_tc_neg_001_direct_url_access_fails(self, context: BrowserContext) -> None:
         """TC-NEG-001: Direct URL Access Fails (Known Defect).
@@ -329,6 +337,7 @@ class TestNegativeCases:
         assert results_count == config.expected_results_per_page, "Direct URL should load results properly"
         logger.info("Direct URL loaded successfully (test passed - defect fixed?)")
 
+    @pytest.mark.cold_start
     @pytest.mark.xfail(reason="DEF-001: Direct URL access fails - cannot test page 0 handling")
     def test_tc_neg_002_invalid_page_number(self, context: BrowserContext) -> None:
         """TC-NEG-002: Invalid Page Number Handling (Blocked by DEF-001).
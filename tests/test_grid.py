@@ -0,0 +1,31 @@
+"""Unit tests for grid snapshot records (no browser required)."""
+
+from movie_db_qa.pages.grid import GridSnapshot, MovieCard
+
+
+def test_card_details_are_parsed() -> None:
+    card = MovieCard.from_raw(0, "Dune", "https://image.tmdb.org/t/p/w500/dune.jpg", ["Sci-Fi", "2021-10-22", "7.8"])
+
+    assert (card.title, card.year, card.rating, card.genre) == ("Dune", 2021, 7.8, "Sci-Fi")
+
+
+def test_snapshot_diff_reports_added_removed_and_moved() -> None:
+    page1 = GridSnapshot.from_raw([("A", "a.jpg", []), ("B", "b.jpg", []), ("C", "c.jpg", [])])
+    page2 = GridSnapshot.from_raw([("B", "b.jpg", []), ("D", "d.jpg", []), ("C", "c.jpg", [])])
+
+    diff = page1.diff(page2)
+
+    assert [card.title for card in diff.added] == ["D"]
+    assert [card.title for card in diff.removed] == ["A"]
+    assert [(old.position, new.position) for old, new in diff.moved] == [(1, 0)]
+    assert not diff.identical
+    assert page1.diff(page1).identical
+
+
+def test_snapshot_is_a_sequence() -> None:
+    snapshot = GridSnapshot.from_raw([("A", "", []), ("B", "", [])])
+
+    assert len(snapshot) == 2
+    assert snapshot.titles == ["A", "B"]
+    assert snapshot[1].title == "B"
+    assert snapshot[:1].titles == ["A"]
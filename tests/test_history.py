@@ -0,0 +1,69 @@
+"""Unit tests for the test history store and flakiness scoring."""
+
+from pathlib import Path
+
+from movie_db_qa.utils.history import HistoryStore, ResultRecord, find_defect, score_runs
+
+NODE = "tests/test_foundation.py::TestPagination::test_tc_pag_001_navigate_to_page_2"
+
+
+def _record(run_id: str, outcome: str, attempt: int = 1, xfail: bool = False, at: float = 0.0) -> ResultRecord:
+    return ResultRecord(run_id, NODE, attempt, outcome, 1.5, xfail, None, at)
+
+
+def test_find_defect_prefers_the_first_text() -> None:
+    assert find_defect("DEF-007: Pagination broken", "Defect: DEF-002") == "DEF-007"
+    assert find_defect(None, "Defect: DEF-002") == "DEF-002"
+    assert find_defect(None, "No defect") is None
+
+
+def test_transient_failures_score_but_regressions_do_not() -> None:
+    # Failed then passed on retry, and a failed run followed by a passing one
+    flaky = score_runs(NODE, [["passed"], ["failed", "passed"], ["failed"], ["passed"]])
+    assert (flaky.retry_passes, flaky.transient_failures, flaky.score) == (1, 1, 0.5)
+    assert flaky.flaky(threshold=0.1, min_runs=3)
+    assert not flaky.flaky(threshold=0.1, min_runs=5)
+
+    # A test that started failing and keeps failing must fail fast
+    regression = score_runs(NODE, [["passed"], ["passed"], ["failed"], ["failed"]])
+    assert (regression.failures, regression.score) == (2, 0.0)
+
+
+def test_fixed_regressions_do_not_score_but_flips_do() -> None:
+    # Failed five runs, then fixed: not flaky, so no reruns for the next window
+    fixed = score_runs(NODE, [["failed"]] * 5 + [["passed"]])
+    assert (fixed.failures, fixed.transient_failures, fixed.score) == (5, 0, 0.0)
+    assert not fixed.flaky(threshold=0.1, min_runs=3)
+
+    # A single failed run between passes is a flip; the streak that follows is not
+    flipping = score_runs(NODE, [["passed"], ["failed"], ["passed"], ["failed"], ["failed"]])
+    assert (flipping.transient_failures, flipping.failing_streak) == (1, 2)
+
+
+def test_failure_streak_after_a_flip_is_a_regression() -> None:
+    # One flip early in the window must not turn a later streak into reruns
+    broken = score_runs(NODE, [["passed"], ["failed"], ["passed"]] + [["failed"]] * 10)
+    assert (broken.failures, broken.transient_failures, broken.failing_streak) == (11, 1, 10)
+    assert broken.failing(min_runs=3)
+    assert not broken.flaky(threshold=0.05, min_runs=3)
+
+    recent = score_runs(NODE, [["passed"], ["failed"], ["passed"], ["failed"], ["failed"], ["failed"]])
+    assert (recent.transient_failures, recent.failing_streak) == (1, 3)
+    assert recent.failing(min_runs=3)
+    assert not recent.flaky(threshold=0.1, min_runs=3)
+
+
+def test_store_round_trip_ignores_xfail_and_windows_runs(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history" / "tests.sqlite")
+    assert store.scores(window=10) == {}
+
+    for index, outcome in enumerate(["passed", "failed", "passed"]):
+        store.record(_record(f"run{index}", outcome, at=index))
+    store.record(_record("run3", "failed", xfail=True, at=3))
+    assert store.flush() == 4
+    assert store.flush() == 0
+
+    assert store.scores(window=10)[NODE].runs == 3
+    assert store.scores(window=10)[NODE].transient_failures == 1
+    # In a two-run window the failure is no longer between passes
+    assert store.scores(window=2)[NODE].score == 0.0
@@ -0,0 +1,179 @@
+"""Unit tests for test impact analysis (no browser required)."""
+
+import json
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from movie_db_qa.impact import (
+    CallMap,
+    CallRecorder,
+    ChangeSet,
+    analyze_changes,
+    changed_lines,
+    config_field_lines,
+    config_references,
+    merge_call_maps,
+    select_tests,
+    symbol_spans,
+)
+
+PAGE = """class DiscoverPage:
+    TITLE = "Discover"
+
+    def select_category(self, category):
+        return category
+
+    def get_results_count(self):
+        return config.expected_results_per_page
+
+
+def helper():
+    pass
+"""
+
+CONFIG = """@dataclass
+class TestConfig:
+    base_url: str = "x"
+    action_timeout: int = 5000
+"""
+
+NODE_A = "tests/test_demo.py::TestDemo::test_filter"
+NODE_B = "tests/test_demo.py::TestDemo::test_count"
+PAGE_PATH = "src/movie_db_qa/pages/discover_page.py"
+
+
+def call_map() -> CallMap:
+    return CallMap(
+        {
+            NODE_A: {f"{PAGE_PATH}::DiscoverPage.select_category", "tests/test_demo.py::TestDemo.test_filter"},
+            NODE_B: {f"{PAGE_PATH}::DiscoverPage.get_results_count", "tests/test_demo.py::TestDemo.test_count"},
+        },
+        recorded_at=1.0,
+    )
+
+
+def select(change_set: ChangeSet, **kwargs: object) -> list[str]:
+    options: dict[str, Any] = {
+        "config_index": {f"{PAGE_PATH}::DiscoverPage.get_results_count": {"expected_results_per_page"}},
+        "requirement_tests": {},
+        "test_case_ids": {},
+    }
+    options.update(kwargs)
+    return select_tests([NODE_A, NODE_B, "tests/test_demo.py::test_new"], change_set, call_map(), **options).selected
+
+
+def test_spans_map_lines_to_methods_and_config_fields() -> None:
+    spans = symbol_spans(PAGE)
+    owner = {line: next(name for start, end, name in spans if start <= line <= end) for line in (2, 5, 8, 12)}
+
+    assert owner == {
+        2: "DiscoverPage",
+        5: "DiscoverPage.select_category",
+        8: "DiscoverPage.get_results_count",
+        12: "helper",
+    }
+    assert config_references(PAGE) == {"DiscoverPage.get_results_count": {"expected_results_per_page"}}
+    assert config_field_lines(CONFIG) == {3: "base_url", 4: "action_timeout"}
+
+
+def test_analyze_changes_classifies_lines(tmp_path: Path) -> None:
+    for relative, text in {PAGE_PATH: PAGE, "src/movie_db_qa/utils/config.py": CONFIG}.items():
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_text(text, encoding="utf-8")
+
+    change_set = analyze_changes(
+        {PAGE_PATH: {5, 10}, "src/movie_db_qa/utils/config.py": {4}, "docs/test-cases.md": {1}}, tmp_path
+    )
+
+    assert change_set.symbols == {f"{PAGE_PATH}::DiscoverPage.select_category"}
+    assert change_set.modules == {PAGE_PATH}
+    assert change_set.config_fields == {"action_timeout"}
+    assert change_set.full_run_reason is None
+    assert analyze_changes({"tests/conftest.py": {1}}, tmp_path).full_run_reason == "tests/conftest.py changed"
+    assert analyze_changes({"src/gone.py": set()}, tmp_path).full_run_reason == "src/gone.py deleted"
+
+
+def test_select_tests_matches_calls_config_and_requirements() -> None:
+    new = "tests/test_demo.py::test_new"
+
+    assert select(ChangeSet(symbols={f"{PAGE_PATH}::DiscoverPage.select_category"})) == [NODE_A, new]
+    # Class-level changes reach every caller of the class
+    assert select(ChangeSet(symbols={f"{PAGE_PATH}::DiscoverPage"})) == [NODE_A, NODE_B, new]
+    assert select(ChangeSet(config_fields={"expected_results_per_page"})) == [NODE_B, new]
+    # Changed code no test executed is treated as a module-level change
+    assert select(ChangeSet(symbols={f"{PAGE_PATH}::helper"})) == [NODE_A, NODE_B, new]
+    assert select(
+        ChangeSet(requirements={"FLT-1"}),
+        requirement_tests={"FLT-1": {"TC-FLT-CAT-001"}},
+        test_case_ids={"test_filter": ["TC-FLT-CAT-001"]},
+    ) == [NODE_A, new]
+    assert select(ChangeSet()) == [new]
+
+
+def test_changed_lines_reads_git_diff(tmp_path: Path) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=tmp_path, check=True)
+
+    (tmp_path / "page.py").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "old.py").write_text("x = 1\n", encoding="utf-8")
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "base")
+    (tmp_path / "page.py").write_text(PAGE.replace("return category", "return category.lower()"), encoding="utf-8")
+    (tmp_path / "old.py").unlink()
+
+    assert changed_lines("HEAD", tmp_path) == {"page.py": {5}, "old.py": set()}
+    with pytest.raises(ValueError, match="cannot diff against 'origin/main'"):
+        changed_lines("origin/main", tmp_path)
+
+
+def test_recorder_and_merge(tmp_path: Path) -> None:
+    recorder = CallRecorder(Path(__file__).parents[1])
+    recorder.start()
+    spans = symbol_spans(PAGE)
+    calls = recorder.stop()
+    path = tmp_path / "call-map.json"
+    CallMap({"old": {"a"}, NODE_A: {"stale"}}, recorded_at=1.0).save(path)
+    CallMap({NODE_A: {"b"}}, recorded_at=2.0).save(tmp_path / "call-map.gw0.json")
+
+    merged = merge_call_maps(path, CallMap({NODE_B: {"c"}}, recorded_at=3.0))
+
+    assert spans
+    assert "src/movie_db_qa/impact.py::symbol_spans" in calls
+    assert merged is not None
+    assert merged.tests == {"old": {"a"}, NODE_A: {"b"}, NODE_B: {"c"}}
+    assert merged.recorded == {"old": 1.0, NODE_A: 2.0, NODE_B: 3.0}
+    assert not (tmp_path / "call-map.gw0.json").exists()
+    assert CallMap.load(path) is not None
+
+
+def test_partial_recording_keeps_other_entries_aging(tmp_path: Path) -> None:
+    day_ago = time.time() - 24 * 3600
+    path = tmp_path / "call-map.json"
+    CallMap({NODE_A: {"a"}, NODE_B: {"b"}}, recorded_at=day_ago).save(path)
+    partial = CallMap()
+    partial.record(NODE_A, {"a2"})
+
+    merged = merge_call_maps(path, partial)
+
+    assert merged is not None
+    assert merged.age_hours([NODE_A]) < 1
+    assert 23 < merged.age_hours([NODE_A, NODE_B]) < 25
+    assert 23 < merged.age_hours() < 25
+    reloaded = CallMap.load(path)
+    assert reloaded is not None
+    assert reloaded.recorded == merged.recorded
+
+
+def test_load_reads_maps_without_per_test_timestamps(tmp_path: Path) -> None:
+    path = tmp_path / "call-map.json"
+    path.write_text(json.dumps({"recorded_at": 5.0, "tests": {NODE_A: ["a"]}}), encoding="utf-8")
+
+    call_map = CallMap.load(path)
+
+    assert call_map is not None
+    assert (call_map.tests, call_map.recorded) == ({NODE_A: {"a"}}, {NODE_A: 5.0})
@@ -0,0 +1,77 @@
+"""Unit tests for queue-based and ring-buffer logging (no browser required)."""
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+from movie_db_qa.utils.logger import RingBufferHandler, setup_logger, stop_queue_logging
+
+
+def test_async_mode_writes_jsonl_from_background_thread(tmp_path: Path) -> None:
+    log_file = tmp_path / "logs" / "crawl.jsonl"
+    logger = setup_logger("tests.async_logger", logging.INFO, log_file=str(log_file), async_mode=True)
+    logger.propagate = False
+
+    logger.info("Probe /%s/%d", "popular", 3)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Probe failed")
+    stop_queue_logging()
+
+    entries = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert [(entry["level"], entry["logger"]) for entry in entries] == [
+        ("INFO", "tests.async_logger"),
+        ("ERROR", "tests.async_logger"),
+    ]
+    assert entries[0]["message"] == "Probe /popular/3"
+    assert entries[1]["message"] == "Probe failed"
+    assert entries[1]["exc_info"].startswith("Traceback")
+    assert entries[1]["exc_info"].endswith("ValueError: boom")
+    assert not logger.handlers
+
+
+def test_ring_buffer_keeps_latest_records_until_flushed(tmp_path: Path) -> None:
+    buffer = RingBufferHandler(capacity=2)
+    logger = logging.getLogger("tests.ring_buffer")
+    logger.propagate = False
+    logger.addHandler(buffer)
+
+    logger.warning("first")
+    logger.warning("second")
+    logger.warning("third")
+    logger.removeHandler(buffer)
+
+    path = tmp_path / "failures" / "test_a.jsonl"
+    assert buffer.flush_to(path) == 2
+    messages = [json.loads(line)["message"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert messages == ["second", "third"]
+    assert not buffer.buffer
+
+
+def test_ring_buffer_freezes_message_arguments() -> None:
+    buffer = RingBufferHandler(capacity=5)
+    values = ["first"]
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "value=%s", (values,), None)
+
+    buffer.emit(record)
+    values.append("changed")
+
+    assert buffer.buffer[0].getMessage() == "value=['first']"
+
+
+def test_ring_buffer_leaves_the_original_record_intact() -> None:
+    buffer = RingBufferHandler(capacity=5)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord("t", logging.ERROR, __file__, 1, "value=%s", ("x",), exc_info)
+
+    buffer.emit(record)
+
+    # Other handlers (caplog, report sections) still get the traceback and arguments
+    assert (record.msg, record.args, record.exc_info) == ("value=%s", ("x",), exc_info)
+    assert buffer.buffer[0].exc_info is None
+    assert buffer.buffer[0].exc_text is not None and buffer.buffer[0].exc_text.endswith("ValueError: boom")
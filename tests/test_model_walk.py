@@ -0,0 +1,83 @@
+"""Model-based walk of the Discover UI (tour construction needs no browser)."""
+
+import logging
+from collections import Counter
+
+import pytest
+from playwright.sync_api import Page
+
+from movie_db_qa.pages.discover_page import DiscoverPage
+from movie_db_qa.walker import DiscoverModel, ModelWalker, State, Transition, postman_tour
+
+logger = logging.getLogger(__name__)
+
+
+def _assert_walkable(tour: list[Transition], start: State) -> None:
+    assert tour[0].source == start and tour[-1].target == start
+    for previous, following in zip(tour, tour[1:], strict=False):
+        assert previous.target == following.source
+
+
+@pytest.mark.parametrize("pages", [1, 2, 3, 5])
+def test_tour_covers_every_transition_of_the_model(pages: int) -> None:
+    model = DiscoverModel(pages=pages)
+    transitions = model.transitions()
+    tour = postman_tour(transitions, model.initial)
+
+    _assert_walkable(tour, model.initial)
+    assert set(tour) == set(transitions)
+
+
+def test_balanced_model_needs_no_repeated_transitions() -> None:
+    # Pagination alone is symmetric: every state is left as often as it is entered
+    transitions = [t for t in DiscoverModel(["popular"], pages=4).transitions() if not t.action.startswith("select")]
+    tour = postman_tour(transitions, State("popular", 1))
+
+    _assert_walkable(tour, State("popular", 1))
+    assert Counter(tour) == Counter(transitions)
+
+
+def test_unbalanced_model_repeats_the_cheapest_paths() -> None:
+    # Two categories, two pages: both page-2 states are left once more than they are entered
+    # (select, previous and page:1 out; next and page:2 in), and page-1 states the reverse
+    model = DiscoverModel(["popular", "top"], pages=2)
+    transitions = model.transitions()
+    tour = postman_tour(transitions, model.initial)
+
+    _assert_walkable(tour, model.initial)
+    assert set(tour) == set(transitions)
+    # One extra step into each page-2 state (next from its page 1) balances the graph
+    assert len(tour) == len(transitions) + 2
+
+
+def test_unreachable_states_are_rejected() -> None:
+    one_way = [Transition(State("popular", 1), "next", State("popular", 2))]
+
+    with pytest.raises(ValueError, match="not strongly connected"):
+        postman_tour(one_way, State("popular", 1))
+
+
+def test_model_walk_of_the_filters_holds_invariants(page: Page) -> None:
+    """Every filter transition keeps the UI consistent, walked on one loaded page.
+
+    One page per category leaves out the pagination transitions known to be
+    broken (DEF-007: Next and page number clicks; DEF-003: filter lost after
+    pagination), so this walk is expected to pass.
+    """
+    model = DiscoverModel(pages=1)
+    report = ModelWalker(DiscoverPage(page), model).walk()
+    logger.info(report.summary())
+
+    assert {transition.action.partition(":")[0] for transition in model.transitions()} == {"select"}
+    assert report.covered == report.transitions
+    assert not report.failures, "\n".join(f"{step.transition}: {step.violations}" for step in report.failures)
+
+
+@pytest.mark.xfail(reason="DEF-007/DEF-003: pagination clicks and filter persistence are broken", strict=False)
+def test_model_walk_holds_invariants_on_one_page(page: Page) -> None:
+    """Every filter/pagination transition keeps the UI consistent, walked on one loaded page."""
+    report = ModelWalker(DiscoverPage(page), DiscoverModel(pages=3)).walk()
+    logger.info(report.summary())
+
+    assert report.covered == report.transitions
+    assert not report.failures, "\n".join(f"{step.transition}: {step.violations}" for step in report.failures)
@@ -0,0 +1,79 @@
+"""Unit tests for performance metric statistics and baselines (no browser required)."""
+
+from pathlib import Path
+
+import pytest
+
+from movie_db_qa.pages.waits import ActionTiming
+from movie_db_qa.utils.perf import (
+    PerfRecorder,
+    PerfSample,
+    compare,
+    load_samples,
+    percentile,
+    prune_history,
+    summarize,
+)
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    values = [40.0, 10.0, 30.0, 20.0]
+
+    assert percentile(values, 0) == 10.0
+    assert percentile(values, 50) == 25.0
+    assert percentile(values, 100) == 40.0
+    assert percentile([7.0], 95) == 7.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_history_round_trip_filters_by_run(tmp_path: Path) -> None:
+    history = tmp_path / "perf" / "history.jsonl"
+    for run_id in ("run-1", "run-2"):
+        recorder = PerfRecorder(run_id)
+        recorder.add("test_a", "paint.lcp", 100.0)
+        recorder.write(history)
+
+    samples = load_samples(history, "run-2")
+
+    assert [(sample.run_id, sample.metric, sample.value) for sample in samples] == [("run-2", "paint.lcp", 100.0)]
+    assert len(load_samples(history)) == 2
+    assert load_samples(tmp_path / "missing.jsonl") == []
+
+
+def test_timed_out_actions_are_not_recorded() -> None:
+    class BlankPage:
+        url = "about:blank"
+
+    recorder = PerfRecorder("run")
+    timings = [ActionTiming("select_trend_filter", "grid", 120.0), ActionTiming("click_next_page", "api", 5000.0, True)]
+
+    recorder.collect(BlankPage(), "test_a", timings)  # type: ignore[arg-type]
+
+    assert [(sample.metric, sample.value) for sample in recorder.samples] == [("action.select_trend_filter", 120.0)]
+
+
+def test_regressions_exceed_threshold_only() -> None:
+    samples = [PerfSample("run", 0.0, "t", "action.load", value) for value in (100.0, 110.0, 300.0)]
+    summary = summarize(samples)
+    baseline = {"action.load": {"n": 3, "p50": 100.0, "p95": 280.0}, "paint.lcp": {"p50": 1.0, "p95": 1.0}}
+
+    regressions = compare(summary, baseline, threshold=0.05)
+
+    assert [(regression.metric, regression.stat) for regression in regressions] == [("action.load", "p50")]
+    assert "+10%" in regressions[0].describe()
+    assert compare(summary, baseline, threshold=0.2) == []
+
+
+def test_history_keeps_only_the_latest_runs(tmp_path: Path) -> None:
+    history = tmp_path / "history.jsonl"
+    for run_id in ("run-1", "run-2", "run-3"):
+        recorder = PerfRecorder(run_id)
+        recorder.add("test_a", "paint.lcp", 100.0)
+        recorder.add("test_b", "paint.lcp", 120.0)
+        recorder.write(history)
+
+    assert prune_history(history, keep_runs=2) == 1
+    assert [sample.run_id for sample in load_samples(history)] == ["run-2", "run-2", "run-3", "run-3"]
+    assert prune_history(history, keep_runs=2) == 0
+    assert prune_history(history, keep_runs=0) == 0
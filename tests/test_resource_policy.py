@@ -0,0 +1,43 @@
+"""Unit tests for the resource-blocking policy (no browser required)."""
+
+import pytest
+
+from movie_db_qa.utils.config import TestConfig as FrameworkConfig
+from movie_db_qa.utils.resource_policy import ESTIMATED_BYTES, STUBS, ResourcePolicy, ResourceStats
+
+
+def test_policy_from_config_and_marker() -> None:
+    policy = ResourcePolicy.from_config(
+        FrameworkConfig(resource_block="font, media", resource_stub="image", resource_block_hosts="ads.example.com")
+    )
+    assert policy == ResourcePolicy(frozenset({"font", "media"}), frozenset({"image"}), frozenset({"ads.example.com"}))
+    assert not ResourcePolicy.from_config(FrameworkConfig()).active
+    # A bare marker allows everything; keywords accept sequences or comma-separated strings
+    assert not ResourcePolicy.from_marker().active
+    assert ResourcePolicy.from_marker(stub=("image",), hosts="a.io,b.io").hosts == {"a.io", "b.io"}
+    with pytest.raises(ValueError, match="Unknown resource types"):
+        ResourcePolicy.from_marker(block="images")
+
+
+def test_routes_and_actions() -> None:
+    policy = ResourcePolicy(block=frozenset({"font"}), stub=frozenset({"image"}), hosts=frozenset({"ads.example.com"}))
+    routes = policy.routes()
+
+    assert routes["**/*.{woff,woff2,ttf,otf,eot}*"] == "font"
+    assert routes["**://*.ads.example.com/**"] == "host"
+    assert "media" not in routes.values()
+    assert policy.action("image", "image") == "stub"
+    assert policy.action("font", "font") == "block"
+    # An image URL fetched by a script is not a page resource: let it through
+    assert policy.action("image", "fetch") is None
+    assert policy.action("host", "script") == "block"
+
+
+def test_stats_estimate_bytes_saved() -> None:
+    stats = ResourceStats()
+    stats.record("image", stubbed=True)
+    stats.record("image", stubbed=True)
+    stats.record("font", stubbed=False)
+
+    assert stats.bytes_saved == 2 * (ESTIMATED_BYTES["image"] - len(STUBS["image"][1])) + ESTIMATED_BYTES["font"]
+    assert stats.summary().startswith("Resource policy: 3 requests intercepted (font 1, image 2; 2 stubbed)")
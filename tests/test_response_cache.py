@@ -0,0 +1,55 @@
+"""Unit tests for the shared TMDB response cache (no browser required)."""
+
+from movie_db_qa.utils.response_cache import ResponseCache
+
+API = "https://api.themoviedb.org/3"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lookup_is_keyed_by_normalized_url() -> None:
+    cache = ResponseCache(max_bytes=1000, default_ttl=60)
+    cache.put(
+        f"{API}/movie/popular?page=1&api_key=secret", 200, {"Content-Type": "application/json", "Date": "x"}, b"{}"
+    )
+
+    entry = cache.get(f"{API}/movie/popular?api_key=other&page=1")
+    assert entry is not None and entry.headers == {"Content-Type": "application/json"}
+    assert cache.get(f"{API}/movie/popular?page=2") is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.bytes_served) == (1, 1, 2)
+
+
+def test_entries_expire_after_their_endpoint_ttl() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(max_bytes=1000, default_ttl=60, clock=clock)
+    cache.put(f"{API}/movie/popular?page=1", 200, {}, b"page")
+    cache.put(f"{API}/genre/movie/list", 200, {}, b"genres")
+
+    clock.now = 61
+    assert cache.get(f"{API}/movie/popular?page=1") is None
+    assert cache.get(f"{API}/genre/movie/list") is not None
+    assert (cache.stats.expired, len(cache), cache.size) == (1, 1, 6)
+
+
+def test_least_recently_used_entries_are_evicted_within_budget() -> None:
+    cache = ResponseCache(max_bytes=10, default_ttl=60)
+    for page in (1, 2, 3):
+        cache.put(f"{API}/movie/popular?page={page}", 200, {}, b"abcd")
+    assert cache.get(f"{API}/movie/popular?page=1") is None
+    assert cache.get(f"{API}/movie/popular?page=2") is not None
+
+    # Page 2 was just used, so page 3 is evicted next
+    cache.put(f"{API}/movie/top_rated?page=1", 200, {}, b"abcd")
+    assert cache.get(f"{API}/movie/popular?page=3") is None
+    assert cache.get(f"{API}/movie/popular?page=2") is not None
+    assert (cache.stats.evictions, cache.size) == (2, 8)
+    # A body larger than the whole budget is never cached
+    assert not cache.put(f"{API}/movie/upcoming?page=1", 200, {}, b"x" * 11)
@@ -0,0 +1,30 @@
+"""Unit tests for the background screenshot writer (no browser required)."""
+
+from pathlib import Path
+
+from movie_db_qa.utils.screenshots import ScreenshotWriter
+
+
+def test_unchanged_screenshots_are_not_rewritten(tmp_path: Path) -> None:
+    path = tmp_path / "shots" / "test_a_call.png"
+    writer = ScreenshotWriter()
+
+    writer.submit(path, b"image-1")
+    writer.submit(path, b"image-1")
+    writer.submit(path, b"image-2")
+    writer.close()
+
+    assert path.read_bytes() == b"image-2"
+    assert (writer.stats.written, writer.stats.unchanged, writer.stats.failed) == (2, 1, 0)
+    assert [p.name for p in path.parent.iterdir()] == ["test_a_call.png"]
+
+
+def test_write_errors_are_counted_not_raised(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    writer = ScreenshotWriter()
+
+    writer.submit(blocker / "shot.png", b"image")
+    writer.close()
+
+    assert writer.stats.failed == 1
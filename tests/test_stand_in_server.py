@@ -0,0 +1,98 @@
+"""Unit tests for the local stand-in server (no browser required)."""
+
+import functools
+import json
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from movie_db_qa.utils.cassette import CassetteEntry, CassetteStore
+from movie_db_qa.utils.stand_in_server import StandInServer, snapshot_spa
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> StandInServer:
+    spa_dir = tmp_path / "spa"
+    (spa_dir / "static").mkdir(parents=True)
+    (spa_dir / "index.html").write_text("<html>discover</html>", encoding="utf-8")
+    (spa_dir / "static" / "main.js").write_text("console.log('app')", encoding="utf-8")
+    CassetteStore(tmp_path / "cassettes").put(
+        CassetteEntry(
+            "GET",
+            "https://api.themoviedb.org/3/movie/popular?page=1",
+            200,
+            {"content-type": "application/json"},
+            '{"page":1,"results":[]}',
+        )
+    )
+    return StandInServer(spa_dir, tmp_path / "cassettes")
+
+
+def test_serves_assets_and_history_fallback(server: StandInServer) -> None:
+    with server:
+        assert urlopen(f"{server.url}/static/main.js").read() == b"console.log('app')"
+        assert urlopen(f"{server.url}/popular/2").read() == b"<html>discover</html>"
+
+
+def test_fake_api_answers_from_cassettes(server: StandInServer) -> None:
+    with server:
+        response = urlopen(f"{server.url}/3/movie/popular?api_key=abc&page=1")
+        assert response.headers["Access-Control-Allow-Origin"] == "*"
+        assert json.loads(response.read()) == {"page": 1, "results": []}
+
+        with pytest.raises(HTTPError) as excinfo:
+            urlopen(f"{server.url}/3/movie/popular?page=999")
+        assert excinfo.value.code == 404
+
+
+def test_missing_snapshot_fails_loudly(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="snapshot-spa"):
+        StandInServer(tmp_path / "missing", tmp_path).start()
+
+
+def test_snapshot_follows_chunks_and_stylesheet_references(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    (site / "static" / "js").mkdir(parents=True)
+    (site / "static" / "css").mkdir(parents=True)
+    (site / "static" / "media").mkdir(parents=True)
+    (site / "index.html").write_text(
+        '<html><link href="/static/css/main.css" rel="stylesheet"><script src="/static/js/main.js"></script></html>',
+        encoding="utf-8",
+    )
+    (site / "static" / "js" / "main.js").write_text(
+        'var logo="static/media/logo.svg";'
+        'function u(e){return "static/js/"+e+"."+{7:"ab12",9:"cd34"}[e]+".chunk.js"}'
+        'var gone="static/js/missing.js";',
+        encoding="utf-8",
+    )
+    (site / "static" / "js" / "7.ab12.chunk.js").write_text("chunk7", encoding="utf-8")
+    (site / "static" / "js" / "9.cd34.chunk.js").write_text("chunk9", encoding="utf-8")
+    (site / "static" / "css" / "main.css").write_text(
+        "@font-face{src:url(../media/font.woff2)} .x{background:url('data:image/gif;base64,AA==')}",
+        encoding="utf-8",
+    )
+    (site / "static" / "media" / "font.woff2").write_bytes(b"font")
+    (site / "static" / "media" / "logo.svg").write_text("<svg/>", encoding="utf-8")
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(SimpleHTTPRequestHandler, directory=str(site)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        written = snapshot_spa(f"http://127.0.0.1:{httpd.server_address[1]}", tmp_path / "snapshot")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert sorted(path.relative_to(tmp_path / "snapshot").as_posix() for path in written) == [
+        "index.html",
+        "static/css/main.css",
+        "static/js/7.ab12.chunk.js",
+        "static/js/9.cd34.chunk.js",
+        "static/js/main.js",
+        "static/media/font.woff2",
+        "static/media/logo.svg",
+    ]
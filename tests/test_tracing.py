@@ -0,0 +1,83 @@
+"""Unit tests for failure-only tracing (no browser required)."""
+
+from pathlib import Path
+from typing import Any
+
+from movie_db_qa.utils.tracing import TraceRecorder, TraceStats
+
+
+class FakeTracing:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    def start(self, **options: Any) -> None:
+        self.calls.append(("start", options))
+
+    def start_chunk(self, title: str) -> None:
+        self.calls.append(("start_chunk", title))
+
+    def stop_chunk(self, path: Path | None = None) -> None:
+        self.calls.append(("stop_chunk", path))
+        if path is not None:
+            path.write_bytes(b"PK")
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.tracing = FakeTracing()
+
+
+def test_tracing_starts_once_and_keeps_only_failures(tmp_path: Path) -> None:
+    recorder = TraceRecorder(screenshots=True, snapshots=False)
+    context: Any = FakeContext()
+    trace = tmp_path / "traces" / "test_fail_call.trace.zip"
+
+    recorder.begin(context, "test_pass")
+    assert recorder.end(context, None) is None
+    recorder.begin(context, "test_fail")
+    assert recorder.end(context, trace) == trace
+
+    assert context.tracing.calls == [
+        ("start", {"screenshots": True, "snapshots": False}),
+        ("start_chunk", "test_pass"),
+        ("stop_chunk", None),
+        ("start_chunk", "test_fail"),
+        ("stop_chunk", trace),
+    ]
+    assert trace.read_bytes() == b"PK"
+    assert (recorder.stats.kept, recorder.stats.discarded) == (1, 1)
+    assert recorder.stats.traced_tests == 2
+
+
+def test_baseline_tests_run_untraced() -> None:
+    recorder = TraceRecorder(baseline_sample=0.5, run_id="run1")
+    context: Any = FakeContext()
+    titles = [f"test_{index}" for index in range(200)]
+
+    baseline = [title for title in titles if recorder.in_baseline(title)]
+    recorder.begin(context, baseline[0], traced=False)
+    assert recorder.end(context, None) is None
+
+    assert 60 < len(baseline) < 140
+    same_run = TraceRecorder(baseline_sample=0.5, run_id="run1")
+    assert baseline == [title for title in titles if same_run.in_baseline(title)]
+    assert not any(TraceRecorder(baseline_sample=0.0).in_baseline(title) for title in titles)
+    assert context.tracing.calls == []
+    assert (recorder.stats.baseline_tests, recorder.stats.traced_tests) == (1, 0)
+
+
+def _stats(baseline_tests: int = 0, baseline_seconds: float = 0.0) -> TraceStats:
+    return TraceStats(1, 9, 1.0, 10, 10.0, baseline_tests, baseline_seconds)
+
+
+def test_overhead_is_estimated_against_the_untraced_baseline() -> None:
+    assert _stats().overhead_ratio is None
+    assert "overhead not estimated" in _stats().summary(budget=0.05)
+
+    stats = _stats(baseline_tests=4, baseline_seconds=4.0)
+
+    # Traced tests take 1.1 s on average (chunk start/stop included) vs 1.0 s untraced
+    assert round(stats.overhead_ratio or 0.0, 3) == 0.1
+    assert "estimated overhead +10.0%" in stats.summary()
+    assert "over the 5% budget" in stats.summary(budget=0.05)
+    assert "budget" not in stats.summary(budget=0.2)
@@ -0,0 +1,91 @@
+"""Tests for the batched UI state record and its change observer.
+
+``test_ui_state_from_raw`` needs no browser; the transition tests drive a
+minimal routed page (no network), so they only need Chromium.
+"""
+
+import pytest
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from movie_db_qa.pages.async_discover_page import AsyncDiscoverPage
+from movie_db_qa.pages.discover_page import DiscoverPage
+from movie_db_qa.pages.ui_state import UIState
+
+# Stand-in origin served by a route, so pushState works without a server
+ORIGIN = "http://ui-state.test"
+
+# Filter list whose Trend click re-renders after a delay, plus a URL-only page switch
+APP = """<html><body>
+<ul><li class="text-white">Popular</li><li id="trend">Trend</li></ul>
+<div class="grid"><div>Dune</div></div>
+<script>
+document.getElementById('trend').addEventListener('click', () => setTimeout(() => {
+    history.pushState({}, '', '/trend');
+    document.querySelectorAll('li').forEach(li => { li.className = li.id === 'trend' ? 'text-white' : ''; });
+}, 100));
+window.goToPage = page => setTimeout(() => history.pushState({}, '', '/trend/' + page), 100);
+</script>
+</body></html>"""
+
+# True while the page's history methods are the browser's own
+NATIVE_HISTORY_JS = "['pushState', 'replaceState'].every(name => history[name].toString().includes('[native code]'))"
+
+
+def test_ui_state_from_raw() -> None:
+    state = UIState.from_raw(
+        {
+            "active_filters": ["Trend"],
+            "current_page": 2,
+            "page_numbers": [1, 2, 3],
+            "has_previous": True,
+            "has_next": True,
+            "error_visible": False,
+            "version": 7,
+            "time_origin": 1728000000000.5,
+        }
+    )
+
+    assert state.is_active("Trend")
+    assert not state.is_active("Popular")
+    assert state.current_page == 2
+    assert state.page_numbers == (1, 2, 3)
+    assert state.version == 7
+
+
+def test_wait_for_ui_change_follows_filter_and_url_transitions(page: Page) -> None:
+    page.route(f"{ORIGIN}/**", lambda route: route.fulfill(body=APP, content_type="text/html"))
+    page.goto(f"{ORIGIN}/popular")
+    discover = DiscoverPage(page)
+    before = discover.ui_state()
+
+    page.click("#trend")
+    after = discover.wait_for_ui_change(before, lambda state: state.is_active("Trend"), timeout=5000)
+
+    assert after.active_filters == ("Trend",)
+    assert after.version > before.version
+
+    # A URL change without any DOM mutation is a transition too
+    page.evaluate("goToPage(2)")
+    paged = discover.wait_for_ui_change(after, lambda state: state.current_page == 2, timeout=5000)
+
+    assert paged.active_filters == ("Trend",)
+    assert page.evaluate(NATIVE_HISTORY_JS)
+    with pytest.raises(PlaywrightTimeoutError):
+        discover.wait_for_ui_change(paged, timeout=500)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_async_wait_for_ui_change_follows_filter_transition(async_context: AsyncBrowserContext) -> None:
+    page = await async_context.new_page()
+    await page.route(f"{ORIGIN}/**", lambda route: route.fulfill(body=APP, content_type="text/html"))
+    await page.goto(f"{ORIGIN}/popular")
+    discover = AsyncDiscoverPage(page)
+    before = await discover.ui_state()
+
+    await page.click("#trend")
+    after = await discover.wait_for_ui_change(before, lambda state: state.is_active("Trend"), timeout=5000)
+
+    assert (after.active_filters, after.current_page) == (("Trend",), 1)
+    assert await page.evaluate(NATIVE_HISTORY_JS)
@@ -0,0 +1,30 @@
+"""Unit tests for page action wait conditions (no browser required)."""
+
+from movie_db_qa.pages.discover_page import category_conditions
+from movie_db_qa.pages.waits import ApiResponse, GridReady
+
+
+def test_api_response_matches_host_path_and_page() -> None:
+    condition = ApiResponse("api.themoviedb.org", path="/movie/popular", page_number=2)
+
+    assert condition.matches("https://api.themoviedb.org/3/movie/popular?api_key=x&page=2")
+    assert not condition.matches("https://api.themoviedb.org/3/movie/popular?api_key=x&page=20")
+    assert not condition.matches("https://api.themoviedb.org/3/movie/top_rated?page=2")
+    assert not condition.matches("https://image.tmdb.org/t/p/w500/movie/popular?page=2")
+
+
+def test_api_response_without_filters_matches_any_api_call() -> None:
+    condition = ApiResponse("api.themoviedb.org")
+
+    assert condition.matches("https://api.themoviedb.org/3/genre/movie/list")
+    assert condition.describe() == "api response *"
+
+
+def test_category_click_waits_for_a_fetch_unless_on_its_first_page() -> None:
+    base = "https://tmdb-discover.surge.sh"
+
+    assert [type(c) for c in category_conditions(f"{base}/popular", "popular")] == [GridReady]
+    # The filter links to page 1, so clicking it from a later page of the same category refetches
+    from_page_2 = category_conditions(f"{base}/popular/2", "popular")
+    assert any(isinstance(condition, ApiResponse) for condition in from_page_2)
+    assert any(isinstance(condition, ApiResponse) for condition in category_conditions(f"{base}/trend", "popular"))
@@ -0,0 +1,34 @@
+"""Unit tests for the warm-start cache (no browser required)."""
+
+from pathlib import Path
+
+from movie_db_qa.utils.cassette import CassetteEntry
+from movie_db_qa.utils.warm_start import WarmStartCache, bundle_hash
+
+INDEX = '<html><head><script src="/static/js/main.{}.js"></script><link href="/static/css/main.css"></head></html>'
+
+
+def test_bundle_hash_tracks_asset_references() -> None:
+    assert bundle_hash(INDEX.format("a1")) == bundle_hash(INDEX.format("a1").replace("<html>", "<html lang=en>"))
+    assert bundle_hash(INDEX.format("a1")) != bundle_hash(INDEX.format("b2"))
+    # No asset references: fall back to the document itself
+    assert bundle_hash("<p>one</p>") != bundle_hash("<p>two</p>")
+
+
+def test_bundle_change_discards_cache(tmp_path: Path) -> None:
+    cache = WarmStartCache(tmp_path / "warm")
+    url = "https://tmdb-discover.surge.sh/static/js/main.a1.js"
+
+    assert not cache.validate("a1")
+    cache.responses.put(CassetteEntry("GET", url, 200, {"content-type": "text/javascript"}, "app()"))
+    cache.storage_state_path.write_text('{"cookies": [], "origins": []}', encoding="utf-8")
+
+    assert cache.validate("a1")
+    assert cache.seeded
+    assert cache.context_options() == {"storage_state": str(cache.storage_state_path)}
+    assert cache.responses.get("GET", url) is not None
+
+    assert not cache.validate("b2")
+    assert not cache.storage_state_path.exists()
+    assert cache.context_options() == {}
+    assert cache.responses.get("GET", url) is None
@@ -0,0 +1,43 @@
+"""Unit tests for watch mode change detection (no browser required)."""
+
+from pathlib import Path
+
+from movie_db_qa.impact import CallMap
+from movie_db_qa.watch import affected_tests, changed_lines, snapshot
+
+PAGE = """class DiscoverPage:
+    def select_category(self, slug):
+        return slug
+
+    def get_results_count(self):
+        return 20
+"""
+
+PAGE_PATH = "src/movie_db_qa/pages/discover_page.py"
+
+
+def test_changed_lines_reports_new_side_lines() -> None:
+    assert changed_lines(PAGE, PAGE.replace("return 20", "return 21")) == {6}
+    assert changed_lines(PAGE, PAGE.replace("        return slug\n", "")) == {3}
+    assert changed_lines(PAGE, PAGE) == set()
+
+
+def test_affected_tests_uses_call_map(tmp_path: Path) -> None:
+    for relative, text in {PAGE_PATH: PAGE, "tests/test_demo.py": "", "rubric/requirements.yml": ""}.items():
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_text(text, encoding="utf-8")
+    changes = {PAGE_PATH: {6}}
+
+    assert affected_tests(tmp_path, changes) is None  # no call map yet
+
+    CallMap(
+        {
+            "tests/test_demo.py::test_count": {f"{PAGE_PATH}::DiscoverPage.get_results_count"},
+            "tests/test_demo.py::test_filter": {f"{PAGE_PATH}::DiscoverPage.select_category"},
+            "tests/test_gone.py::test_old": {f"{PAGE_PATH}::DiscoverPage.get_results_count"},
+        },
+        recorded_at=1.0,
+    ).save(tmp_path / "artifacts/impact/call-map.json")
+
+    assert affected_tests(tmp_path, changes) == ["tests/test_demo.py::test_count"]
+    assert list(snapshot(tmp_path, ("src/movie_db_qa/pages",))) == [PAGE_PATH]
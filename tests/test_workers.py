@@ -0,0 +1,42 @@
+"""Unit tests for xdist worker artifact helpers (no browser required)."""
+
+from pathlib import Path
+
+import pytest
+
+from movie_db_qa.utils.workers import merge_worker_artifacts, merge_worker_logs, worker_artifact_dir, worker_log_file
+
+
+def test_paths_are_namespaced_per_worker(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert worker_log_file(tmp_path).name == "test_execution.log"
+    assert worker_artifact_dir(tmp_path) == tmp_path
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert worker_log_file(tmp_path).name == "test_execution.gw3.log"
+    assert worker_artifact_dir(tmp_path) == tmp_path / "gw3"
+
+
+def test_merge_worker_logs_interleaves_records(tmp_path: Path) -> None:
+    (tmp_path / "test_execution.gw0.log").write_text(
+        "2025-10-05 09:00:01 - a - INFO - first\n2025-10-05 09:00:03 - a - ERROR - third\nTraceback line\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "test_execution.gw1.log").write_text("2025-10-05 09:00:02 - b - INFO - second\n", encoding="utf-8")
+
+    merged = merge_worker_logs(tmp_path)
+
+    assert merged == tmp_path / "test_execution.log"
+    lines = merged.read_text(encoding="utf-8").splitlines()
+    assert [line.rsplit(" - ", 1)[-1] for line in lines] == ["first", "second", "third", "Traceback line"]
+    assert not list(tmp_path.glob("*.gw*.log"))
+
+
+def test_merge_worker_artifacts_flattens(tmp_path: Path) -> None:
+    (tmp_path / "gw0").mkdir()
+    (tmp_path / "gw0" / "test_a_call.png").write_bytes(b"a")
+    (tmp_path / "gw1").mkdir()
+    (tmp_path / "gw1" / "test_b_call.png").write_bytes(b"b")
+
+    assert merge_worker_artifacts(tmp_path) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["test_a_call.png", "test_b_call.png"]